@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pytest fixtures for the SpatioTemporal Open Research Manager client benchmarks."""
+
+import pytest
+
+from storm_client.models.compendium import CompendiumDraft
+from storm_client.models.project import Project
+from storm_client.testing import StormMockServer
+
+
+@pytest.fixture()
+def server():
+    """Storm WS stand-in server."""
+    return StormMockServer()
+
+
+@pytest.fixture()
+def service(server):
+    """Storm client connected to the stand-in server."""
+    with server.client() as service:
+        yield service
+
+
+@pytest.fixture()
+def project(service):
+    """Research Project created in the stand-in server."""
+    return service.project.create(Project(id="benchmark-project"))
+
+
+@pytest.fixture()
+def compendium_context(service, project):
+    """Compendium context of the benchmark project."""
+    return service.project(project).compendium
+
+
+@pytest.fixture()
+def draft(compendium_context):
+    """Compendium Draft created in the stand-in server."""
+    return compendium_context.draft.create(
+        CompendiumDraft(metadata={"title": "Benchmark compendium"})
+    )
+
+
+@pytest.fixture()
+def data_files(tmp_path):
+    """Local data files (``filename -> path``) used in the transfer benchmarks."""
+
+    def _create(count, size):
+        files = {}
+        for idx in range(count):
+            file_path = tmp_path / f"file-{idx}.bin"
+            file_path.write_bytes(bytes([idx % 256]) * size)
+
+            files[file_path.name] = str(file_path)
+        return files
+
+    return _create
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks for the compendium file transfers and checksums."""
+
+import pytest
+
+from storm_client.hashing import file_checksum, files_checksum
+from storm_client.models.compendium import CompendiumDraft
+from storm_client.models.project import Project
+from storm_client.testing import StormMockServer
+
+
+@pytest.mark.benchmark(group="transfer")
+def test_upload_files(benchmark, compendium_context, data_files):
+    files = data_files(32, 256 * 1024)
+
+    def _setup():
+        draft = compendium_context.draft.create(CompendiumDraft())
+        return (draft,), {}
+
+    def _upload(draft):
+        return compendium_context.files.upload_files(
+            draft, files, define_files=True, commit_files=True
+        )
+
+    benchmark.pedantic(_upload, setup=_setup, rounds=5)
+
+
+@pytest.mark.benchmark(group="small-files")
+@pytest.mark.parametrize("bundle_threshold", [None, 64 * 1024], ids=["files", "bundle"])
+def test_upload_small_files(
+    benchmark, compendium_context, data_files, bundle_threshold
+):
+    files = data_files(500, 1024)
+
+    def _setup():
+        draft = compendium_context.draft.create(CompendiumDraft())
+        return (draft,), {}
+
+    def _upload(draft):
+        return compendium_context.files.upload_files(
+            draft,
+            files,
+            define_files=True,
+            commit_files=True,
+            bundle_threshold=bundle_threshold,
+        )
+
+    benchmark.pedantic(_upload, setup=_setup, rounds=5)
+
+
+@pytest.mark.benchmark(group="transfer")
+def test_download_files(benchmark, compendium_context, draft, data_files, tmp_path):
+    files = data_files(32, 256 * 1024)
+    draft = compendium_context.files.upload_files(
+        draft, files, define_files=True, commit_files=True
+    )
+
+    benchmark.pedantic(
+        compendium_context.files.download_files,
+        args=(draft, tmp_path / "download"),
+        kwargs={"validate_checksum": True},
+        rounds=5,
+    )
+
+
+@pytest.mark.benchmark(group="commit")
+@pytest.mark.parametrize("max_workers", [1, 16])
+def test_commit_defined_files(benchmark, data_files, max_workers):
+    # the latency of the Storm WS makes the concurrent commits worthwhile.
+    server = StormMockServer(latency=0.005)
+    files = data_files(64, 1024)
+
+    with server.client() as service:
+        compendium_context = service.project(
+            service.project.create(Project(id="benchmark-project"))
+        ).compendium
+
+        def _setup():
+            draft = compendium_context.draft.create(CompendiumDraft())
+            draft = compendium_context.files.upload_files(
+                draft, files, define_files=True
+            )
+            return (draft,), {}
+
+        def _commit(draft):
+            return compendium_context.files.commit_defined_files(
+                draft, list(files), max_workers=max_workers
+            )
+
+        benchmark.pedantic(_commit, setup=_setup, rounds=3)
+
+
+@pytest.mark.benchmark(group="checksum")
+def test_file_checksum(benchmark, data_files):
+    (file_path,) = data_files(1, 32 * 1024 * 1024).values()
+    benchmark(file_checksum, file_path)
+
+
+@pytest.mark.benchmark(group="checksum")
+def test_files_checksum(benchmark, data_files):
+    files = data_files(32, 1024 * 1024)
+    benchmark(files_checksum, files.values())
+
+
+@pytest.mark.benchmark(group="large-file")
+@pytest.mark.parametrize("memory_map", [False, True], ids=["read", "mmap"])
+def test_upload_large_file(benchmark, compendium_context, data_files, memory_map):
+    files = data_files(1, 64 * 1024 * 1024)
+
+    def _setup():
+        draft = compendium_context.draft.create(CompendiumDraft())
+        return (draft,), {}
+
+    def _upload(draft):
+        return compendium_context.files.upload_files(
+            draft, files, define_files=True, commit_files=True, memory_map=memory_map
+        )
+
+    benchmark.pedantic(_upload, setup=_setup, rounds=5)
+
+
+@pytest.mark.benchmark(group="large-file")
+@pytest.mark.parametrize("segments", [1, 8], ids=["single", "segmented"])
+def test_download_large_file(
+    benchmark, compendium_context, draft, data_files, tmp_path, segments
+):
+    files = data_files(1, 64 * 1024 * 1024)
+    draft = compendium_context.files.upload_files(
+        draft, files, define_files=True, commit_files=True
+    )
+
+    benchmark.pedantic(
+        compendium_context.files.download_files,
+        args=(draft, tmp_path / "download"),
+        kwargs={"validate_checksum": True, "segments": segments},
+        rounds=5,
+    )
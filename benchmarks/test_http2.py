@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks for HTTP/1.1 (connection pool) vs HTTP/2 (multiplexing).
+
+The stand-in server doesn't use real connections, so these benchmarks
+run against a Storm WS deployment defined by the environment variables:
+
+  - ``STORM_BENCHMARK_URL``: Storm WS URL;
+  - ``STORM_BENCHMARK_TOKEN``: Access token;
+  - ``STORM_BENCHMARK_PROJECT``: Project where the records are created.
+"""
+
+import os
+
+import pytest
+
+from storm_client import Storm
+from storm_client.concurrency import map_concurrently
+from storm_client.models.compendium import CompendiumDraft
+
+STORM_URL = os.environ.get("STORM_BENCHMARK_URL")
+STORM_TOKEN = os.environ.get("STORM_BENCHMARK_TOKEN")
+STORM_PROJECT = os.environ.get("STORM_BENCHMARK_PROJECT")
+
+pytestmark = [
+    pytest.mark.skipif(
+        not (STORM_URL and STORM_TOKEN and STORM_PROJECT),
+        reason="The Storm WS deployment is not defined.",
+    ),
+    pytest.mark.parametrize("http2", [False, True], ids=["http1.1", "http2"]),
+]
+
+CONCURRENCY = 16
+"""Number of requests in flight."""
+
+
+@pytest.fixture()
+def storm_service(http2):
+    """Storm client connected to the Storm WS deployment."""
+    if http2:
+        pytest.importorskip("h2")
+
+    with Storm(STORM_URL, STORM_TOKEN, http2=http2, timeout=60) as service:
+        yield service
+
+
+@pytest.mark.benchmark(group="http2-get")
+def test_parallel_get(benchmark, storm_service):
+    """Many small concurrent requests (``get``) to the same host."""
+    project_service = storm_service.project
+
+    def _get_many():
+        return list(
+            map_concurrently(
+                lambda _: project_service.get(STORM_PROJECT), range(128), CONCURRENCY
+            )
+        )
+
+    benchmark.pedantic(_get_many, rounds=5, warmup_rounds=1)
+
+
+@pytest.mark.benchmark(group="http2-commit")
+def test_parallel_commit(benchmark, storm_service, tmp_path):
+    """Concurrent commit of the defined files (``commit_defined_files``).
+
+    Note:
+        Each round creates a Compendium Draft in the benchmark project.
+    """
+    compendium_context = storm_service.project(STORM_PROJECT).compendium
+
+    files = {}
+    for idx in range(64):
+        file_path = tmp_path / f"file-{idx}.txt"
+        file_path.write_text(f"file {idx}")
+
+        files[file_path.name] = str(file_path)
+
+    def _setup():
+        # each round commits a new set of uploaded files.
+        draft = compendium_context.draft.create(
+            CompendiumDraft(metadata={"title": "HTTP/2 benchmark"})
+        )
+        compendium = compendium_context.files.upload_files(
+            draft, files, define_files=True
+        )
+        return (compendium,), {}
+
+    def _commit(compendium):
+        return compendium_context.files.commit_defined_files(
+            compendium, list(files), max_workers=CONCURRENCY
+        )
+
+    benchmark.pedantic(_commit, setup=_setup, rounds=3)
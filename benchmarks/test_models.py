@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks for the data models (fields, collections and serialization)."""
+
+import pytest
+import simplejson
+
+from storm_client.models.compendium import (
+    CompendiumDraft,
+    CompendiumFiles,
+    CompendiumRecordList,
+)
+from storm_client.models.execution.model import ExecutionJobList
+from storm_client.models.project import Project
+from storm_client.models.workflow import Workflow
+
+
+def _search_result(count, factory):
+    """Create a search result (``hits.hits``) document."""
+    return {"hits": {"hits": [factory(idx) for idx in range(count)], "total": count}}
+
+
+@pytest.mark.benchmark(group="fields")
+def test_dict_field_get(benchmark):
+    project = Project(id="project", metadata={"title": "Project"})
+    benchmark(lambda: project.title)
+
+
+@pytest.mark.benchmark(group="fields")
+def test_dict_field_set(benchmark):
+    project = Project(id="project", metadata={"title": "Project"})
+
+    def _set():
+        project.title = "New title"
+
+    benchmark(_set)
+
+
+@pytest.mark.benchmark(group="collections")
+def test_execution_job_list(benchmark):
+    document = _search_result(
+        1000, lambda idx: {"id": f"job-{idx}", "status": "running", "links": {}}
+    )
+    benchmark(ExecutionJobList, document)
+
+
+@pytest.mark.benchmark(group="collections")
+def test_compendium_record_list(benchmark):
+    document = _search_result(
+        1000,
+        lambda idx: {
+            "id": f"compendium-{idx}",
+            "is_published": bool(idx % 2),
+            "metadata": {"title": f"Compendium {idx}"},
+        },
+    )
+    benchmark(CompendiumRecordList, document)
+
+
+@pytest.mark.benchmark(group="serialization")
+def test_compendium_for_json(benchmark):
+    compendium = CompendiumDraft(metadata={"title": "Large compendium"})
+
+    compendium.inputs.extend([f"inputs/file-{idx}.csv" for idx in range(5000)])
+    compendium.outputs.extend([f"outputs/file-{idx}.csv" for idx in range(5000)])
+
+    benchmark(lambda: simplejson.dumps(compendium, for_json=True))
+
+
+@pytest.mark.benchmark(group="workflow")
+def test_workflow_diff(benchmark):
+    nodes = {f"compendium-{idx}": {} for idx in range(5000)}
+    workflow = Workflow(id="workflow", graph={"nodes": nodes})
+
+    # removing a block of nodes and adding new ones.
+    del workflow.compendia[1000:1500]
+    workflow.compendia.extend([f"new-compendium-{idx}" for idx in range(500)])
+
+    benchmark(workflow.diff)
+
+
+@pytest.mark.benchmark(group="columns")
+def test_job_list_status_loop(benchmark):
+    jobs = ExecutionJobList(
+        _search_result(100_000, lambda idx: {"id": f"job-{idx}", "status": "running"})
+    )
+    benchmark(lambda: [job.status for job in jobs])
+
+
+@pytest.mark.benchmark(group="columns")
+def test_job_list_to_columns(benchmark):
+    jobs = ExecutionJobList(
+        _search_result(100_000, lambda idx: {"id": f"job-{idx}", "status": "running"})
+    )
+    benchmark(jobs.to_columns, ["id", "status"])
+
+
+@pytest.mark.benchmark(group="fields")
+def test_file_entries_navigation(benchmark):
+    files = CompendiumFiles(
+        {
+            "entries": [
+                {"key": f"file-{idx}.csv", "size": idx, "links": {}}
+                for idx in range(1000)
+            ]
+        }
+    )
+    benchmark(lambda: sum(entry.size for entry in files.entries))
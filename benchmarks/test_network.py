@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Benchmarks for the request handling (``HTTPXClient`` and services)."""
+
+import pytest
+
+from storm_client.models.project import Project
+
+
+@pytest.mark.benchmark(group="request")
+def test_client_request(benchmark, service, server):
+    """Round-trip overhead of ``HTTPXClient.request``."""
+    client = service._client
+    benchmark(client.request, "GET", server.url)
+
+
+@pytest.mark.benchmark(group="request")
+def test_service_get(benchmark, service, project):
+    """Round-trip overhead of a service operation (request and model creation)."""
+    benchmark(service.project.get, project.id)
+
+
+@pytest.mark.benchmark(group="request")
+def test_service_bulk_create(benchmark, service, server):
+    """Bulk creation of records (``create_many``) with server latency."""
+    server.latency = 0.001
+
+    def _create_many():
+        projects = (Project(id=None, metadata={"title": "Bulk"}) for _ in range(50))
+        return list(service.project.create_many(projects, max_workers=8))
+
+    benchmark.pedantic(_create_many, rounds=5)
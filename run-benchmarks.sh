@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+# The results are saved (by version) in ``.benchmarks``, and compared with
+# the previous saved run (requires ``pytest-benchmark``). To compare
+# releases, use:
+#   pytest-benchmark --storage .benchmarks compare --group-by=name
+VERSION=$(python -c "from storm_client.version import __version__; print(__version__)")
+
+pytest benchmarks -p no:cacheprovider --no-cov --benchmark-only \
+    --benchmark-storage=.benchmarks \
+    --benchmark-save="v${VERSION}" \
+    --benchmark-compare \
+    --benchmark-columns=min,mean,median,max,ops,rounds \
+    "$@"
@@ -7,8 +7,15 @@
 
 """SpatioTemporal Open Research Manager."""
 
-from .storm import Storm
 from .version import __version__
 
-
 __all__ = ("Storm", "__version__")
+
+
+def __getattr__(name):
+    """Import the client only when it is used (``import storm_client`` is cheap)."""
+    if name == "Storm":
+        from .storm import Storm
+
+        return Storm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,8 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from ..network import HTTPXClient
+
 
 class BaseServiceContextAccessor:
     """Service context accessor base class.
@@ -21,11 +23,14 @@ class BaseServiceContextAccessor:
     the accessor.
     """
 
-    def __init__(self, url: str):
+    def __init__(self, url: str, client: HTTPXClient):
         """Initializer.
 
         Args:
             url (str): Base URL of the service endpoint that define the
             context accessor.
+
+            client (HTTPXClient): Client used to access the Storm WS.
         """
         self._url = url
+        self._client = client
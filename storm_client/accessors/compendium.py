@@ -5,6 +5,8 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from functools import cached_property
+
 from .base import BaseServiceContextAccessor
 from ..services.compendium import (
     CompendiumRecordService,
@@ -17,25 +19,25 @@ from ..services.compendium import (
 class CompendiumContextAccessor(BaseServiceContextAccessor):
     """Compendium context accessor."""
 
-    def __init__(self, url):
-        super(CompendiumContextAccessor, self).__init__(url)
+    def __init__(self, url, client):
+        super(CompendiumContextAccessor, self).__init__(url, client)
 
-    @property
+    @cached_property
     def draft(self):
         """Compendium draft service."""
-        return CompendiumDraftService(self._url)
+        return CompendiumDraftService(self._url, self._client)
 
-    @property
+    @cached_property
     def record(self):
         """Compendium record service."""
-        return CompendiumRecordService(self._url)
+        return CompendiumRecordService(self._url, self._client)
 
-    @property
+    @cached_property
     def files(self):
         """Compendium file service."""
-        return CompendiumFileService(self._url)
+        return CompendiumFileService(self._url, self._client)
 
-    @property
+    @cached_property
     def search(self):
         """Compendium search service."""
-        return CompendiumSearchService(self._url)
+        return CompendiumSearchService(self._url, self._client)
@@ -5,6 +5,8 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from functools import cached_property
+
 from .base import BaseServiceContextAccessor
 from .compendium import CompendiumContextAccessor
 
@@ -16,25 +18,25 @@ from ..services.workflow import WorkflowService
 class ProjectContextAccessor(BaseServiceContextAccessor):
     """Research Project context accessor."""
 
-    def __init__(self, url):
-        super(ProjectContextAccessor, self).__init__(url)
+    def __init__(self, url, client):
+        super(ProjectContextAccessor, self).__init__(url, client)
 
-    @property
+    @cached_property
     def compendium(self):
         """Compendium context accessor."""
-        return CompendiumContextAccessor(self._url)
+        return CompendiumContextAccessor(self._url, self._client)
 
-    @property
+    @cached_property
     def workflow(self):
         """Pipeline context accessor."""
-        return WorkflowService(self._url)
+        return WorkflowService(self._url, self._client)
 
-    @property
+    @cached_property
     def deposit(self):
         """Deposit context accessor."""
-        return DepositJobService(self._url)
+        return DepositJobService(self._url, self._client)
 
-    @property
+    @cached_property
     def execution(self):
         """Execution context accessor."""
-        return ExecutionService(self._url)
+        return ExecutionService(self._url, self._client)
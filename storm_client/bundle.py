@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager file bundles.
+
+Many small files can be uploaded as a single (uncompressed) ``tar``
+archive, the bundle, avoiding the define/upload/commit requests of
+each file. The archive is generated while it is uploaded (it is not
+staged on disk) and an index manifest, with the position (offset and
+size) and the checksum of each member, is uploaded with the bundle
+(``<bundle name>.index.json``).
+
+With the index, the members are read from the bundle using HTTP range
+requests, so a few files can be extracted without downloading the
+complete bundle.
+"""
+
+import hashlib
+import os
+import re
+import tarfile
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Tuple
+
+from .hashing import CHECKSUM_ALGORITHM
+
+if TYPE_CHECKING:
+    from .network import HTTPXClient
+
+BUNDLE_NAME = "bundle.tar"
+"""Name of the first bundle in the Compendia (the next are ``bundle-<n>.tar``)."""
+
+INDEX_SUFFIX = ".index.json"
+"""Suffix of the bundle index name (e.g., ``bundle.tar.index.json``)."""
+
+_NUL = b"\0"
+
+
+_BUNDLE_NAME_PATTERN = re.compile(r"bundle(?:-(\d+))?\.tar")
+
+
+def index_name(bundle_name: str) -> str:
+    """Name of the index of a bundle."""
+    return bundle_name + INDEX_SUFFIX
+
+
+def bundle_names(filenames: Iterable[str]) -> List[str]:
+    """Names of the bundles (files with an index) in a Compendium.
+
+    Args:
+        filenames (Iterable[str]): Filenames of the Compendium.
+
+    Returns:
+        List[str]: Bundle names, in the upload order (``bundle.tar``,
+                   ``bundle-1.tar``, ...). Bundles with other names are
+                   listed at the end.
+    """
+    filenames = set(filenames)
+
+    def _order(name):
+        match = _BUNDLE_NAME_PATTERN.fullmatch(name)
+        if match:
+            return 0, int(match.group(1) or 0), name
+        return 1, 0, name
+
+    return sorted(
+        [name for name in filenames if index_name(name) in filenames], key=_order
+    )
+
+
+def unique_bundle_name(filenames: Iterable[str]) -> str:
+    """First bundle name (``bundle.tar``, ``bundle-1.tar``, ...) not used in a
+    Compendium (``filenames``)."""
+    filenames = set(filenames)
+
+    name, number = BUNDLE_NAME, 0
+    while name in filenames or index_name(name) in filenames:
+        number += 1
+        name = f"bundle-{number}.tar"
+    return name
+
+
+class TarBundle:
+    """Tar archive of local files, generated while it is read.
+
+    The archive layout (and size) is defined by the file sizes, so the
+    ``Content-Length`` of the upload is known in advance. Each iteration
+    generates the archive again, so a throttled upload can be retried.
+    """
+
+    def __init__(self, files: Dict[str, str], chunk_size: int = 1024 * 1024):
+        """Initializer.
+
+        Args:
+            files (dict): Dictionary with the member name (filename in the Compendium)
+                          as key and the local file path as value.
+
+            chunk_size (int): Size (in bytes) of the chunks generated by the archive.
+        """
+        self.chunk_size = chunk_size
+        self.checksums = {}
+
+        # (name, path, header, size, data offset)
+        self._members = []
+
+        offset = 0
+        for name, file_path in files.items():
+            stat = os.stat(file_path)
+
+            member = tarfile.TarInfo(name)
+            member.size = stat.st_size
+            member.mtime = int(stat.st_mtime)
+            member.mode = 0o644
+
+            header = member.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+            self._members.append(
+                (name, file_path, header, stat.st_size, offset + len(header))
+            )
+
+            offset += len(header) + stat.st_size + (-stat.st_size % tarfile.BLOCKSIZE)
+
+        # end-of-archive blocks, padded to the record size.
+        self._end = offset
+        self.size = offset + 2 * tarfile.BLOCKSIZE
+        self.size += -self.size % tarfile.RECORDSIZE
+
+    def __len__(self):
+        """Archive size (in bytes)."""
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Generate the archive (and the checksum of its members)."""
+        buffer = bytearray()
+
+        for name, file_path, header, size, _ in self._members:
+            buffer += header
+            file_hash = hashlib.new(CHECKSUM_ALGORITHM)
+
+            with open(file_path, "rb") as member_file:
+                remaining = size
+
+                while remaining:
+                    chunk = member_file.read(min(self.chunk_size, remaining))
+                    if not chunk:
+                        raise RuntimeError(f"{file_path} changed while it was bundled.")
+
+                    file_hash.update(chunk)
+                    buffer += chunk
+                    remaining -= len(chunk)
+
+                    if len(buffer) >= self.chunk_size:
+                        yield bytes(buffer)
+                        buffer.clear()
+
+            buffer += _NUL * (-size % tarfile.BLOCKSIZE)
+            self.checksums[name] = f"{CHECKSUM_ALGORITHM}:{file_hash.hexdigest()}"
+
+        buffer += _NUL * (self.size - self._end)
+        yield bytes(buffer)
+
+    @property
+    def index(self) -> Dict:
+        """Index manifest of the bundle.
+
+        The checksums are available after the archive is generated.
+        """
+        return {
+            "format": "tar",
+            "size": self.size,
+            "members": [
+                {
+                    "key": name,
+                    "offset": offset,
+                    "size": size,
+                    "checksum": self.checksums.get(name),
+                }
+                for name, _, _, size, offset in self._members
+            ],
+        }
+
+
+def coalesce(
+    members: List[Dict], max_gap: int = 64 * 1024, max_span: int = 16 * 1024**2
+) -> List[Tuple[int, int, List[Dict]]]:
+    """Group the bundle members in byte ranges read in a single request.
+
+    Args:
+        members (List[dict]): Members (from the bundle index).
+
+        max_gap (int): Maximum number of unused bytes between members in a range.
+
+        max_span (int): Maximum size (in bytes) of a range. Bigger members are read
+                        in their own range.
+
+    Returns:
+        List[Tuple[int, int, List[dict]]]: Ranges (start, end and members).
+    """
+    spans = []
+
+    for member in sorted(members, key=lambda m: m["offset"]):
+        start, end = member["offset"], member["offset"] + member["size"]
+
+        if spans:
+            span_start, span_end, span_members = spans[-1]
+
+            if start - span_end <= max_gap and end - span_start <= max_span:
+                spans[-1] = (span_start, max(span_end, end), span_members + [member])
+                continue
+
+        spans.append((start, end, [member]))
+    return spans
+
+
+class RangeReader:
+    """Reader of byte ranges of a file.
+
+    Servers without range support return the complete file to a range
+    request. It is detected in the first read, and the complete content
+    is reused by the next reads (the file isn't downloaded once per range).
+    The reader can be used by many threads.
+    """
+
+    def __init__(self, client: "HTTPXClient", url: str, request_options=None):
+        """Initializer.
+
+        Args:
+            client (HTTPXClient): Client used to request the Storm WS.
+
+            url (str): File content URL.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+        """
+        self.client = client
+        self.url = url
+        self.request_options = dict(request_options or {})
+
+        self._lock = threading.Lock()
+        self._checked = False
+        self._content = None
+
+    def _request(self, start: int, end: int) -> bytes:
+        """Request a byte range, keeping the complete content if it is returned."""
+        request_options = dict(self.request_options)
+        request_options["headers"] = {
+            **dict(request_options.get("headers") or {}),
+            "range": f"bytes={start}-{end - 1}",
+        }
+
+        response = self.client.request("GET", self.url, **request_options)
+        response.raise_for_status()
+
+        # servers without range support return the complete file.
+        if response.status_code != 206:
+            self._content = response.content
+            return self._content[start:end]
+        return response.content
+
+    def read(self, start: int, end: int) -> bytes:
+        """Read a byte range (``[start, end)``) of the file.
+
+        Args:
+            start (int): First byte.
+
+            end (int): End of the range (exclusive).
+
+        Returns:
+            bytes: Range content.
+        """
+        if not self._checked:
+            # the other reads wait until the range support is known.
+            with self._lock:
+                if not self._checked:
+                    content = self._request(start, end)
+                    self._checked = True
+
+                    return content
+
+        if self._content is not None:
+            return self._content[start:end]
+        return self._request(start, end)
+
+
+def read_range(
+    client: "HTTPXClient", url: str, start: int, end: int, request_options=None
+) -> bytes:
+    """Read a byte range (``[start, end)``) of a file.
+
+    Args:
+        client (HTTPXClient): Client used to request the Storm WS.
+
+        url (str): File content URL.
+
+        start (int): First byte.
+
+        end (int): End of the range (exclusive).
+
+        request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+    Returns:
+        bytes: Range content.
+
+    Note:
+        To read many ranges of the same file, use a ``RangeReader``.
+    """
+    return RangeReader(client, url, request_options).read(start, end)
@@ -0,0 +1,311 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager client record cache.
+
+Published Compendia (``CompendiumRecord``) can't be deleted or replaced
+in the Storm WS. So, their documents (and file listings) are stored in
+an on-disk ``sqlite`` database, keyed by scope, record ID and revision
+ID, and reused by the clients (and processes) that use the same cache
+directory. The scope identifies the Storm WS deployment and the user
+(``cache_scope``), so clients of other deployments (or users) sharing a
+cache directory never read each other's records.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from pydash import py_
+
+_SCHEMA_VERSION = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    scope TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    revision_id INTEGER NOT NULL,
+    self_url TEXT,
+    files_url TEXT,
+    record TEXT NOT NULL,
+    files TEXT,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (scope, record_id, revision_id)
+);
+CREATE INDEX IF NOT EXISTS records_self_url ON records (self_url);
+CREATE INDEX IF NOT EXISTS records_files_url ON records (files_url);
+CREATE INDEX IF NOT EXISTS records_accessed ON records (accessed);
+
+-- the total size is updated with the records (in the same transaction).
+CREATE TABLE IF NOT EXISTS cache_size (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_size (id, size) VALUES (0, 0);
+CREATE TRIGGER IF NOT EXISTS records_insert AFTER INSERT ON records BEGIN
+    UPDATE cache_size SET size = size + NEW.size;
+END;
+CREATE TRIGGER IF NOT EXISTS records_update AFTER UPDATE OF size ON records BEGIN
+    UPDATE cache_size SET size = size + NEW.size - OLD.size;
+END;
+CREATE TRIGGER IF NOT EXISTS records_delete AFTER DELETE ON records BEGIN
+    UPDATE cache_size SET size = size - OLD.size;
+END;
+"""
+
+
+def cache_scope(url: str, access_token: str = None) -> str:
+    """Scope of the cached records of a client.
+
+    Args:
+        url (str): Storm WS URL.
+
+        access_token (str): Token used to access the Storm WS (only its hash is
+                            used in the scope).
+
+    Returns:
+        str: Scope (``<url>#<token hash>``).
+    """
+    token_hash = hashlib.sha256((access_token or "").encode()).hexdigest()[:16]
+    return f"{url.rstrip('/')}#{token_hash}"
+
+
+def _is_published(document: Dict) -> bool:
+    """Check if a document is a published record (documents without the flag aren't)."""
+    return py_.get(document, "is_published") is True
+
+
+class RecordCache:
+    """On-disk cache of the published Compendia.
+
+    The least recently used records are evicted when the cache is bigger
+    than ``max_size`` (in bytes).
+    """
+
+    filename = "records.sqlite3"
+    """Name of the cache database (in the cache directory)."""
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size: int = 256 * 1024**2,
+        scope: str = "",
+    ):
+        """Initializer.
+
+        Args:
+            cache_dir (Union[str, Path]): Directory where the cache is stored.
+
+            max_size (int): Maximum size (in bytes) of the cached documents (of
+                            all scopes).
+
+            scope (str): Scope of the records read and stored by this cache (see
+                         ``cache_scope``).
+        """
+        self.path = Path(cache_dir) / self.filename
+        self.max_size = max_size
+        self.scope = scope
+
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Get the database connection (created on the first use)."""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            connection = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+
+            # caches created by older versions (without scopes) are discarded.
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != _SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS records")
+                connection.execute("DROP TABLE IF EXISTS cache_size")
+                connection.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+            connection.executescript(_SCHEMA)
+
+            self._connection = connection
+        return self._connection
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _select(self, column: str, where: str, params) -> Optional[Dict]:
+        """Get a cached document (marking its record as recently used)."""
+        with self._lock:
+            connection = self._connect()
+
+            row = connection.execute(
+                f"SELECT record_id, revision_id, {column} FROM records "
+                f"WHERE scope = ? AND {where} AND {column} IS NOT NULL "
+                "ORDER BY revision_id DESC LIMIT 1",
+                (self.scope, *params),
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE records SET accessed = ? "
+                "WHERE scope = ? AND record_id = ? AND revision_id = ?",
+                (time.time(), self.scope, row[0], row[1]),
+            )
+        return json.loads(row[2])
+
+    def get_record(self, record_id: str) -> Optional[Dict]:
+        """Get the document of a record.
+
+        Args:
+            record_id (str): Record ID.
+
+        Returns:
+            dict: Record document. If the record is not cached, ``None`` is returned.
+        """
+        return self._select("record", "record_id = ?", (record_id,))
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Get the document (record or file listing) available in a URL.
+
+        Args:
+            url (str): Record URL (``links.self``) or files URL (``links.files``).
+
+        Returns:
+            dict: Cached document. If the URL is not cached, ``None`` is returned.
+        """
+        return self._select("record", "self_url = ?", (url,)) or self._select(
+            "files", "files_url = ?", (url,)
+        )
+
+    def put_record(self, document: Dict) -> bool:
+        """Store the document of a record.
+
+        Args:
+            document (dict): Record document. Only published records (with
+                             ``is_published`` defined as ``True``) are stored.
+
+        Returns:
+            bool: Flag indicating if the document was stored.
+        """
+        record_id = py_.get(document, "id")
+        revision_id = py_.get(document, "revision_id")
+
+        if not _is_published(document) or record_id is None or revision_id is None:
+            return False
+
+        data = json.dumps(document)
+
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR IGNORE INTO records (scope, record_id, revision_id, "
+                "self_url, files_url, record, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.scope,
+                    record_id,
+                    revision_id,
+                    py_.get(document, "links.self"),
+                    py_.get(document, "links.files"),
+                    data,
+                    len(data),
+                    time.time(),
+                ),
+            )
+            self._evict()
+        return True
+
+    def put_files(self, url: str, document: Dict) -> bool:
+        """Store the file listing of a record.
+
+        Args:
+            url (str): Files URL (``links.files``) of a cached record.
+
+            document (dict): File listing document.
+
+        Returns:
+            bool: Flag indicating if the document was stored.
+        """
+        data = json.dumps(document)
+
+        with self._lock:
+            updated = self._connect().execute(
+                "UPDATE records "
+                "SET files = ?, size = length(record) + ?, accessed = ? "
+                "WHERE scope = ? AND files_url = ?",
+                (data, len(data), time.time(), self.scope, url),
+            )
+            self._evict()
+        return updated.rowcount > 0
+
+    def put(self, url: str, document: Dict):
+        """Store the document (records or file listing) returned by a URL.
+
+        Args:
+            url (str): Requested URL.
+
+            document (dict): Returned document.
+        """
+        if py_.has(document, "hits.hits"):
+            for record in py_.get(document, "hits.hits"):
+                self.put_record(record)
+
+        elif "entries" in document:
+            self.put_files(url, document)
+
+        else:
+            self.put_record(document)
+
+    def _evict(self):
+        """Remove the least recently used records until the cache fits ``max_size``."""
+        connection = self._connect()
+        (size,) = connection.execute("SELECT size FROM cache_size").fetchone()
+
+        if size <= self.max_size:
+            return
+
+        rows = connection.execute(
+            "SELECT scope, record_id, revision_id, size FROM records ORDER BY accessed"
+        )
+
+        evicted = []
+        for scope, record_id, revision_id, record_size in rows:
+            if size <= self.max_size:
+                break
+
+            evicted.append((scope, record_id, revision_id))
+            size -= record_size
+
+        connection.executemany(
+            "DELETE FROM records "
+            "WHERE scope = ? AND record_id = ? AND revision_id = ?",
+            evicted,
+        )
+
+    def clear(self):
+        """Remove the cached records (of this scope)."""
+        with self._lock:
+            self._connect().execute(
+                "DELETE FROM records WHERE scope = ?", (self.scope,)
+            )
+
+    @property
+    def size(self) -> int:
+        """Size (in bytes) of the cached documents."""
+        with self._lock:
+            return self._connect().execute("SELECT size FROM cache_size").fetchone()[0]
@@ -0,0 +1,369 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager command-line interface.
+
+The commands use the same services (and the same parallel transfers,
+throttling and caches) as the Python API. The Storm WS URL and the
+access token are defined by the ``STORM_URL`` and ``STORM_ACCESS_TOKEN``
+environment variables (or by the ``--url`` and ``--token`` options).
+
+Example:
+    $ storm push my-project my-compendium data/
+    $ storm pull my-project my-compendium output/ --store ~/.storm/store
+    $ storm jobs wait my-project 3f1c2a --interval 10
+    $ storm search my-project executions -q status:finished --export jobs.parquet
+"""
+
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from . import lazy
+from .export import EXPORT_FORMATS
+from .storm import Storm
+
+TERMINAL_JOB_STATUS = {"finished", "error", "failed", "canceled"}
+"""Job status that indicate the end of a job."""
+
+SEARCH_KINDS = ("compendia", "executions", "deposits", "workflows")
+"""Records that can be searched."""
+
+
+def _local_files(paths):
+    """List the local files (filename and path) of files and directories.
+
+    The files of a directory are named by their path relative to the
+    directory, and the other files by their name.
+    """
+    files = {}
+
+    def _add(filename, file_path):
+        if files.get(filename, str(file_path)) != str(file_path):
+            raise click.UsageError(
+                f"{files[filename]} and {file_path} have the same name ({filename})."
+            )
+        files[filename] = str(file_path)
+
+    for path in map(Path, paths):
+        if path.is_dir():
+            for file_path in sorted(path.rglob("*")):
+                if file_path.is_file():
+                    _add(file_path.relative_to(path).as_posix(), file_path)
+        elif path.is_file():
+            _add(path.name, path)
+        else:
+            raise click.BadParameter(f"{path} doesn't exist.", param_hint="PATHS")
+    return files
+
+
+def _project(ctx, project_id):
+    """Get the context of a Research Project (connecting to the Storm WS)."""
+    options = ctx.find_root().params
+
+    for option, envvar in (("url", "STORM_URL"), ("token", "STORM_ACCESS_TOKEN")):
+        if not options[option]:
+            raise click.UsageError(
+                f"Missing option '--{option}' (or the {envvar} environment variable)."
+            )
+
+    service = Storm(
+        options["url"],
+        options["token"],
+        rate_limit=options["rate_limit"],
+        max_in_flight=options["max_in_flight"],
+        cache_dir=options["cache_dir"],
+    )
+    ctx.call_on_close(service.close)
+
+    return service.project(project_id)
+
+
+@click.group()
+@click.option("--url", envvar="STORM_URL", help="Storm WS URL.")
+@click.option("--token", envvar="STORM_ACCESS_TOKEN", help="Access token.")
+@click.option(
+    "--rate-limit", type=float, default=None, help="Maximum requests per second."
+)
+@click.option(
+    "--max-in-flight", type=int, default=None, help="Maximum concurrent requests."
+)
+@click.option(
+    "--cache-dir",
+    envvar="STORM_CACHE_DIR",
+    default=None,
+    help="Directory of the published records cache.",
+)
+def cli(url, token, rate_limit, max_in_flight, cache_dir):
+    """SpatioTemporal Open Research Manager (Storm) client.
+
+    The client is only created by the commands that use the Storm WS
+    (so, e.g., ``--help`` doesn't require the URL and the token).
+    """
+
+
+@cli.command()
+@click.argument("project_id")
+@click.argument("compendium_id")
+@click.argument("paths", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option("--commit/--no-commit", default=True, help="Commit the uploaded files.")
+@click.option("--jobs", "max_workers", type=int, default=8, help="Parallel transfers.")
+@click.pass_context
+def push(ctx, project_id, compendium_id, paths, commit, max_workers):
+    """Upload files (or directories) to a Compendium Draft.
+
+    Only the new (or changed) files are uploaded, so an interrupted
+    push can be resumed running the same command again.
+    """
+    compendium_context = _project(ctx, project_id).compendium
+
+    files = _local_files(paths)
+    draft = compendium_context.draft.get(compendium_id)
+
+    result = compendium_context.files.sync_files(
+        draft, files, commit_files=commit, max_workers=max_workers
+    )
+
+    click.echo(
+        f"{len(result.uploaded)} file(s) uploaded, {len(result.unchanged)} unchanged."
+    )
+
+
+@cli.command()
+@click.argument("project_id")
+@click.argument("compendium_id")
+@click.argument("output_directory", type=click.Path(file_okay=False))
+@click.option("--file", "filenames", multiple=True, help="File to download.")
+@click.option("--draft", is_flag=True, help="Download the files of a draft.")
+@click.option(
+    "--store",
+    envvar="STORM_FILE_STORE",
+    type=click.Path(file_okay=False),
+    default=None,
+    help="Local file store (content reused across compendia and versions).",
+)
+@click.option(
+    "--segments", type=int, default=1, help="Parallel byte ranges of each file."
+)
+@click.option("--jobs", "max_workers", type=int, default=8, help="Parallel transfers.")
+@click.pass_context
+def pull(
+    ctx,
+    project_id,
+    compendium_id,
+    output_directory,
+    filenames,
+    draft,
+    store,
+    segments,
+    max_workers,
+):
+    """Download (and verify) the files of a Compendium.
+
+    The files already available (with the same checksum) in the output
+    directory are not downloaded again, so an interrupted pull can be
+    resumed running the same command again.
+    """
+    compendium_context = _project(ctx, project_id).compendium
+    compendium_service = (
+        compendium_context.draft if draft else compendium_context.record
+    )
+
+    compendium = compendium_service.get(compendium_id)
+    output_directory = Path(output_directory)
+
+    selected_files = [
+        entry.filename
+        for entry in compendium.links.files.entries
+        if not filenames or entry.filename in filenames
+    ]
+
+    # files already downloaded (with the same checksum) are skipped.
+    pending_files = compendium_context.files.select_missing_files(
+        compendium, output_directory, selected_files
+    )
+
+    if pending_files:
+        output_directory.mkdir(parents=True, exist_ok=True)
+        compendium_context.files.download_files(
+            compendium,
+            output_directory,
+            pending_files,
+            validate_checksum=True,
+            store=lazy.filestore.FileStore(store) if store else None,
+            segments=segments,
+            max_workers=max_workers,
+        )
+
+    click.echo(
+        f"{len(pending_files)} file(s) downloaded, "
+        f"{len(selected_files) - len(pending_files)} already available."
+    )
+
+
+@cli.command()
+@click.argument("project_id")
+@click.argument("compendium_id")
+@click.argument("directory", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--include", multiple=True, help="Glob pattern of the synchronized files."
+)
+@click.option(
+    "--exclude", multiple=True, help="Glob pattern of the ignored files (or dirs)."
+)
+@click.option(
+    "--delete", is_flag=True, help="Remove the draft files missing in the directory."
+)
+@click.option("--commit/--no-commit", default=True, help="Commit the uploaded files.")
+@click.option("--dry-run", is_flag=True, help="Only list the differences.")
+@click.option("--jobs", "max_workers", type=int, default=8, help="Parallel transfers.")
+@click.pass_context
+def sync(
+    ctx,
+    project_id,
+    compendium_id,
+    directory,
+    include,
+    exclude,
+    delete,
+    commit,
+    dry_run,
+    max_workers,
+):
+    """Synchronize a Compendium Draft with a local directory tree."""
+    compendium_context = _project(ctx, project_id).compendium
+    draft = compendium_context.draft.get(compendium_id)
+
+    result = compendium_context.files.sync_directory(
+        draft,
+        directory,
+        include=list(include),
+        exclude=list(exclude),
+        delete=delete,
+        commit_files=commit,
+        dry_run=dry_run,
+        max_workers=max_workers,
+    )
+
+    if dry_run:
+        for filename in result.uploaded:
+            click.echo(f"upload: {filename}")
+        for filename in result.deleted:
+            click.echo(f"delete: {filename}")
+
+        click.echo(
+            f"{len(result.uploaded)} file(s) to upload, {len(result.deleted)} to "
+            f"remove, {len(result.unchanged)} unchanged."
+        )
+        return
+
+    click.echo(
+        f"{len(result.uploaded)} file(s) uploaded, {len(result.deleted)} removed, "
+        f"{len(result.unchanged)} unchanged."
+    )
+
+
+@cli.group()
+def jobs():
+    """Execution and deposit jobs."""
+
+
+@jobs.command()
+@click.argument("project_id")
+@click.argument("job_ids", nargs=-1, required=True)
+@click.option(
+    "--kind",
+    type=click.Choice(["execution", "deposit"]),
+    default="execution",
+    help="Job kind.",
+)
+@click.option("--interval", type=float, default=5.0, help="Polling interval (s).")
+@click.option("--timeout", type=float, default=None, help="Maximum wait time (s).")
+@click.pass_context
+def wait(ctx, project_id, job_ids, kind, interval, timeout):
+    """Wait until the jobs are finished.
+
+    The exit code is ``1`` if any job is not successfully finished.
+    """
+    job_service = getattr(_project(ctx, project_id), kind)
+
+    start = time.monotonic()
+    pending_jobs, status = set(job_ids), {}
+
+    while pending_jobs:
+        for job_id in sorted(pending_jobs):
+            status[job_id] = job_service.get(job_id).status
+
+            if status[job_id] in TERMINAL_JOB_STATUS:
+                pending_jobs.remove(job_id)
+                click.echo(f"{job_id}: {status[job_id]}")
+
+        if not pending_jobs:
+            break
+
+        if timeout is not None and time.monotonic() - start + interval > timeout:
+            raise click.ClickException(
+                f"Timeout waiting for the jobs: {', '.join(sorted(pending_jobs))}"
+            )
+        time.sleep(interval)
+
+    if any(job_status != "finished" for job_status in status.values()):
+        sys.exit(1)
+
+
+@cli.command()
+@click.argument("project_id")
+@click.argument("kind", type=click.Choice(SEARCH_KINDS))
+@click.option("-q", "--query", default=None, help="Search query.")
+@click.option(
+    "--export",
+    "output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Export file. If not defined, the results are written (NDJSON) in stdout.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(list(EXPORT_FORMATS)),
+    default=None,
+    help="Export format (default: from the export file extension).",
+)
+@click.option("--page-size", type=int, default=500, help="Records per request.")
+@click.pass_context
+def search(ctx, project_id, kind, query, output, output_format, page_size):
+    """Search (and export) records of a Research Project."""
+    project_context = _project(ctx, project_id)
+    search_service = {
+        "compendia": lambda: project_context.compendium.search,
+        "executions": lambda: project_context.execution,
+        "deposits": lambda: project_context.deposit,
+        "workflows": lambda: project_context.workflow,
+    }[kind]()
+
+    search_params = {"q": query} if query else {}
+
+    if output is None:
+        for document in search_service.scan(page_size=page_size, **search_params):
+            click.echo(json.dumps(document))
+        return
+
+    if output_format is None:
+        output_format = "parquet" if output.endswith(".parquet") else "ndjson"
+
+    count = search_service.export(
+        output, output_format, page_size=page_size, **search_params
+    )
+    click.echo(f"{count} record(s) exported to {os.path.abspath(output)}.")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager transfer compression.
+
+The file contents can be compressed on-the-fly (streaming, without
+temporary files) during the transfers:
+
+  - Uploads: the content is sent compressed with the ``Content-Encoding``
+    header. The server must decode the request body (the Storm WS doesn't,
+    so it is only available for deployments with a proxy that does it) and
+    is enabled explicitly (``Storm(..., request_compression=True)``);
+
+  - Downloads: the compressed encodings accepted by the client are sent
+    in the ``Accept-Encoding`` header and the content is decompressed
+    while it is written.
+
+The supported encodings are ``gzip`` (standard library) and ``zstd``
+(requires the ``zstandard`` package).
+"""
+
+import zlib
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+ENCODINGS = ("zstd", "gzip")
+"""Supported encodings (in order of preference)."""
+
+INCOMPRESSIBLE_SUFFIXES = {
+    ".7z",
+    ".bz2",
+    ".gif",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".mp4",
+    ".parquet",
+    ".png",
+    ".tgz",
+    ".xz",
+    ".zip",
+    ".zst",
+}
+"""Suffixes of already compressed files (sent without compression)."""
+
+
+def _zstandard():
+    """Import the ``zstandard`` package."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd compression requires the ``zstandard`` package.")
+    return zstandard
+
+
+def available_encodings() -> tuple:
+    """Encodings available in the current environment (in order of preference)."""
+    try:
+        _zstandard()
+    except ImportError:
+        return tuple(encoding for encoding in ENCODINGS if encoding != "zstd")
+    return ENCODINGS
+
+
+def check_encoding(encoding: str):
+    """Check if an encoding is supported (and its dependencies are installed).
+
+    Raises:
+        ValueError: When the encoding isn't supported.
+
+        ImportError: When the encoding dependencies aren't installed.
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(
+            f"Invalid encoding: {encoding}. Available encodings: {', '.join(ENCODINGS)}"
+        )
+
+    if encoding == "zstd":
+        _zstandard()
+
+
+def select_encoding(
+    file_path: Union[str, Path], compression: Optional[str]
+) -> Optional[str]:
+    """Select the encoding used to upload a file.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        compression (str): Requested compression (``gzip`` or ``zstd``). If not
+                           defined, the file is not compressed.
+
+    Returns:
+        str: Encoding. Already compressed files (e.g., ``.zip``) and empty files
+             are not compressed (``None`` is returned).
+
+    Note:
+        The encoding must be supported by the server, so it isn't selected
+        automatically (``auto`` is only available for the downloads).
+    """
+    if not compression:
+        return None
+    check_encoding(compression)
+
+    file_path = Path(file_path)
+    if file_path.suffix.lower() in INCOMPRESSIBLE_SUFFIXES:
+        return None
+
+    if file_path.stat().st_size == 0:
+        return None
+    return compression
+
+
+def compressor(encoding: str):
+    """Create a streaming compressor (with ``compress`` and ``flush`` methods)."""
+    check_encoding(encoding)
+
+    if encoding == "zstd":
+        return _zstandard().ZstdCompressor().compressobj()
+
+    # ``wbits=31``: gzip container.
+    return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+
+class _IdentityDecoder:
+    """Decoder of the uncompressed contents."""
+
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def decompressor(encoding: Optional[str]):
+    """Create a streaming decompressor (with ``decompress`` and ``flush`` methods).
+
+    Args:
+        encoding (str): Content encoding (``gzip``, ``deflate``, ``zstd`` or
+                        ``identity``).
+    """
+    encoding = (encoding or "identity").strip().lower()
+
+    if encoding == "identity":
+        return _IdentityDecoder()
+
+    if encoding == "gzip":
+        return zlib.decompressobj(47)  # gzip (or zlib) container.
+
+    if encoding == "deflate":
+        return zlib.decompressobj()
+
+    if encoding == "zstd":
+        return _zstandard().ZstdDecompressor().decompressobj()
+
+    raise ValueError(f"Unsupported content encoding: {encoding}")
+
+
+def accepted_encodings(compression: Union[str, Iterable[str], None]) -> List[str]:
+    """Encodings accepted in a download.
+
+    Args:
+        compression (Union[str, Iterable[str]]): Requested compression (``gzip``,
+                                                 ``zstd``, a list of them or ``auto``,
+                                                 for all available encodings).
+
+    Returns:
+        List[str]: Accepted encodings (empty if the compression isn't requested).
+    """
+    if not compression:
+        return []
+
+    if compression == "auto":
+        return list(available_encodings())
+
+    encodings = [compression] if isinstance(compression, str) else list(compression)
+    for encoding in encodings:
+        check_encoding(encoding)
+    return encodings
+
+
+def accept_encoding(encodings: Iterable[str] = None) -> str:
+    """Value of the ``Accept-Encoding`` header.
+
+    Args:
+        encodings (Iterable[str]): Accepted encodings. If not defined, all available
+                                   encodings are accepted.
+    """
+    encodings = available_encodings() if encodings is None else encodings
+    return ", ".join([*encodings, "identity"])
+
+
+class CompressedFile:
+    """Compressed content of a file, generated while it is read.
+
+    Each iteration generates the content again, so a throttled upload
+    can be retried.
+    """
+
+    def __init__(
+        self, file_path: Union[str, Path], encoding: str, chunk_size: int = 1024**2
+    ):
+        """Initializer.
+
+        Args:
+            file_path (Union[str, Path]): File path.
+
+            encoding (str): Content encoding (``gzip`` or ``zstd``).
+
+            chunk_size (int): Size (in bytes) of the chunks read from the file.
+        """
+        check_encoding(encoding)
+
+        self.file_path = file_path
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Generate the compressed content."""
+        content_compressor = compressor(self.encoding)
+
+        with open(self.file_path, "rb") as content_file:
+            for chunk in iter(lambda: content_file.read(self.chunk_size), b""):
+                compressed_chunk = content_compressor.compress(chunk)
+                if compressed_chunk:
+                    yield compressed_chunk
+
+        yield content_compressor.flush()
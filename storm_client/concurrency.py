@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager concurrency utilities."""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Iterable, Iterator
+
+
+class OperationResult:
+    """Result of an operation applied to a single item of a collection.
+
+    When an operation is applied to many items (e.g., creating many
+    records in the Storm WS), each item has its own result. The failures
+    are reported per item, so one invalid item doesn't stop the others.
+    """
+
+    def __init__(self, index, item, result=None, error=None):
+        """Initializer.
+
+        Args:
+            index (int): Position of the item in the input collection.
+
+            item (object): Item used in the operation.
+
+            result (object): Value returned by the operation.
+
+            error (Exception): Error raised by the operation (if any).
+        """
+        self.index = index
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        """Flag indicating if the operation was successfully completed."""
+        return self.error is None
+
+    def __repr__(self):
+        """Object representation."""
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"OperationResult(index={self.index}, {status})"
+
+
+def map_concurrently(
+    operation: Callable, items: Iterable, max_workers: int = 8
+) -> Iterator[OperationResult]:
+    """Apply an operation to many items with bounded concurrency.
+
+    The items are consumed lazily, so only ``max_workers`` operations
+    are in flight at any time, and the results are yielded as soon as
+    each operation is completed (not in the input order).
+
+    Args:
+        operation (Callable): Function applied to each item.
+
+        items (Iterable): Items to process.
+
+        max_workers (int): Maximum number of concurrent operations.
+
+    Yields:
+        OperationResult: Result of the operation applied to each item.
+    """
+    if max_workers < 1:
+        raise ValueError("``max_workers`` must be greater than zero.")
+
+    items = enumerate(items)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        in_flight = {}
+
+        def _submit():
+            for index, item in items:
+                future = executor.submit(operation, item)
+                in_flight[future] = (index, item)
+
+                if len(in_flight) >= max_workers:
+                    break
+
+        try:
+            _submit()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    index, item = in_flight.pop(future)
+
+                    try:
+                        yield OperationResult(index, item, result=future.result())
+                    except Exception as error:  # noqa
+                        yield OperationResult(index, item, error=error)
+
+                _submit()
+        finally:
+            # consumer stopped before the end: dropping the pending operations.
+            for future in in_flight:
+                future.cancel()
@@ -0,0 +1,399 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager search results export.
+
+The search results are requested page by page (``scan``) and written
+as soon as each page is received, so the memory used by an export
+doesn't depend on the number of exported records.
+"""
+
+import json
+import os
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Union
+
+from . import lazy
+
+
+def _files_count(document: Dict):
+    """Number of files of a record."""
+    count = lazy.pydash.get(document, "files.count")
+
+    if count is None and lazy.pydash.has(document, "files.entries"):
+        count = len(lazy.pydash.get(document, "files.entries"))
+    return count
+
+
+def _status(document: Dict):
+    """Status of a record (Compendia don't have status, only the publication flag)."""
+    status = document.get("status")
+
+    if status is None and "is_published" in document:
+        status = "published" if document["is_published"] else "draft"
+    return status
+
+
+DEFAULT_COLUMNS = {
+    "id": "id",
+    "title": "metadata.title",
+    "status": _status,
+    "created": "created",
+    "updated": "updated",
+    "files_count": _files_count,
+    "files_bytes": "files.total_bytes",
+}
+"""Flattened columns (name and dotted path, or function, of the value)."""
+
+DEFAULT_TYPES = {
+    "id": "string",
+    "title": "string",
+    "status": "string",
+    "created": "string",
+    "updated": "string",
+    "files_count": "int64",
+    "files_bytes": "int64",
+}
+"""Arrow types (aliases) of the ``DEFAULT_COLUMNS`` in the Parquet exports."""
+
+
+def scan(
+    client: "HTTPXClient",
+    url: str,
+    page_size: int = 500,
+    request_options: Dict = None,
+    **kwargs,
+) -> Iterator[Dict]:
+    """Iterate over all records (raw documents) of a search, page by page.
+
+    Args:
+        client (HTTPXClient): Client used to request the Storm WS.
+
+        url (str): Search URL.
+
+        page_size (int): Number of records requested in each page.
+
+        request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+        **kwargs (dict): Search parameters.
+
+    Yields:
+        dict: Record document.
+    """
+    params = {"page": 1, **kwargs, "size": page_size}
+
+    while url:
+        response = client.request("GET", url, params=params, **request_options or {})
+        response.raise_for_status()
+
+        result = response.json()
+        hits = lazy.pydash.get(result, "hits.hits", [])
+
+        yield from hits
+
+        # the next page link already has the search parameters.
+        url, params = lazy.pydash.get(result, "links.next"), None
+
+        if not hits:
+            break
+
+
+def getter(path: Union[str, Callable]) -> Callable:
+    """Create a function that gets the value of a dotted path from a document.
+
+    Args:
+        path (Union[str, Callable]): Dotted path (e.g., ``metadata.title``). Functions
+                                     are returned without changes.
+
+    Returns:
+        Callable: Function that receives a document and returns the path value.
+    """
+    if callable(path):
+        return path
+
+    # bracket list indexes (e.g., ``a[0].b``) are handled by ``pydash``.
+    if "[" in path:
+        return lambda document: lazy.pydash.get(document, path)
+
+    keys = path.split(".")
+
+    def _get(document):
+        for key in keys:
+            if isinstance(document, dict):
+                document = document.get(key)
+            elif isinstance(document, list) and key.isdigit():
+                document = document[int(key)] if int(key) < len(document) else None
+            else:
+                return None
+        return document
+
+    return _get
+
+
+def columns_getters(columns: Union[Dict, Iterable[str], None]) -> Dict:
+    """Create the getters of the columns.
+
+    Args:
+        columns (Union[dict, Iterable[str]]): Columns (name and dotted path, or
+                                              function, of the value) or a list of
+                                              dotted paths (used as the column names).
+                                              If not defined, the ``DEFAULT_COLUMNS``
+                                              are used.
+
+    Returns:
+        dict: Column name and getter function.
+    """
+    columns = DEFAULT_COLUMNS if columns is None else columns
+
+    if not isinstance(columns, dict):
+        columns = {path: path for path in columns}
+    return {name: getter(path) for name, path in columns.items()}
+
+
+def flatten(document: Dict, columns: Dict = None) -> Dict:
+    """Flatten a record document in a row.
+
+    Args:
+        document (dict): Record document.
+
+        columns (dict): Columns (name and dotted path, or function, of the value). If
+                        not defined, the ``DEFAULT_COLUMNS`` are used.
+
+    Returns:
+        dict: Row with the values of the columns.
+    """
+    return {name: get(document) for name, get in columns_getters(columns).items()}
+
+
+@contextmanager
+def _open(output, mode):
+    """Open an output (path or file object)."""
+    if isinstance(output, (str, Path)):
+        with open(output, mode) as output_file:
+            yield output_file
+    else:
+        yield output
+
+
+def to_ndjson(
+    documents: Iterable[Dict], output, columns: Union[Dict, None] = DEFAULT_COLUMNS
+) -> int:
+    """Write records as newline-delimited JSON.
+
+    Args:
+        documents (Iterable[dict]): Record documents (e.g., from ``scan``).
+
+        output (Union[str, Path, IO]): Output file (path or text file object).
+
+        columns (dict): Flattened columns. If ``None``, the complete documents are
+                        written.
+
+    Returns:
+        int: Number of written records.
+    """
+    count = 0
+    getters = columns_getters(columns) if columns is not None else None
+
+    with _open(output, "w") as output_file:
+        for document in documents:
+            row = (
+                {name: get(document) for name, get in getters.items()}
+                if getters is not None
+                else document
+            )
+
+            output_file.write(json.dumps(row, default=str))
+            output_file.write("\n")
+            count += 1
+    return count
+
+
+def _parquet_schema(pa, types: Dict):
+    """Create an Arrow schema from the column types (Arrow types or aliases)."""
+    return pa.schema(
+        [
+            (name, pa.type_for_alias(type_) if isinstance(type_, str) else type_)
+            for name, type_ in types.items()
+        ]
+    )
+
+
+@contextmanager
+def _atomic_output(output):
+    """Write a file output in a temporary file, replacing the output on success.
+
+    File objects are written directly.
+    """
+    if not isinstance(output, (str, Path)):
+        yield output
+        return
+
+    output = Path(output)
+    temporary_output = output.with_name(f".{output.name}.{uuid.uuid4().hex}.tmp")
+
+    try:
+        yield str(temporary_output)
+        os.replace(temporary_output, output)
+    finally:
+        if temporary_output.exists():
+            temporary_output.unlink()
+
+
+def to_parquet(
+    documents: Iterable[Dict],
+    output,
+    columns: Dict = DEFAULT_COLUMNS,
+    batch_size: int = 10_000,
+    types: Dict = None,
+    max_buffered_rows: int = 100_000,
+) -> int:
+    """Write records as a Parquet file.
+
+    The rows are written in row groups of ``batch_size`` records. The schema
+    is defined by ``types`` or, for the ``DEFAULT_COLUMNS``, by the
+    ``DEFAULT_TYPES``. Otherwise, it is inferred from the rows: the rows are
+    buffered until all columns have a (non-null) value, or until
+    ``max_buffered_rows`` rows are read (the columns without values are
+    strings). Later rows with values of other types raise an error.
+
+    Path outputs are written in a temporary file, which replaces the output
+    when the export is completed. So, a failed export doesn't leave a
+    partial file.
+
+    Args:
+        documents (Iterable[dict]): Record documents (e.g., from ``scan``).
+
+        output (Union[str, Path, IO]): Output file (path or binary file object).
+
+        columns (dict): Flattened columns.
+
+        batch_size (int): Number of records in each row group.
+
+        types (dict): Arrow type (or type alias, e.g., ``int64``) of each column.
+
+        max_buffered_rows (int): Maximum number of rows buffered to infer the schema.
+
+    Returns:
+        int: Number of written records.
+
+    Note:
+        This function requires the ``pyarrow`` package.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet export requires the ``pyarrow`` package.")
+
+    getters = columns_getters(columns)
+
+    if types is None and columns is DEFAULT_COLUMNS:
+        types = DEFAULT_TYPES
+    schema = _parquet_schema(pa, types) if types is not None else None
+
+    def _infer(rows, force):
+        """Infer the schema (``None`` while there are columns without values)."""
+        inferred = pa.Table.from_pylist(rows).schema if rows else pa.schema([])
+        fields = {field.name: field.type for field in inferred}
+
+        column_types = {name: fields.get(name, pa.null()) for name in getters}
+        if not force and any(map(pa.types.is_null, column_types.values())):
+            return None
+
+        return pa.schema(
+            [
+                (name, pa.string() if pa.types.is_null(type_) else type_)
+                for name, type_ in column_types.items()
+            ]
+        )
+
+    count = 0
+
+    with _atomic_output(output) as target:
+        writer = None
+        buffered = []
+
+        def _write(rows, force=False):
+            nonlocal writer, schema
+
+            buffered.extend(rows)
+
+            try:
+                if schema is None:
+                    force = force or len(buffered) >= max_buffered_rows
+
+                    schema = _infer(buffered, force)
+                    if schema is None:
+                        return
+
+                if writer is None:
+                    writer = pq.ParquetWriter(target, schema)
+
+                for start in range(0, len(buffered), batch_size):
+                    writer.write_table(
+                        pa.Table.from_pylist(
+                            buffered[start : start + batch_size], schema=schema
+                        )
+                    )
+            except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+                raise ValueError(
+                    f"Record values don't match the export schema ({error}). "
+                    "Define the column types with ``types``."
+                ) from error
+            buffered.clear()
+
+        try:
+            rows = []
+            for document in documents:
+                rows.append({name: get(document) for name, get in getters.items()})
+                count += 1
+
+                if len(rows) >= batch_size:
+                    _write(rows)
+                    rows = []
+
+            _write(rows, force=True)
+        finally:
+            if writer is not None:
+                writer.close()
+    return count
+
+
+EXPORT_FORMATS = {"ndjson": to_ndjson, "parquet": to_parquet}
+"""Available export formats."""
+
+
+def export(
+    documents: Iterable[Dict],
+    output,
+    output_format: str = "ndjson",
+    columns: Dict = DEFAULT_COLUMNS,
+) -> int:
+    """Export records.
+
+    Args:
+        documents (Iterable[dict]): Record documents (e.g., from ``scan``).
+
+        output (Union[str, Path, IO]): Output file (path or file object).
+
+        output_format (str): Export format (``ndjson`` or ``parquet``).
+
+        columns (dict): Flattened columns.
+
+    Returns:
+        int: Number of exported records.
+    """
+    writer = EXPORT_FORMATS.get(output_format)
+
+    if writer is None:
+        raise ValueError(
+            f"Invalid export format: {output_format}. "
+            f"Available formats: {', '.join(EXPORT_FORMATS)}"
+        )
+    return writer(documents, output, columns)
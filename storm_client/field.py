@@ -5,9 +5,11 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import operator
+from collections import UserDict
+
 from pydash import py_
 
-from .network import HTTPXClient
 from .object_factory import ObjectFactory
 
 
@@ -68,33 +70,138 @@ class ObjectField(DictField):
         Since this class uses the ``ObjectFactory``
         all classes used in this field must be
         registered in the factory object.
+
+    Note:
+        The objects use the field document (not a copy), so the changes
+        made in the objects are written to the owner data (and vice versa).
+        They are cached in the owner object and reused while the field
+        document is the same (e.g., reassigning ``obj.data["links"]``
+        resolves the object again).
     """
 
     def __get__(self, obj, objtype=None):
         """Get the key value."""
+        if obj is None:
+            return self
+
         objdata = super().__get__(obj)
-        return self.resolve_class(objdata)
+        client = obj._client
+
+        cache = obj.__dict__.setdefault("_field_cache", {})
+        cached = cache.get(self)
+
+        if (
+            cached is not None
+            and cached[1] is client
+            and not self._changed(cached[0], objdata)
+        ):
+            return self._cached_value(cached[2])
+
+        value = self.resolve_value(objdata, client)
+
+        if self._cacheable(objdata):
+            cache[self] = (self._snapshot(objdata), client, value)
+        else:
+            cache.pop(self, None)
+
+        return self._cached_value(value)
+
+    def _cacheable(self, objdata):
+        """Check if the value can be cached (i.e., it shares the field document)."""
+        return isinstance(objdata, dict)
+
+    def _snapshot(self, objdata):
+        """State of the field data used to validate the cached value."""
+        return objdata
+
+    def _changed(self, snapshot, objdata):
+        """Check if the field data was reassigned after the value was cached."""
+        return snapshot is not objdata
+
+    @staticmethod
+    def _share(value, objdata):
+        """Use the field document as the object data (instead of a copy)."""
+        if isinstance(objdata, dict) and isinstance(value, UserDict):
+            value.data = objdata
+        return value
+
+    def _cached_value(self, value):
+        """Value returned from the cache."""
+        return value
+
+    def resolve_value(self, objdata, client=None):
+        """Resolve the field data in the field value."""
+        return self._share(self.resolve_class(objdata, client), objdata)
 
     def __init__(self, key, class_name, default=None):
         """Initializer"""
         super(ObjectField, self).__init__(key, default)
         self._class_name = class_name
 
-    def resolve_class(self, obj):
+        # (registry generation, factory)
+        self._factory = (None, None)
+
+    @property
+    def factory(self):
+        """Factory of the field class.
+
+        The factory is resolved in the ``ObjectFactory`` once (and again
+        only when the registry changes), so reading the field doesn't
+        look up the class name.
+        """
+        generation, factory = self._factory
+
+        if generation != ObjectFactory.generation:
+            generation = ObjectFactory.generation
+            factory = ObjectFactory.get(self._class_name)
+
+            self._factory = (generation, factory)
+        return factory
+
+    def resolve_class(self, obj, client=None):
         """Resolve a data dictionary in a ``valid class``."""
-        return ObjectFactory.resolve(self._class_name, obj)
+        obj = self.factory(obj)
+
+        if client is not None:
+            ObjectFactory.bind(obj, client)
+        return obj
 
 
 class ObjectCollectionField(ObjectField):
     """Object Collection data field.
 
-    Collection of objects with same type.
+    Collection of objects with same type. The cached objects
+    are reused while the items of the collection are the same
+    (e.g., no item was added, removed or replaced).
     """
 
-    def __get__(self, obj, objtype=None):
-        """Get the key value."""
-        objdata = self.get_key(obj)
-        return py_.map(objdata, lambda data: self.resolve_class(data))
+    def _cacheable(self, objdata):
+        """Check if the value can be cached (i.e., it shares the item documents)."""
+        return isinstance(objdata, list) and all(
+            isinstance(item, dict) for item in objdata
+        )
+
+    def _snapshot(self, objdata):
+        """State of the field data used to validate the cached value."""
+        return tuple(objdata)
+
+    def _changed(self, snapshot, objdata):
+        """Check if the collection items changed after the value was cached."""
+        objdata = objdata or ()
+        return len(snapshot) != len(objdata) or not all(
+            map(operator.is_, snapshot, objdata)
+        )
+
+    def _cached_value(self, value):
+        """Value returned from the cache (the list can be changed by the caller)."""
+        return list(value)
+
+    def resolve_value(self, objdata, client=None):
+        """Resolve the field data in the field value."""
+        return [
+            self._share(self.resolve_class(data, client), data)
+            for data in objdata or []
+        ]
 
 
 class LinkField(ObjectField):
@@ -104,19 +211,66 @@ class LinkField(ObjectField):
     in a ``User-Defined class`` object.
     """
 
-    def resolve_link(self, model: "BaseModel", http_method="GET"):
-        """Resolve a link."""
+    def _get_client(self, model: "BaseModel"):
+        """Get the client used to resolve the links of a model."""
         model.has_field(self._key)
 
-        response = HTTPXClient.request(http_method, model.get_field(self._key)).json()
-        if py_.has(response, "hits.hits"):  # for the `version` attribute
+        client = model._client
+        if client is None:
+            raise RuntimeError(
+                "Links are only available for objects loaded from the Storm WS."
+            )
+        return client
+
+    def _resolve_document(self, document, client):
+        """Resolve a link document in a ``valid class``."""
+        if py_.has(document, "hits.hits"):  # for the `version` attribute
             return [
-                ObjectFactory.resolve(self._class_name, r)
-                for r in py_.get(response, "hits.hits")
+                self.resolve_class(r, client) for r in py_.get(document, "hits.hits")
             ]
 
-        return ObjectFactory.resolve(self._class_name, response)
+        return self.resolve_class(document, client)
+
+    def resolve_link(self, model: "BaseModel", http_method="GET"):
+        """Resolve a link."""
+        client = self._get_client(model)
+
+        response = client.request(http_method, model.get_field(self._key)).json()
+        return self._resolve_document(response, client)
 
     def __get__(self, obj, objtype=None):
         """Get the key value."""
+        if obj is None:
+            return self
         return self.resolve_link(obj)
+
+
+class RecordLinkField(LinkField):
+    """Link to published (immutable) records.
+
+    When the client has a record cache, the documents returned by
+    the link are stored in the cache and, when ``cached=True``, the
+    link is resolved from the cache without requesting the Storm WS.
+    """
+
+    def __init__(self, key, class_name, default=None, cached=True):
+        """Initializer"""
+        super(RecordLinkField, self).__init__(key, class_name, default)
+        self._cached = cached
+
+    def resolve_link(self, model: "BaseModel", http_method="GET"):
+        """Resolve a link."""
+        client = self._get_client(model)
+
+        cache = client.record_cache
+        if cache is None or http_method != "GET":
+            return super().resolve_link(model, http_method)
+
+        url = model.get_field(self._key)
+
+        document = cache.get(url) if self._cached else None
+        if document is None:
+            document = client.request(http_method, url).json()
+            cache.put(url, document)
+
+        return self._resolve_document(document, client)
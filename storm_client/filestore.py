@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager local file store.
+
+The ``FileStore`` keeps one copy of each file content (blob), addressed
+by its md5 checksum. Files downloaded from many compendia (or versions
+of the same compendium) are materialized from the store, so identical
+contents are downloaded and stored only once.
+"""
+
+import asyncio
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, Union
+
+from .hashing import async_file_checksum, checksum_value
+
+FICLONE = 0x40049409
+"""Linux ``ioctl`` request to clone (reflink) a file (``FICLONE``)."""
+
+
+def reflink(source: Union[str, Path], target: Union[str, Path]):
+    """Create a copy-on-write clone of a file.
+
+    Raises:
+        OSError: When the file system doesn't support clones.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError("Reflinks are not supported in this platform.")
+
+    with open(source, "rb") as source_file, open(target, "wb") as target_file:
+        try:
+            fcntl.ioctl(target_file.fileno(), FICLONE, source_file.fileno())
+        except OSError:
+            target_file.close()
+            os.unlink(target)
+            raise
+
+
+class FileStore:
+    """Content-addressed store of the compendia files.
+
+    The files are materialized from the store using (in order of
+    preference):
+
+      - ``reflink``: copy-on-write clone (e.g., ``btrfs``, ``xfs``);
+      - ``hardlink``: the file shares the content with the store;
+      - ``copy``: a regular copy.
+
+    Note:
+        The blobs are read-only, so the files materialized by hardlinks
+        are read-only too (``0o444``): changing them in place would change
+        the store content. Use ``writable=True`` when the materialized files
+        must be writable (the hardlinks are not used).
+    """
+
+    link_modes = ("reflink", "hardlink", "copy")
+    """Available link modes."""
+
+    def __init__(
+        self, root: Union[str, Path], link_modes=link_modes, writable: bool = False
+    ):
+        """Initializer.
+
+        Args:
+            root (Union[str, Path]): Store directory.
+
+            link_modes (tuple): Methods used (in order) to materialize the files.
+
+            writable (bool): Flag indicating that the materialized files must be
+                             writable, so they are not created as hardlinks.
+        """
+        self.root = Path(root)
+        self.link_modes = tuple(
+            mode for mode in link_modes if not (writable and mode == "hardlink")
+        )
+        self.writable = writable
+
+        # blobs being downloaded (``(event loop, digest) -> task``).
+        self._fetches = {}
+        self._fetches_lock = threading.Lock()
+
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        (self.root / "tmp").mkdir(parents=True, exist_ok=True)
+
+    def path(self, checksum: str) -> Path:
+        """Path of a blob in the store.
+
+        Args:
+            checksum (str): Blob checksum (``md5:<hexdigest>`` or ``<hexdigest>``).
+        """
+        digest = checksum_value(checksum)
+        return self.root / "objects" / digest[:2] / digest[2:]
+
+    def has(self, checksum: str) -> bool:
+        """Check if a blob is available in the store."""
+        return self.path(checksum).exists()
+
+    async def fetch(self, checksum: str, download: Callable[[Path], Awaitable]) -> Path:
+        """Get a blob, downloading it if it is not available in the store.
+
+        Concurrent fetches of the same blob (e.g., duplicated files in a
+        compendium) wait for a single download.
+
+        Args:
+            checksum (str): Blob checksum (``md5:<hexdigest>``).
+
+            download (Callable[[Path], Awaitable]): Coroutine function that downloads
+                                                    the blob in the given path.
+
+        Returns:
+            Path: Path of the blob in the store.
+
+        Raises:
+            RuntimeError: When the downloaded content doesn't match the checksum.
+        """
+        if self.has(checksum):
+            return self.path(checksum)
+
+        loop = asyncio.get_running_loop()
+        key = (loop, checksum_value(checksum))
+
+        with self._fetches_lock:
+            task = self._fetches.get(key)
+
+            if task is None:
+                task = loop.create_task(self._fetch(checksum, download))
+                task.add_done_callback(lambda _: self._fetches.pop(key, None))
+
+                self._fetches[key] = task
+
+        # a cancelled caller doesn't cancel the download of the other callers.
+        return await asyncio.shield(task)
+
+    async def _fetch(self, checksum: str, download: Callable[[Path], Awaitable]):
+        """Download a blob to the store."""
+        blob_path = self.path(checksum)
+
+        if blob_path.exists():
+            return blob_path
+
+        temporary_path = self.root / "tmp" / uuid.uuid4().hex
+        try:
+            await download(temporary_path)
+
+            # only valid contents are stored.
+            downloaded_checksum = await async_file_checksum(temporary_path)
+            if checksum_value(downloaded_checksum) != checksum_value(checksum):
+                raise RuntimeError(f"Checksum for {checksum} is not valid!")
+
+            os.chmod(temporary_path, 0o444)
+
+            blob_path.parent.mkdir(exist_ok=True)
+            os.replace(temporary_path, blob_path)
+        finally:
+            if temporary_path.exists():
+                temporary_path.unlink()
+
+        return blob_path
+
+    def materialize(self, checksum: str, target: Union[str, Path]) -> Path:
+        """Create a file with the content of a blob.
+
+        Args:
+            checksum (str): Blob checksum (``md5:<hexdigest>``).
+
+            target (Union[str, Path]): Path of the created file. Existing files
+                                       are replaced.
+
+        Returns:
+            Path: Path of the created file.
+        """
+        source, target = self.path(checksum), Path(target)
+
+        if target.exists() or target.is_symlink():
+            target.unlink()
+
+        for link_mode in self.link_modes:
+            try:
+                if link_mode == "reflink":
+                    reflink(source, target)
+                elif link_mode == "hardlink":
+                    os.link(source, target)
+                else:
+                    shutil.copyfile(source, target)
+                return target
+            except OSError:
+                continue
+
+        raise OSError(f"Unable to materialize {checksum} in {target}.")
+
+    async def materialize_async(self, checksum: str, target: Union[str, Path]):
+        """Create a file with the content of a blob without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.materialize, checksum, target)
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager file hashing utilities."""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Union
+
+from storm_hasher import StormHasher
+
+CHECKSUM_ALGORITHM = "md5"
+"""Checksum algorithm used by the Storm WS (fixed on the service)."""
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get the executor shared by all hashing operations.
+
+    ``hashlib`` releases the GIL while hashing the data, so a thread
+    pool (with one worker per core) is enough to scale the hashing
+    throughput with the available cores.
+    """
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix="storm-hashing"
+                )
+    return _executor
+
+
+def file_checksum(file_path: Union[str, Path]) -> str:
+    """Calculate the checksum of a file.
+
+    Args:
+        file_path (Union[str, Path]): Path to the file.
+
+    Returns:
+        str: File checksum in the Storm WS format (``<algorithm>:<hexdigest>``).
+    """
+    file_hash = StormHasher(CHECKSUM_ALGORITHM).hash_file(file_path)
+    return f"{CHECKSUM_ALGORITHM}:{file_hash}"
+
+
+def files_checksum(file_paths: Iterable[Union[str, Path]]) -> Dict:
+    """Calculate the checksum of multiple files in parallel.
+
+    Args:
+        file_paths (Iterable[Union[str, Path]]): Path to the files.
+
+    Returns:
+        dict: Dictionary with the file path as key and its checksum as value.
+    """
+    file_paths = list(file_paths)
+    return dict(zip(file_paths, get_executor().map(file_checksum, file_paths)))
+
+
+async def async_file_checksum(file_path: Union[str, Path]) -> str:
+    """Calculate the checksum of a file without blocking the event loop.
+
+    Args:
+        file_path (Union[str, Path]): Path to the file.
+
+    Returns:
+        str: File checksum in the Storm WS format (``<algorithm>:<hexdigest>``).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), file_checksum, file_path)
+
+
+def checksum_value(checksum: str) -> str:
+    """Get the hash value (without the algorithm prefix) of a Storm WS checksum."""
+    return checksum.split(":")[-1]
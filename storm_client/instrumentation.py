@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager client instrumentation.
+
+The ``HTTPXClient`` emits a ``RequestEvent`` for each request sent to
+the Storm WS. The events are delivered to the registered ``sinks``
+(e.g., ``LoggingSink``, ``CounterSink``, ``OpenTelemetrySink``).
+When no sink is registered, the requests are not measured at all.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import List
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+_ID_COLLECTIONS = {"projects", "compendia", "workflows", "executions", "deposits"}
+"""Path segments that are followed by a record ID in the Storm WS URLs."""
+
+_COLLECTION_ROUTES = {"services"}
+"""Path segments that are routes (not IDs) after a collection segment."""
+
+
+def url_template(url: str) -> str:
+    """Create the URL template (path without the IDs) of a Storm WS URL.
+
+    Example:
+        >>> url_template("http://storm/projects/p1/compendia/c1/files/a.csv/content")
+        '/projects/{id}/compendia/{id}/files/{key}/content'
+    """
+    segments = urlsplit(str(url)).path.split("/")
+
+    template = []
+    for idx, segment in enumerate(segments):
+        previous = segments[idx - 1] if idx else None
+
+        if segment == "files" and idx + 1 < len(segments):
+            # file keys can have ``/``: all segments until the
+            # file action (if any) are the key.
+            tail = segments[-1] if segments[-1] in ("content", "commit") else None
+            template.extend(["files", "{key}"] + ([tail] if tail else []))
+            break
+
+        if previous in _ID_COLLECTIONS and segment not in _COLLECTION_ROUTES:
+            segment = "{id}"
+        template.append(segment)
+
+    return "/".join(template)
+
+
+class RequestEvent:
+    """Measurements of a request sent to the Storm WS."""
+
+    __slots__ = (
+        "method",
+        "url",
+        "url_template",
+        "status_code",
+        "elapsed_connect",
+        "elapsed_ttfb",
+        "elapsed_total",
+        "request_bytes",
+        "response_bytes",
+        "retries",
+        "error",
+        "start_time",
+        "_start",
+    )
+
+    def __init__(self, method: str, url: str):
+        """Initializer.
+
+        Args:
+            method (str): HTTP method.
+
+            url (str): Requested URL.
+        """
+        self.method = method.upper()
+        self.url = str(url)
+        self.url_template = url_template(url)
+
+        self.status_code = None
+
+        self.elapsed_connect = None
+        """Time (in seconds) to connect with the server. Not provided by ``httpx``
+        (the connection pool hides the connection time), so it is always ``None``."""
+
+        self.elapsed_ttfb = None
+        """Time (in seconds) until the response headers are received."""
+
+        self.elapsed_total = None
+        """Time (in seconds) until the response content is received."""
+
+        self.request_bytes = None
+        self.response_bytes = None
+
+        self.retries = 0
+        self.error = None
+
+        self.start_time = time.time_ns()
+        self._start = time.perf_counter()
+
+    def response_received(self, response):
+        """Register the response headers (``httpx.Response``)."""
+        self.elapsed_ttfb = time.perf_counter() - self._start
+        self.status_code = response.status_code
+
+        content_length = response.request.headers.get("content-length")
+        if content_length is not None:
+            self.request_bytes = int(content_length)
+
+    def finish(self, response=None, retries: int = 0):
+        """Register the end of the request."""
+        self.elapsed_total = time.perf_counter() - self._start
+        self.retries = retries
+
+        if response is not None:
+            self.response_bytes = response.num_bytes_downloaded
+
+    def as_dict(self):
+        """Event as a dictionary."""
+        return {
+            slot: getattr(self, slot) for slot in self.__slots__ if slot != "_start"
+        }
+
+    def __repr__(self):
+        """Object representation."""
+        return (
+            f"RequestEvent({self.method} {self.url_template} "
+            f"status={self.status_code} total={self.elapsed_total})"
+        )
+
+
+class _DisabledEvent:
+    """Event used when the instrumentation is disabled (all operations are no-op)."""
+
+    retries = 0
+
+    def response_received(self, response):
+        """Ignore the response headers."""
+
+    def finish(self, response=None, retries=0):
+        """Ignore the end of the request."""
+
+
+_DISABLED_EVENT = _DisabledEvent()
+
+
+class Instrumentation:
+    """Registry of the sinks that receive the request events."""
+
+    def __init__(self, sinks: List = None):
+        """Initializer.
+
+        Args:
+            sinks (list): Objects with an ``emit(event)`` method.
+        """
+        self.sinks = list(sinks or [])
+
+    @property
+    def enabled(self):
+        """Flag indicating if there are sinks registered."""
+        return bool(self.sinks)
+
+    def add_sink(self, sink):
+        """Register a sink."""
+        self.sinks.append(sink)
+
+    def emit(self, event: RequestEvent):
+        """Deliver an event to the sinks.
+
+        Failures in the sinks are logged and never break the requests.
+        """
+        for sink in self.sinks:
+            try:
+                sink.emit(event)
+            except Exception:  # noqa
+                logger.exception("Instrumentation sink %r failed.", sink)
+
+    @contextmanager
+    def measure(self, method: str, url: str):
+        """Measure a request.
+
+        Yields:
+            RequestEvent: Event that must be updated with the response data.
+        """
+        if not self.sinks:
+            yield _DISABLED_EVENT
+            return
+
+        event = RequestEvent(method, url)
+        try:
+            yield event
+        except BaseException as error:
+            event.error = error
+            raise
+        finally:
+            if event.elapsed_total is None:
+                event.finish()
+            self.emit(event)
+
+
+class LoggingSink:
+    """Sink that writes the events in a ``logging.Logger``."""
+
+    def __init__(self, logger_name: str = "storm_client.requests", level=logging.INFO):
+        """Initializer.
+
+        Args:
+            logger_name (str): Name of the logger.
+
+            level (int): Logging level of the events.
+        """
+        self._logger = logging.getLogger(logger_name)
+        self._level = level
+
+    def emit(self, event: RequestEvent):
+        """Log an event."""
+        self._logger.log(
+            self._level,
+            "%s %s status=%s ttfb=%.4fs total=%.4fs sent=%s received=%s retries=%d",
+            event.method,
+            event.url_template,
+            event.status_code,
+            event.elapsed_ttfb or 0,
+            event.elapsed_total or 0,
+            event.request_bytes,
+            event.response_bytes,
+            event.retries,
+        )
+
+
+class CounterSink:
+    """Sink that aggregates the events in Prometheus-style counters.
+
+    The counters are labeled by ``method``, ``url_template`` and ``status``.
+    """
+
+    def __init__(self):
+        """Initializer."""
+        self._lock = threading.Lock()
+        self.counters = {}
+
+    def _inc(self, name, labels, value):
+        """Increment a counter."""
+        key = (name, labels)
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def emit(self, event: RequestEvent):
+        """Aggregate an event."""
+        labels = (
+            ("method", event.method),
+            ("url_template", event.url_template),
+            ("status", str(event.status_code or "error")),
+        )
+
+        with self._lock:
+            self._inc("storm_client_requests_total", labels, 1)
+            self._inc("storm_client_request_retries_total", labels, event.retries)
+            self._inc(
+                "storm_client_request_duration_seconds_sum",
+                labels,
+                event.elapsed_total or 0,
+            )
+            self._inc(
+                "storm_client_request_bytes_total", labels, event.request_bytes or 0
+            )
+            self._inc(
+                "storm_client_response_bytes_total", labels, event.response_bytes or 0
+            )
+
+    def render(self) -> str:
+        """Render the counters in the Prometheus text exposition format."""
+        with self._lock:
+            counters = sorted(self.counters.items())
+
+        lines = []
+        for (name, labels), value in counters:
+            labels = ",".join(f'{key}="{value}"' for key, value in labels)
+            lines.append(f"{name}{{{labels}}} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySink:
+    """Sink that creates an OpenTelemetry span for each event.
+
+    Note:
+        This sink requires the ``opentelemetry-api`` package.
+    """
+
+    def __init__(self, tracer=None):
+        """Initializer.
+
+        Args:
+            tracer (opentelemetry.trace.Tracer): Tracer used to create the spans. If
+                                                 not defined, the global tracer is used.
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "OpenTelemetrySink requires the ``opentelemetry-api`` package."
+            )
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer("storm_client")
+
+    def emit(self, event: RequestEvent):
+        """Create a span for an event."""
+        span = self._tracer.start_span(
+            f"{event.method} {event.url_template}",
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=event.start_time,
+            attributes={
+                "http.method": event.method,
+                "http.url": event.url,
+                "http.route": event.url_template,
+                "http.status_code": event.status_code or 0,
+                "http.request_content_length": event.request_bytes or 0,
+                "http.response_content_length": event.response_bytes or 0,
+                "storm.retries": event.retries,
+                "storm.ttfb": event.elapsed_ttfb or 0,
+            },
+        )
+
+        if event.error is not None:
+            span.record_exception(event.error)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+        span.end(end_time=event.start_time + int((event.elapsed_total or 0) * 1e9))
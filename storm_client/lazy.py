@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager deferred imports.
+
+The heavy dependencies (e.g., ``httpx`` and ``asyncio``) are only needed
+when the first request is sent (or the first record is exported), so
+``import storm_client`` (and creating a ``Storm`` client) doesn't import
+them. The modules are attributes of this module, imported on their first
+use:
+
+Example:
+    >>> from storm_client import lazy
+    >>> client = lazy.httpx.Client()
+
+Note:
+    The optional dependencies (e.g., ``pyarrow`` or ``zstandard``) are still
+    imported where they are used, so a missing package raises an
+    ``ImportError`` with the installation instructions.
+"""
+
+from importlib import import_module
+
+DEFERRED_MODULES = {
+    "aiofiles": "aiofiles",
+    "asyncio": "asyncio",
+    "email_utils": "email.utils",
+    "filestore": "storm_client.filestore",
+    "httpx": "httpx",
+    "pydash": "pydash",
+}
+"""Deferred modules (attribute and module name)."""
+
+
+def __getattr__(name):
+    """Import a deferred module (cached as an attribute after the first use)."""
+    if name not in DEFERRED_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(DEFERRED_MODULES[name])
+    globals()[name] = module
+
+    return module
@@ -5,18 +5,51 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from importlib import import_module
 from ..object_factory import ObjectFactory
 
-DATA_MODELS = [
-    "storm_client.models.execution",
-    "storm_client.models.project",
-    "storm_client.models.deposit",
-    "storm_client.models.workflow",
-    "storm_client.models.compendium",
-]
+DATA_MODELS = {
+    "storm_client.models.execution": [
+        "ExecutionJob",
+        "ExecutionJobPluginService",
+        "ExecutionJobList",
+        "ExecutionJobServiceList",
+        "ExecutionJobLink",
+        "ExecutionJobActionLink",
+    ],
+    "storm_client.models.project": ["Project", "ProjectList"],
+    "storm_client.models.deposit": [
+        "DepositJob",
+        "DepositJobPluginService",
+        "DepositJobList",
+        "DepositJobServiceList",
+        "DepositJobLink",
+        "DepositJobActionLink",
+    ],
+    "storm_client.models.workflow": [
+        "Workflow",
+        "WorkflowList",
+        "WorkflowLink",
+        "WorkflowActionLink",
+    ],
+    "storm_client.models.compendium": [
+        "CompendiumDraft",
+        "CompendiumFiles",
+        "CompendiumRecord",
+        "CompendiumDraftLink",
+        "CompendiumRecordLink",
+        "CompendiumRecordList",
+        "CompendiumFileMetadata",
+        "ExecutionDescriptor",
+        "CompendiumFileLink",
+    ],
+}
+"""Models (by module) registered in the object factory.
+
+The modules are imported (and their models registered) only when one
+of their models is used for the first time.
+"""
 
 # initializing the models
-for module in DATA_MODELS:
-    mod = import_module(module)
-    mod.init_model(ObjectFactory)
+for module, names in DATA_MODELS.items():
+    for name in names:
+        ObjectFactory.register_lazy(name, module)
@@ -8,8 +8,10 @@
 from pydash import py_
 from abc import ABC, abstractmethod
 
-from collections import UserDict
+from collections import UserDict, UserList
+from typing import Dict, Iterable, List, Union
 
+from ..export import columns_getters
 from ..field import DictField
 
 
@@ -34,6 +36,9 @@ class BaseModel(UserDict, ABC):
     url = DictField("links.self")
     """Link to this object in the service."""
 
+    _client = None
+    """Client (``HTTPXClient``) used to resolve the object links in the Storm WS."""
+
     def _set_default_value(self, property_path, value):
         """Define default values in the ``UserDict.data`` attribute."""
         return py_.defaults_deep(self.data, py_.set_({}, property_path, value))
@@ -47,6 +52,29 @@ class BaseModel(UserDict, ABC):
         if not py_.has(self.data, field):
             raise AttributeError(f"{field} attribute not available for this object!")
 
+    def __getstate__(self):
+        """State of the object (e.g., for ``pickle``).
+
+        The bound client (and the objects cached by the fields, which
+        are bound to it) are not part of the state, so the copies must
+        be bound to a client again (the services do it when they receive
+        an object without client).
+        """
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("_client", "_field_cache")
+        }
+
+    def __copy__(self):
+        """Shallow copy of the object (the cached field objects aren't shared)."""
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+
+        copied.__dict__["data"] = self.data.copy()
+        copied.__dict__.pop("_field_cache", None)
+        return copied
+
     def for_json(self):  # ``simplejson`` encoder method
         """Encode the object into a dict-like serializable object."""
         return self.data
@@ -67,3 +95,74 @@ class VersionedModel(BaseModel):
     def diff(self):
         """Generate a difference between the original
         state and the actual state."""
+
+
+class BaseModelList(UserList):
+    """Base class for the storm-client collections (e.g., search results).
+
+    The collections can be converted in columnar structures (e.g.,
+    ``pandas.DataFrame``), built directly from the documents of the
+    objects, without using the model fields.
+    """
+
+    def documents(self) -> List[Dict]:
+        """Documents (raw data) of the objects in the collection."""
+        return [obj.data if isinstance(obj, UserDict) else obj for obj in self.data]
+
+    def to_columns(self, columns: Union[Dict, Iterable[str]] = None) -> Dict[str, List]:
+        """Create the columns of the collection.
+
+        Args:
+            columns (Union[dict, Iterable[str]]): Columns (name and dotted path, or
+                                                  function, of the value) or a list
+                                                  of dotted paths. If not defined,
+                                                  the ``DEFAULT_COLUMNS`` (from
+                                                  ``storm_client.export``) are used.
+
+        Returns:
+            dict: Column name and values.
+        """
+        documents = self.documents()
+
+        return {
+            name: [get(document) for document in documents]
+            for name, get in columns_getters(columns).items()
+        }
+
+    def to_frame(self, columns: Union[Dict, Iterable[str]] = None):
+        """Create a ``pandas.DataFrame`` of the collection.
+
+        Args:
+            columns (Union[dict, Iterable[str]]): Columns (see ``to_columns``).
+
+        Returns:
+            pandas.DataFrame: Data frame with one row per object.
+
+        Note:
+            This method requires the ``pandas`` package.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("to_frame requires the ``pandas`` package.")
+
+        return pd.DataFrame(self.to_columns(columns))
+
+    def to_arrow(self, columns: Union[Dict, Iterable[str]] = None):
+        """Create a ``pyarrow.Table`` of the collection.
+
+        Args:
+            columns (Union[dict, Iterable[str]]): Columns (see ``to_columns``).
+
+        Returns:
+            pyarrow.Table: Table with one row per object.
+
+        Note:
+            This method requires the ``pyarrow`` package.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("to_arrow requires the ``pyarrow`` package.")
+
+        return pa.table(self.to_columns(columns))
@@ -6,13 +6,13 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from pathlib import Path
-from typing import Union
-
-from storm_hasher import StormHasher
+from typing import List, Union
 
 from ..base import BaseModel
-from ...network import HTTPXClient
+from ...compression import accepted_encodings
 from ...field import DictField, ObjectCollectionField, ObjectField
+from ...filestore import FileStore
+from ...hashing import async_file_checksum, checksum_value
 
 
 class CompendiumFiles(BaseModel):
@@ -73,7 +73,12 @@ class CompendiumFileMetadata(BaseModel):
         super(CompendiumFileMetadata, self).__init__(data or {})
 
     async def download(
-        self, output_directory: Union[str, Path], validate_checksum: bool = False
+        self,
+        output_directory: Union[str, Path],
+        validate_checksum: bool = False,
+        store: FileStore = None,
+        compression: Union[str, List[str], None] = None,
+        segments: int = 1,
     ):
         """Download the file entry content.
 
@@ -82,21 +87,57 @@ class CompendiumFileMetadata(BaseModel):
 
             validate_checksum (bool): Flag indicating if the file content must be validate with the
                                       checksum provided by the Storm WS.
+
+            store (FileStore): Local file store. When defined, the content is only downloaded if
+                               it is not available in the store, and the file is created from
+                               the store (the store contents are always validated).
+
+            compression (Union[str, List[str]]): Accepted transfer compression (``gzip``,
+                                                 ``zstd``, a list of them or ``auto``). The
+                                                 content is decompressed while it is saved,
+                                                 so the checksum is validated against the
+                                                 uncompressed content.
+
+            segments (int): Number of byte ranges of the file downloaded in parallel
+                            (see ``HTTPXClient.download_segmented``). Segmented
+                            downloads are sent without compression and are always
+                            validated with the checksum (when it is available).
         """
         output_directory = Path(output_directory)
         file_content_link = self.links.content
 
+        accept_encoding = accepted_encodings(compression)
+        segmented = segments > 1 and bool(self.size)
+
+        def _download(path):
+            if segmented:
+                return self._client.download_segmented(
+                    file_content_link, path, self.size, segments
+                )
+            return self._client.download(file_content_link, path, accept_encoding)
+
         if file_content_link:
             output_file = output_directory / self.filename
 
+            # filenames can have directories (e.g., ``data/input.csv``).
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            if store is not None and self.checksum:
+                await store.fetch(self.checksum, _download)
+                return await store.materialize_async(self.checksum, output_file)
+
             # download!
-            await HTTPXClient.download(file_content_link, output_file)
+            await _download(output_file)
 
-            if validate_checksum:
-                # md5 is fixed on `Storm WS`.
-                downloaded_file_checksum = StormHasher("md5").hash_file(output_file)
+            # files without checksum (e.g., not committed) can't be validated.
+            if self.checksum and (validate_checksum or segmented):
+                # hashing outside the event loop thread, so the
+                # other downloads are not blocked.
+                downloaded_file_checksum = await async_file_checksum(output_file)
 
-                if downloaded_file_checksum != self.checksum.split(":")[-1]:
+                if checksum_value(downloaded_file_checksum) != checksum_value(
+                    self.checksum
+                ):
                     raise RuntimeError(f"Checksum for {self.filename} is not valid!")
 
             return output_file
@@ -6,7 +6,7 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from ..base import BaseModel
-from ...field import LinkField, DictField
+from ...field import LinkField, DictField, RecordLinkField
 
 
 class BaseCompendiumLink(BaseModel):
@@ -30,13 +30,18 @@ class CompendiumRecordLink(BaseCompendiumLink):
     # Data fields
     #
 
-    self = LinkField("self", "CompendiumRecord")
+    self = RecordLinkField("self", "CompendiumRecord")
     """Link to the Compendium (Record) itself."""
 
-    latest = LinkField("latest", "CompendiumRecord")
+    files = RecordLinkField("files", "CompendiumFiles")
+    """Link to the Compendium (Record) files."""
+
+    # the latest version and the versions index change
+    # when new versions are published.
+    latest = RecordLinkField("latest", "CompendiumRecord", cached=False)
     """Link to the last version of the Compendium ."""
 
-    versions = LinkField("versions", "CompendiumRecord")
+    versions = RecordLinkField("versions", "CompendiumRecord", cached=False)
     """Link to the Compendium versions index."""
 
     def __init__(self, data=None):
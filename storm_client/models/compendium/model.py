@@ -7,10 +7,9 @@
 
 from pydash import py_
 
-from collections import UserList
-
 from .type import is_draft
 from .base import CompendiumBase
+from ..base import BaseModelList
 
 from ...field import ObjectField, DictField
 
@@ -57,7 +56,7 @@ class CompendiumRecord(CompendiumBase):
     """Compendium record links."""
 
 
-class CompendiumRecordList(UserList):
+class CompendiumRecordList(BaseModelList):
     """A collection of Compendia (Draft and Records)."""
 
     def __init__(self, data=None):
@@ -67,8 +66,8 @@ class CompendiumRecordList(UserList):
         super(CompendiumRecordList, self).__init__(
             py_.map(
                 data,
-                lambda obj: CompendiumDraft(obj)
-                if is_draft(obj)
-                else CompendiumRecord(obj),
+                lambda obj: (
+                    CompendiumDraft(obj) if is_draft(obj) else CompendiumRecord(obj)
+                ),
             )
         )
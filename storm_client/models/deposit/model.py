@@ -6,9 +6,7 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from pydash import py_
-from collections import UserList
-
-from ..base import BaseModel
+from ..base import BaseModel, BaseModelList
 from ..extractor import IDExtractor
 from ...field import DictField, ObjectField
 
@@ -91,7 +89,7 @@ class DepositJobPluginService(BaseModel):
         super(DepositJobPluginService, self).__init__(data or kwargs or {})
 
 
-class DepositJobList(UserList):
+class DepositJobList(BaseModelList):
     """A collection of DepositsJob requests."""
 
     def __init__(self, data=None):
@@ -102,7 +100,7 @@ class DepositJobList(UserList):
         super(DepositJobList, self).__init__(data)
 
 
-class DepositJobServiceList(UserList):
+class DepositJobServiceList(BaseModelList):
     """A collection of Deposits Services."""
 
     def __init__(self, data=None):
@@ -6,9 +6,7 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from pydash import py_
-from collections import UserList
-
-from ..base import BaseModel
+from ..base import BaseModel, BaseModelList
 from ..extractor import IDExtractor
 from ...field import DictField, ObjectField
 
@@ -43,7 +41,7 @@ class ExecutionJob(BaseModel):
     workflow_id = DictField("workflow_id")
     """Deposit defined pipelines."""
 
-    links = ObjectField("links", "JobLink")
+    links = ObjectField("links", "ExecutionJobLink")
     """Job links."""
 
     def __init__(self, data=None, **kwargs):
@@ -87,7 +85,7 @@ class ExecutionJobPluginService(BaseModel):
         super(ExecutionJobPluginService, self).__init__(data or kwargs or {})
 
 
-class ExecutionJobList(UserList):
+class ExecutionJobList(BaseModelList):
     """A collection of Deposits requests."""
 
     def __init__(self, data=None):
@@ -98,7 +96,7 @@ class ExecutionJobList(UserList):
         super(ExecutionJobList, self).__init__(data)
 
 
-class ExecutionJobServiceList(UserList):
+class ExecutionJobServiceList(BaseModelList):
     """A collection of Job Services."""
 
     def __init__(self, data=None):
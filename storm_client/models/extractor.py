@@ -13,6 +13,11 @@ class IDExtractor:
     rules that should be applied in the
     Storm Client data classes objects to
     extract their ID in the Storm WS.
+
+    Note:
+        The rules are defined by class name and also apply to the
+        subclasses (e.g., a user-defined subclass of ``ExecutionJob``).
+        The rule of each type is resolved (following its MRO) once.
     """
 
     rules = {
@@ -29,9 +34,53 @@ class IDExtractor:
         "DepositJobPluginService": lambda x: x.id,
     }
 
+    _type_rules = {}
+    """Rule resolved for each type (including the subclasses)."""
+
+    @classmethod
+    def register(cls, name, rule):
+        """Define the rule used to extract the ID from the objects of a class.
+
+        Args:
+            name (str): Class name.
+
+            rule (Callable): Function that receives an object and returns its ID.
+        """
+        cls.rules[name] = rule
+        cls._type_rules.clear()
+
+    @classmethod
+    def rule(cls, objtype):
+        """Get the rule used to extract the ID from the objects of a type.
+
+        Args:
+            objtype (type): Object type.
+
+        Returns:
+            Callable: Extraction rule. If the type is not supported, ``None``
+                      is returned.
+        """
+        try:
+            return cls._type_rules[objtype]
+        except KeyError:
+            pass
+
+        _extract_rule = next(
+            (cls.rules[t.__name__] for t in objtype.__mro__ if t.__name__ in cls.rules),
+            None,
+        )
+
+        cls._type_rules[objtype] = _extract_rule
+        return _extract_rule
+
+    @classmethod
+    def supports(cls, obj):
+        """Check if the ID can be extracted from an object."""
+        return cls.rule(type(obj)) is not None
+
     @classmethod
     def extract(cls, obj):
         """Extract ID from object."""
-        _extract_rule = cls.rules.get(obj.__class__.__name__)
+        _extract_rule = cls.rule(type(obj))
         if _extract_rule:
-            return _extract_rule.__call__(obj)
+            return _extract_rule(obj)
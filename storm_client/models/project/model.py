@@ -7,9 +7,7 @@
 
 from pydash import py_
 
-from collections import UserList
-
-from ..base import BaseModel
+from ..base import BaseModel, BaseModelList
 from ...field import DictField
 
 
@@ -46,7 +44,7 @@ class Project(BaseModel):
         super(Project, self).__init__(data or kwargs or {})
 
 
-class ProjectList(UserList):
+class ProjectList(BaseModelList):
     """A collection of Research projects."""
 
     def __init__(self, data=None):
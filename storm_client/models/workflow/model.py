@@ -8,10 +8,8 @@
 import difflib
 
 from pydash import py_
-from collections import UserList
-
 from ...field import DictField, ObjectField
-from ..base import VersionedModel
+from ..base import BaseModelList, VersionedModel
 from ..extractor import IDExtractor
 
 
@@ -80,8 +78,7 @@ class Workflow(VersionedModel):
         compendia_types = (
             py_.chain([self._current_state, self._original_state])
             .flatten()
-            .map(lambda x: x.__class__.__name__)
-            .filter(lambda x: x not in IDExtractor.rules)
+            .reject(IDExtractor.supports)
             .value()
         )
         if compendia_types:
@@ -125,7 +122,7 @@ class Workflow(VersionedModel):
         return ("added", added), ("removed", removed)
 
 
-class WorkflowList(UserList):
+class WorkflowList(BaseModelList):
     """A collection of Research Workflow."""
 
     def __init__(self, data=None):
@@ -5,33 +5,112 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-import aiofiles
-import httpx
-from pydash import py_
-
+import os
+import threading
+from typing import Dict, List
+
+from . import lazy
+from .compression import CompressedFile, decompressor
+from .compression import accept_encoding as accept_encoding_header
+from .instrumentation import Instrumentation
 from .store import TokenStore
+from .throttling import Throttle
+from .transfer import MappedFile, preallocate, pwrite_all, segment_ranges
+
+
+def _check_client_config(client_config: Dict):
+    """Check if the dependencies required by a client configuration are installed."""
+    if client_config.get("http2"):
+        try:
+            import h2  # noqa
+        except ImportError:
+            raise ImportError(
+                "HTTP/2 support requires the ``h2`` package. "
+                "Install it with: pip install httpx[http2]"
+            )
 
 
 class HTTPXClient:
+    """HTTP client for the Storm WS.
+
+    Each client has its own credentials (``TokenStore``), configuration
+    and connection pool. So, multiple clients (e.g., for different users
+    or Storm WS deployments) can be used in parallel in the same process.
 
-    _client_config = {"timeout": 12, "verify": False}
+    With ``http2=True`` in the client configuration, the concurrent requests
+    are multiplexed in a single HTTP/2 connection (requires ``h2``).
+    """
+
+    default_client_config = {"timeout": 12, "verify": False}
     """Default client config."""
 
-    @classmethod
-    def _proxy_request(cls, request_options):
+    def __init__(
+        self,
+        token_store: TokenStore,
+        client_config: Dict = None,
+        instrumentation: Instrumentation = None,
+        throttle: Throttle = None,
+        record_cache: "RecordCache" = None,
+        request_compression: bool = False,
+    ):
+        """Initializer.
+
+        Args:
+            token_store (TokenStore): Store with the token used to access the Storm WS.
+
+            client_config (dict): ``httpx.Client`` configuration. If not defined, the
+                                  ``default_client_config`` is used.
+
+            instrumentation (Instrumentation): Instrumentation that receives the
+                                               measurements of the requests.
+
+            throttle (Throttle): Rate limit, concurrency limit and retry policy of
+                                 the requests.
+
+            record_cache (RecordCache): On-disk cache of the published Compendia. If
+                                        not defined, the records are not cached.
+
+            request_compression (bool): Flag indicating that the server decodes the
+                                        compressed request bodies (with the
+                                        ``Content-Encoding`` header). Required by
+                                        the compressed uploads.
+
+        See:
+            For more details about the ``httpx.Client``, please check the
+            official documentation: https://www.python-httpx.org/api/#client
+        """
+        self._token_store = token_store
+        self._client_config = client_config or dict(self.default_client_config)
+
+        _check_client_config(self._client_config)
+
+        self._client = None
+        self._client_lock = threading.Lock()
+
+        self.instrumentation = instrumentation or Instrumentation()
+        self.throttle = throttle or Throttle()
+        self.record_cache = record_cache
+        self.request_compression = request_compression
+
+    def __deepcopy__(self, memo):
+        """Copies of an object (e.g., ``py_.clone_deep``) share the same client."""
+        return self
+
+    def _proxy_request(self, request_options):
         """Proxy a request to add the authentication access token."""
 
         # proxing the request with the authentication header
-        service_access_token = TokenStore.get_token()
+        service_access_token = self._token_store.get_token()
 
         if service_access_token:
-            request_options = py_.merge(
-                request_options or {}, {"headers": {"x-api-key": service_access_token}}
-            )
+            request_options = dict(request_options or {})
+            request_options["headers"] = {
+                **dict(request_options.get("headers") or {}),
+                "x-api-key": service_access_token,
+            }
         return request_options
 
-    @classmethod
-    def set_client_config(cls, configuration):
+    def set_client_config(self, configuration):
         """Define the configuration for the ``httpx.Client``.
 
         Args:
@@ -41,10 +120,41 @@ class HTTPXClient:
             For more details about the ``httpx.Client``, please check the
             official documentation: https://www.python-httpx.org/api/#client
         """
-        cls._client_config = configuration
+        _check_client_config(configuration)
+
+        with self._client_lock:
+            self._client_config = configuration
 
-    @classmethod
-    def request(cls, method, url, **kwargs):
+            # the pooled client must be recreated
+            # with the new configuration.
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def _get_client(self):
+        """Get the pooled ``httpx.Client``.
+
+        The client is created on the first use and reused by all
+        synchronous requests, so the connections are kept alive
+        and shared between the threads.
+        """
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = lazy.httpx.Client(**self._client_config)
+        return self._client
+
+    def close(self):
+        """Close the connection pool (and the record cache)."""
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+        if self.record_cache is not None:
+            self.record_cache.close()
+
+    def request(self, method, url, **kwargs):
         """Synchronous HTTP request.
 
         Request an URL using the specified HTTP ``method``.
@@ -62,11 +172,45 @@ class HTTPXClient:
             This method is built on top of ``httpx``. For more details of options available, please,
             check the official documentation: https://www.python-httpx.org/
         """
-        with httpx.Client(**cls._client_config) as client:
-            return client.request(method, url, **cls._proxy_request(kwargs or {}))
+        request_options = self._proxy_request(kwargs or {})
+        client = self._get_client()
+
+        with self.instrumentation.measure(method, url) as event:
+            retries = 0
 
-    @classmethod
-    async def download(cls, url: str, output_file: str, **kwargs):
+            while True:
+                self.throttle.acquire()
+                try:
+                    response = self._send(client, method, url, request_options, event)
+                finally:
+                    self.throttle.release()
+
+                if not self.throttle.should_retry(response, retries):
+                    break
+
+                # file-like bodies must be sent again from the beginning.
+                data = request_options.get("data")
+                if hasattr(data, "seek"):
+                    data.seek(0)
+
+                retries += 1
+
+            event.finish(response, retries)
+        return response
+
+    def _send(self, client, method, url, request_options, event):
+        """Send a request (measuring it when the instrumentation is enabled)."""
+        if not self.instrumentation.enabled:
+            return client.request(method, url, **request_options)
+
+        with client.stream(method, url, **request_options) as response:
+            event.response_received(response)
+            response.read()
+        return response
+
+    async def download(
+        self, url: str, output_file: str, accept_encoding: List[str] = None, **kwargs
+    ):
         """Download a file.
 
         Args:
@@ -74,6 +218,12 @@ class HTTPXClient:
 
             output_file (str): Path where the file will be saved.
 
+            accept_encoding (List[str]): Compressed encodings (e.g., ``["gzip"]``)
+                                         accepted in the transfer. The content is
+                                         decompressed while it is saved. If not
+                                         defined, the content is requested without
+                                         compression.
+
             kwargs (dict): Extra parameters to ``http.AsyncClient.stream``.
 
         Returns:
@@ -83,18 +233,204 @@ class HTTPXClient:
             For more details about ``http.AsyncClient.stream`` options, please check
             the official documentation: https://www.python-httpx.org/api/#asyncclient
         """
-        request_args = cls._proxy_request(kwargs)
+        request_args = self._proxy_request(kwargs)
+        request_args["headers"] = {
+            **dict(request_args.get("headers") or {}),
+            "accept-encoding": accept_encoding_header(accept_encoding or []),
+        }
+
+        async with lazy.httpx.AsyncClient(**self._client_config) as client:
+            with self.instrumentation.measure("GET", url) as event:
+                retries = 0
+
+                while True:
+                    await self.throttle.acquire_async()
+                    try:
+                        async with client.stream(
+                            "GET", url, **request_args
+                        ) as response:
+                            event.response_received(response)
+
+                            if not self.throttle.should_retry(response, retries):
+                                await self._write_content(response, output_file)
+                                break
+                    finally:
+                        self.throttle.release()
+
+                    retries += 1
+
+                event.finish(response, retries)
+        return output_file
 
-        async with httpx.AsyncClient(**cls._client_config) as client:
-            async with client.stream("GET", url, **request_args) as response:
-                async with aiofiles.open(output_file, "wb") as ofile:
-                    async for chunk in response.aiter_bytes():
-                        await ofile.write(chunk)
+    async def download_segmented(
+        self, url: str, output_file: str, size: int, segments: int = 8, **kwargs
+    ):
+        """Download a file in segments (byte ranges requested in parallel).
+
+        The output file is preallocated with the file size and each segment is
+        written in its position (``os.pwrite``) as it is received, so a single
+        large file is transferred in parallel connections. Servers without range
+        support send the complete content in the first segment.
+
+        Args:
+            url (str): File URL.
+
+            output_file (str): Path where the file will be saved.
+
+            size (int): File size (in bytes), e.g., from the file metadata.
+
+            segments (int): Maximum number of segments. Small files are not split
+                            (see ``transfer.segment_ranges``).
+
+            kwargs (dict): Extra parameters to ``http.AsyncClient.stream``.
+
+        Returns:
+            str: The path to the downloaded file.
+
+        Raises:
+            RuntimeError: When the received content doesn't have the file size.
+        """
+        request_args = self._proxy_request(kwargs)
+
+        preallocate(output_file, size)
+        fd = os.open(output_file, os.O_WRONLY)
+
+        try:
+            async with lazy.httpx.AsyncClient(**self._client_config) as client:
+                written = await lazy.asyncio.gather(
+                    *[
+                        self._download_segment(client, url, request_args, fd, *segment)
+                        for segment in segment_ranges(size, segments)
+                    ]
+                )
+        finally:
+            os.close(fd)
+
+        if sum(written) != size:
+            raise RuntimeError(
+                f"Incomplete download of {output_file}: {sum(written)} of {size} bytes."
+            )
         return output_file
 
+    async def _download_segment(self, client, url, request_args, fd, start, end):
+        """Download a byte range (``[start, end)``) of a file in its position."""
+        headers = {
+            **dict(request_args.get("headers") or {}),
+            "accept-encoding": "identity",  # the offsets are from the stored content.
+        }
+
+        if end > start:
+            headers["range"] = f"bytes={start}-{end - 1}"
+
+        with self.instrumentation.measure("GET", url) as event:
+            retries = 0
+
+            while True:
+                await self.throttle.acquire_async()
+                try:
+                    async with client.stream(
+                        "GET", url, **{**request_args, "headers": headers}
+                    ) as response:
+                        event.response_received(response)
+
+                        if not self.throttle.should_retry(response, retries):
+                            response.raise_for_status()
+
+                            written = await self._write_segment(response, fd, start)
+                            break
+                finally:
+                    self.throttle.release()
+
+                retries += 1
+
+            event.finish(response, retries)
+        return written
+
     @staticmethod
-    def upload(method, url, file_path, **kwargs):
-        """Download a file.
+    async def _write_segment(response, fd, start, buffer_size=1024**2):
+        """Write the content of a (range) response in its position of a file."""
+        if response.status_code != 206:
+            # without range support, the complete content is written by the
+            # first segment.
+            if start:
+                return 0
+
+        elif not response.headers.get("content-range", "").startswith(
+            f"bytes {start}-"
+        ):
+            raise RuntimeError(
+                f"Unexpected content range: {response.headers.get('content-range')}"
+            )
+
+        loop = lazy.asyncio.get_running_loop()
+
+        offset = start
+        buffer = bytearray()
+
+        async for chunk in response.aiter_raw():
+            buffer += chunk
+
+            # writing outside the event loop thread, so the
+            # other segments are not blocked.
+            if len(buffer) >= buffer_size:
+                offset += await loop.run_in_executor(
+                    None, pwrite_all, fd, buffer, offset
+                )
+                buffer.clear()
+
+        if buffer:
+            offset += await loop.run_in_executor(None, pwrite_all, fd, buffer, offset)
+        return offset - start
+
+    @staticmethod
+    async def _write_content(response, output_file):
+        """Write the content of a streamed response (decompressing it)."""
+        encoding = response.headers.get("content-encoding")
+
+        try:
+            decoder = decompressor(encoding)
+            chunks = response.aiter_raw()
+        except ValueError:
+            # other encodings (e.g., ``br`` or multiple encodings) are
+            # decoded by ``httpx``.
+            decoder = decompressor("identity")
+            chunks = response.aiter_bytes()
+
+        # the size of uncompressed contents is known in advance.
+        size = response.headers.get("content-length")
+        preallocated = size is not None and (encoding or "identity") == "identity"
+
+        if preallocated:
+            preallocate(output_file, int(size))
+
+        written = 0
+        async with lazy.aiofiles.open(
+            output_file, "r+b" if preallocated else "wb"
+        ) as ofile:
+            async for chunk in chunks:
+                chunk = decoder.decompress(chunk)
+                written += len(chunk)
+
+                await ofile.write(chunk)
+
+            chunk = decoder.flush()
+            written += len(chunk)
+            await ofile.write(chunk)
+
+            # the server may send less data than announced.
+            if preallocated and written != int(size):
+                await ofile.truncate(written)
+
+    def upload(
+        self,
+        method,
+        url,
+        file_path,
+        encoding: str = None,
+        memory_map: bool = False,
+        **kwargs,
+    ):
+        """Upload a file.
 
         Args:
 
@@ -104,6 +440,14 @@ class HTTPXClient:
 
             file_path (str): File path.
 
+            encoding (str): Compression (``gzip`` or ``zstd``) applied (on-the-fly) to
+                            the content, sent with the ``Content-Encoding`` header. If
+                            not defined, the content is sent without compression.
+
+            memory_map (bool): Flag indicating that the (uncompressed) content is read
+                               from a memory map of the file, avoiding the copies of
+                               the chunks. Useful for very large files on fast disks.
+
             kwargs (dict): Extra parameters to ``http.Client.request``.
 
         Returns:
@@ -113,6 +457,23 @@ class HTTPXClient:
             For more details about ``http.Client.request`` options, please check
             the official documentation: https://www.python-httpx.org/api/#client
         """
-        return HTTPXClient.request(
-            method=method, url=url, data=open(file_path, "rb"), **kwargs
-        )
+        if encoding:
+            headers = {
+                **dict(kwargs.pop("headers", None) or {}),
+                "content-encoding": encoding,
+            }
+            content = CompressedFile(file_path, encoding)
+
+            return self.request(method, url, content=content, headers=headers, **kwargs)
+
+        if memory_map:
+            content = MappedFile(file_path)
+            headers = {
+                **dict(kwargs.pop("headers", None) or {}),
+                "content-length": str(len(content)),
+            }
+
+            return self.request(method, url, content=content, headers=headers, **kwargs)
+
+        with open(file_path, "rb") as data:
+            return self.request(method=method, url=url, data=data, **kwargs)
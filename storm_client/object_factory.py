@@ -7,20 +7,97 @@
 
 """SpatioTemporal Open Research Manager object factory."""
 
+import threading
+from collections import UserList
+from importlib import import_module
+
 
 class ObjectFactory:
     _factories = {}
 
+    generation = 0
+    """Registry version (incremented when a factory is registered).
+
+    The factories resolved by the data fields are reused while the
+    registry doesn't change. So, registering a subclass (e.g., of
+    ``ExecutionJob``) with the name of a model replaces the model in
+    the objects created afterwards.
+    """
+
+    _lazy_factories = {}
+    """Modules (by factory name) that register the factories on their first use."""
+
+    _lazy_lock = threading.RLock()
+
     @classmethod
     def register(cls, name, factory):
         cls._factories[name] = factory
+        cls.generation += 1
+
+    @classmethod
+    def register_lazy(cls, name, module):
+        """Register a factory defined in a module that is imported on its first use.
+
+        Args:
+            name (str): Factory name (e.g., ``ExecutionJob``).
+
+            module (str): Module path (e.g., ``storm_client.models.execution``). The
+                          module must have a ``init_model(factory)`` function, which
+                          registers its factories.
+        """
+        if name not in cls._factories:
+            cls._lazy_factories[name] = module
+
+    @classmethod
+    def _load(cls, name):
+        """Import the module of a lazy factory, registering its factories."""
+        with cls._lazy_lock:
+            if name not in cls._factories:
+                module = cls._lazy_factories[name]
+
+                # factories registered by the user (before the module is
+                # loaded) are not replaced by the module factories.
+                registered = {
+                    factory_name: cls._factories[factory_name]
+                    for factory_name, factory_module in cls._lazy_factories.items()
+                    if factory_module == module and factory_name in cls._factories
+                }
+
+                import_module(module).init_model(cls)
+                cls._factories.update(registered)
 
     @classmethod
     def exists(cls, name):
+        if name not in cls._factories and name in cls._lazy_factories:
+            cls._load(name)
         return name in cls._factories
 
+    @staticmethod
+    def bind(obj, client):
+        """Bind a client to an object (or to the objects of a collection).
+
+        The bound client is used by the object to resolve its links
+        in the Storm WS.
+        """
+        for item in obj if isinstance(obj, UserList) else [obj]:
+            item._client = client
+        return obj
+
     @classmethod
-    def resolve(cls, datatype, data):
+    def get(cls, datatype):
+        """Get the factory registered with a name.
+
+        Raises:
+            NotImplementedError: When the factory is not registered.
+        """
         if cls.exists(datatype):
-            return cls._factories[datatype](data)
+            return cls._factories[datatype]
         raise NotImplementedError(f"Factory for {datatype} is not implemented.")
+
+    @classmethod
+    def resolve(cls, datatype, data, client=None):
+        obj = cls.get(datatype)(data)
+
+        if client is not None:
+            cls.bind(obj, client)
+        return obj
@@ -6,10 +6,12 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 import posixpath
-from typing import Dict
+from typing import Dict, Iterable, Iterator
 
 import simplejson
 
+from ..concurrency import OperationResult, map_concurrently
+from ..export import DEFAULT_COLUMNS, export as export_records, scan as scan_records
 from ..models.base import BaseModel
 from ..network import HTTPXClient
 from ..object_factory import ObjectFactory
@@ -31,10 +33,25 @@ class BaseService:
             return self._service_url
         return posixpath.join(self._service_url, self._base_path)
 
-    def __init__(self, service_url: str, base_path: str = None, **kwargs) -> None:
+    def __init__(
+        self,
+        service_url: str,
+        base_path: str = None,
+        client: HTTPXClient = None,
+        **kwargs
+    ) -> None:
         self._base_path = base_path
         self._service_url = service_url
 
+        self._client = client
+
+    def _bind(self, obj):
+        """Bind the service client to an object without one (e.g., created by the
+        user), so its links can be resolved in the Storm WS."""
+        if getattr(obj, "_client", True) is None:
+            ObjectFactory.bind(obj, self._client)
+        return obj
+
     def _build_url(self, paths):
         """Create a valid url based on a list of paths."""
         if not isinstance(paths, list):
@@ -53,7 +70,7 @@ class BaseService:
                 simplejson.dumps(kwargs.get("json", {}), for_json=True)
             )
 
-        response = HTTPXClient.request(method, url, **kwargs or {})
+        response = self._client.request(method, url, **kwargs or {})
 
         if raise_exception:
             response.raise_for_status()
@@ -67,8 +84,8 @@ class RecordHandlerService(BaseService):
     data in the Storm WS.
     """
 
-    def __init__(self, url: str) -> None:
-        super(RecordHandlerService, self).__init__(url, self.base_path)
+    def __init__(self, url: str, client: HTTPXClient) -> None:
+        super(RecordHandlerService, self).__init__(url, self.base_path, client)
 
     def _create_data_handle_request(
         self,
@@ -114,8 +131,8 @@ class RecordOperatorService(BaseService):
     by the Storm WS.
     """
 
-    def __init__(self, url: str) -> None:
-        super(RecordOperatorService, self).__init__(url, self.base_path)
+    def __init__(self, url: str, client: HTTPXClient) -> None:
+        super(RecordOperatorService, self).__init__(url, self.base_path, client)
 
     def _create_op_search(
         self, result_type: str, request_options: Dict = None, **kwargs
@@ -134,7 +151,7 @@ class RecordOperatorService(BaseService):
             "GET", self.url, params=kwargs, **request_options or {}
         )
 
-        return ObjectFactory.resolve(result_type, operation_result.json())
+        return ObjectFactory.resolve(result_type, operation_result.json(), self._client)
 
     def _create_op_create(self, data, result_type: str, request_options=None):
         """Create a new Record in the Storm WS.
@@ -155,7 +172,7 @@ class RecordOperatorService(BaseService):
             "POST", self.url, json=data, **request_options or {}
         )
 
-        return ObjectFactory.resolve(result_type, operation_result.json())
+        return ObjectFactory.resolve(result_type, operation_result.json(), self._client)
 
     def _create_op_get(
         self, record_id: str, result_type: str, request_options: Dict = None
@@ -179,7 +196,7 @@ class RecordOperatorService(BaseService):
             "GET", operation_url, **request_options or {}
         )
 
-        return ObjectFactory.resolve(result_type, operation_result.json())
+        return ObjectFactory.resolve(result_type, operation_result.json(), self._client)
 
     def _create_op_save(self, data, result_type: str, request_options: Dict = None):
         """Update an existing Record in the Storm WS.
@@ -201,7 +218,7 @@ class RecordOperatorService(BaseService):
             "PUT", operation_url, json=data, **request_options or {}
         )
 
-        return ObjectFactory.resolve(result_type, operation_result.json())
+        return ObjectFactory.resolve(result_type, operation_result.json(), self._client)
 
     def _create_op_delete(self, record_id, request_options: Dict = None):
         """Delete an existing Record from the Storm WS.
@@ -246,3 +263,119 @@ class RecordOperatorService(BaseService):
         return self._create_request(
             method, operation_url, **request_options or {}
         ).json()
+
+    def scan(
+        self, page_size: int = 500, request_options: Dict = None, **kwargs
+    ) -> Iterator[Dict]:
+        """Iterate over all records of a search, requesting one page at a time.
+
+        Unlike ``search``, the records are not loaded in memory (or converted
+        in model objects), so this method can be used with millions of records.
+
+        Args:
+            page_size (int): Number of records requested in each page.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            **kwargs (dict): Search parameters.
+
+        Yields:
+            dict: Record document.
+        """
+        return scan_records(
+            self._client, self.url, page_size, request_options, **kwargs
+        )
+
+    def export(
+        self,
+        output,
+        output_format: str = "ndjson",
+        columns: Dict = DEFAULT_COLUMNS,
+        page_size: int = 500,
+        request_options: Dict = None,
+        **kwargs
+    ) -> int:
+        """Export the records of a search (streaming the search pages to the output).
+
+        Args:
+            output (Union[str, Path, IO]): Output file (path or file object).
+
+            output_format (str): Export format (``ndjson`` or ``parquet``).
+
+            columns (dict): Flattened columns (name and dotted path, or function, of
+                            the value). See ``storm_client.export.DEFAULT_COLUMNS``.
+
+            page_size (int): Number of records requested in each page.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            **kwargs (dict): Search parameters.
+
+        Returns:
+            int: Number of exported records.
+
+        Note:
+            The ``parquet`` format requires the ``pyarrow`` package.
+        """
+        return export_records(
+            self.scan(page_size, request_options, **kwargs),
+            output,
+            output_format,
+            columns,
+        )
+
+    def create_many(
+        self, records: Iterable, max_workers: int = 8, request_options: Dict = None
+    ) -> Iterator[OperationResult]:
+        """Create multiple Records in the Storm WS.
+
+        The records are sent concurrently (at most ``max_workers`` requests
+        in flight) using the service ``create`` method.
+
+        Args:
+            records (Iterable): Record objects to be created in the Storm WS.
+
+            max_workers (int): Maximum number of concurrent requests.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+        Yields:
+            OperationResult: Result for each record, as soon as it is completed. The
+                             created Record is available in ``result`` and failures
+                             are reported in ``error``.
+
+        See:
+            For more details about ``httpx.Client.request`` options, please check
+            the official documentation: https://www.python-httpx.org/api/#client
+        """
+        return map_concurrently(
+            lambda record: self.create(record, request_options), records, max_workers
+        )
+
+    def save_many(
+        self, records: Iterable, max_workers: int = 8, request_options: Dict = None
+    ) -> Iterator[OperationResult]:
+        """Update multiple existing Records in the Storm WS.
+
+        The records are sent concurrently (at most ``max_workers`` requests
+        in flight) using the service ``save`` method.
+
+        Args:
+            records (Iterable): Record objects to be saved in the Storm WS.
+
+            max_workers (int): Maximum number of concurrent requests.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+        Yields:
+            OperationResult: Result for each record, as soon as it is completed. The
+                             updated Record is available in ``result`` and failures
+                             are reported in ``error``.
+
+        See:
+            For more details about ``httpx.Client.request`` options, please check
+            the official documentation: https://www.python-httpx.org/api/#client
+        """
+        return map_concurrently(
+            lambda record: self.save(record, request_options), records, max_workers
+        )
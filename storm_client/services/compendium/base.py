@@ -52,4 +52,6 @@ class BaseCompendiumService(RecordHandlerService):
             "GET", operation_url, **request_options or {}
         )
 
-        return ObjectFactory.resolve(self.compendium_type, operation_result.json())
+        return ObjectFactory.resolve(
+            self.compendium_type, operation_result.json(), self._client
+        )
@@ -5,11 +5,12 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from typing import Dict
+from typing import Dict, Union
 from typeguard import typechecked
 
 from .base import BaseCompendiumService
 from ...models.compendium import (
+    CompendiumBase,
     CompendiumDraft,
     CompendiumRecord,
 )
@@ -23,6 +24,42 @@ class CompendiumRecordService(BaseCompendiumService):
     compendium_type = "CompendiumRecord"
     """Compendium type"""
 
+    def get(
+        self, compendium_id: str, request_options: Dict = None
+    ) -> Union[CompendiumBase, None]:
+        """Get an existing Compendium Record from Storm WS.
+
+        Published records can't be changed, so, when the client has a record
+        cache, the record is loaded from the cache (if available).
+
+        Args:
+            compendium_id (str): Compendium ID.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+        Returns:
+            CompendiumRecord: Compendium Record.
+
+        See:
+            For more details about ``http.Client.request`` options, please check
+            the official documentation: https://www.python-httpx.org/api/#client
+        """
+        cache = self._client.record_cache
+
+        if cache is not None:
+            document = cache.get_record(compendium_id)
+
+            if document is not None:
+                return ObjectFactory.resolve(
+                    self.compendium_type, document, self._client
+                )
+
+        compendium = super().get(compendium_id, request_options)
+
+        if cache is not None:
+            cache.put_record(compendium.data)
+        return compendium
+
     def new_version(
         self, compendium: CompendiumRecord, request_options: Dict = None
     ) -> CompendiumDraft:
@@ -41,11 +78,13 @@ class CompendiumRecordService(BaseCompendiumService):
             For more details about ``http.Client.request`` options, please check
             the official documentation: https://www.python-httpx.org/api/#client
         """
+        compendium = self._bind(compendium)
+
         response_data = self._create_data_handle_request(
             compendium, "links.versions", "POST", request_options
         )
 
-        return ObjectFactory.resolve("CompendiumDraft", response_data)
+        return ObjectFactory.resolve("CompendiumDraft", response_data, self._client)
 
 
 @typechecked
@@ -79,7 +118,9 @@ class CompendiumDraftService(BaseCompendiumService):
             "POST", self.url, json=compendium, **request_options or {}
         )
 
-        return ObjectFactory.resolve(self.compendium_type, operation_result.json())
+        return ObjectFactory.resolve(
+            self.compendium_type, operation_result.json(), self._client
+        )
 
     def save(self, compendium: CompendiumDraft, request_options: Dict = None):
         """Update an existing Compendium Draft in the Storm WS.
@@ -96,11 +137,13 @@ class CompendiumDraftService(BaseCompendiumService):
             For more details about ``http.Client.request`` options, please check
             the official documentation: https://www.python-httpx.org/api/#client
         """
+        compendium = self._bind(compendium)
+
         response_data = self._create_data_handle_request(
             compendium, "links.self", "PUT", request_options or {}
         )
 
-        return ObjectFactory.resolve("CompendiumDraft", response_data)
+        return ObjectFactory.resolve("CompendiumDraft", response_data, self._client)
 
     def publish(
         self, compendium: CompendiumDraft, request_options: Dict = None
@@ -123,8 +166,13 @@ class CompendiumDraftService(BaseCompendiumService):
             This action will publish the Compendium Draft, making a new Compendium Record,
             which is available to other users in the project
         """
+        compendium = self._bind(compendium)
+
         response_data = self._create_data_handle_request(
             compendium, "links.publish", "POST", request_options
         )
 
-        return ObjectFactory.resolve("CompendiumRecord", response_data)
+        if self._client.record_cache is not None:
+            self._client.record_cache.put_record(response_data)
+
+        return ObjectFactory.resolve("CompendiumRecord", response_data, self._client)
@@ -5,26 +5,74 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import hashlib
+import json
 import os
 from pathlib import Path
 
 import asyncio
 from pydash import py_
 
-from typing import Dict, List, Union
+from typing import Callable, Dict, Iterable, List, Union
 from typeguard import typechecked
 
+from ...bundle import (
+    RangeReader,
+    TarBundle,
+    bundle_names,
+    coalesce,
+    index_name,
+    unique_bundle_name,
+)
+from ...compression import check_encoding, select_encoding
+from ...concurrency import map_concurrently
+from ...hashing import CHECKSUM_ALGORITHM, checksum_value, file_checksum, files_checksum
 from ...network import HTTPXClient
+from ...object_factory import ObjectFactory
+from ...workspace import DirectorySync, match_path, scan_directory
 from .base import BaseCompendiumService
-from ...models.compendium import CompendiumBase, CompendiumDraft
+from ...models.compendium import (
+    CompendiumBase,
+    CompendiumDraft,
+    CompendiumFileMetadata,
+)
 
 
 @typechecked
 class CompendiumFileService(BaseCompendiumService):
     """Execution Compendium Files service."""
 
-    def __init__(self, url: str) -> None:
-        super(CompendiumFileService, self).__init__(url)
+    def __init__(self, url: str, client: HTTPXClient) -> None:
+        super(CompendiumFileService, self).__init__(url, client)
+
+    @staticmethod
+    def _map_files(operation: Callable, files: Iterable, max_workers: int) -> List:
+        """Apply an operation to many files concurrently.
+
+        All operations are completed before the first failure (in the
+        input order) is raised, so one invalid file doesn't stop the others.
+        """
+        results = sorted(
+            map_concurrently(operation, files, max_workers), key=lambda r: r.index
+        )
+
+        for result in results:
+            if not result.ok:
+                raise result.error
+        return [result.result for result in results]
+
+    def _define_files(
+        self, compendium: CompendiumDraft, files: List, request_options: Dict = None
+    ) -> Dict:
+        """Define files in a Compendium Draft, returning the files listing document."""
+        operation_url = compendium.get_field("links.files")
+
+        # preparing the files
+        files = py_.map(files, lambda x: {"key": os.path.join(x)})
+
+        return self._create_request(
+            "POST", operation_url, json=files, **request_options or {}
+        ).json()
 
     def define_files(
         self, compendium: CompendiumDraft, files: List, request_options: Dict = None
@@ -45,16 +93,17 @@ class CompendiumFileService(BaseCompendiumService):
             In the ``user context`` only the compendia created by the user is
             available.
         """
-        operation_url = compendium.get_field("links.files")
-
-        # preparing the files
-        files = py_.map(files, lambda x: {"key": os.path.join(x)})
+        compendium = self._bind(compendium)
 
-        self._create_request("POST", operation_url, json=files, **request_options or {})
+        self._define_files(compendium, files, request_options)
         return compendium.links.self
 
     def delete_defined_files(
-        self, compendium: CompendiumDraft, files: List, request_options: Dict = None
+        self,
+        compendium: CompendiumDraft,
+        files: List,
+        request_options: Dict = None,
+        max_workers: int = 8,
     ):
         """Delete already defined Compendium Draft files in the Storm WS.
 
@@ -65,91 +114,813 @@ class CompendiumFileService(BaseCompendiumService):
 
             request_options (dict): Parameters to the ``httpx.Client.request`` method.
 
+            max_workers (int): Maximum number of files deleted at the same time.
+
         Returns:
             CompendiumDraft: Updated compendium draft.
         """
-        files_to_delete = compendium.links.files
+        compendium = self._bind(compendium)
 
-        for file in files_to_delete.entries:
-            if file.filename in files:
-                self._create_request("DELETE", file.url, **request_options or {})
+        files = set(files)
 
+        self._delete_files(
+            [f for f in compendium.links.files.entries if f.filename in files],
+            request_options,
+            max_workers,
+        )
         return compendium.links.self
 
+    def _delete_files(
+        self, files: List, request_options: Dict = None, max_workers: int = 8
+    ):
+        """Delete Compendium Draft files (``CompendiumFileMetadata``) concurrently."""
+        self._map_files(
+            lambda file: self._create_request(
+                "DELETE", file.url, **request_options or {}
+            ),
+            files,
+            max_workers,
+        )
+
     def commit_defined_files(
-        self, compendium: CompendiumDraft, files: List, request_options: Dict = None
+        self,
+        compendium: CompendiumDraft,
+        files: List,
+        request_options: Dict = None,
+        max_workers: int = 8,
     ):
         """Commit already defined Compendium Draft files in the Storm WS.
 
         Args:
             compendium (CompendiumDraft): Compendium Draft object.
 
-            files (list): A list with the filename to delete.
+            files (list): A list with the filename to commit.
 
             request_options (dict): Parameters to the ``httpx.Client.request`` method.
 
+            max_workers (int): Maximum number of files committed at the same time.
+
         Returns:
             CompendiumDraft: Updated compendium draft.
         """
-        files_to_commit = compendium.links.files
+        compendium = self._bind(compendium)
 
-        for file in files_to_commit.entries:
-            if file.filename in files:
-                self._create_request("POST", file.links.commit, **request_options or {})
+        files = set(files)
 
+        self._map_files(
+            lambda file: self._create_request(
+                "POST", file.links.commit, **request_options or {}
+            ),
+            [f for f in compendium.links.files.entries if f.filename in files],
+            max_workers,
+        )
         return compendium.links.self
 
+    def select_changed_files(self, compendium: CompendiumDraft, files: Dict) -> Dict:
+        """Select the local files that are different from the Compendium Draft files.
+
+        The local files are compared (``size`` and ``md5`` checksum) with the files
+        already available in the Compendium Draft. A Compendium Draft created with
+        ``CompendiumRecordService.new_version`` carries the files of the previous
+        version, so only the changed/new files are selected.
+
+        Args:
+            compendium (CompendiumDraft): Compendium Draft object.
+
+            files (dict): Dictionary with the filename as key and the local file path as value.
+
+        Returns:
+            dict: Files (filename and local file path) that must be uploaded.
+        """
+        compendium = self._bind(compendium)
+
+        return self._changed_files(
+            compendium.links.files.entries,
+            {
+                filename: (file_path, os.path.getsize(file_path))
+                for filename, file_path in files.items()
+            },
+        )
+
+    @staticmethod
+    def _changed_files(entries: Iterable, files: Dict) -> Dict:
+        """Select the local files (filename and a tuple with the local file path and
+        size) that are different from the Compendium Draft files (``entries``)."""
+        compendium_files = {
+            file.filename: file
+            for file in entries
+            if file.checksum and file.status == "completed"
+        }
+
+        changed_files = {}
+        candidate_files = {}
+
+        for filename, (file_path, file_size) in files.items():
+            compendium_file = compendium_files.get(filename)
+
+            # the checksum is only calculated when the
+            # file size is the same.
+            if compendium_file and compendium_file.size == file_size:
+                candidate_files[filename] = file_path
+            else:
+                changed_files[filename] = file_path
+
+        # hashing the candidates in parallel.
+        candidate_checksums = files_checksum(candidate_files.values())
+
+        for filename, file_path in candidate_files.items():
+            if compendium_files[filename].checksum != candidate_checksums[file_path]:
+                changed_files[filename] = file_path
+        return changed_files
+
+    def _upload_file(
+        self,
+        file: CompendiumFileMetadata,
+        file_path: str,
+        commit_file: bool = False,
+        request_options: Dict = None,
+        compression: str = None,
+        memory_map: bool = False,
+    ):
+        """Upload the content of a defined file (and commit it)."""
+        encoding = select_encoding(file_path, compression)
+
+        response = self._client.upload(
+            "PUT",
+            file.links.content,
+            file_path,
+            encoding=encoding,
+            memory_map=memory_map,
+        )
+        response.raise_for_status()
+
+        if commit_file:
+            commit_url = py_.get(response.json(), "links.commit")
+            committed_file = self._create_request(
+                "POST", commit_url, **request_options or {}
+            ).json()
+
+            # the Storm WS checksum is calculated from the decompressed content.
+            committed_checksum = committed_file.get("checksum")
+
+            if (
+                encoding
+                and committed_checksum
+                and checksum_value(committed_checksum)
+                != checksum_value(file_checksum(file_path))
+            ):
+                raise RuntimeError(f"Checksum for {file.filename} is not valid!")
+
+    def _upload_content(
+        self,
+        file: CompendiumFileMetadata,
+        content,
+        commit_file: bool = False,
+        request_options: Dict = None,
+    ):
+        """Upload the content (bytes or sized iterable of bytes) of a defined file."""
+        response = self._client.request(
+            "PUT",
+            file.links.content,
+            content=content,
+            headers={"content-length": str(len(content))},
+        )
+        response.raise_for_status()
+
+        if commit_file:
+            commit_url = py_.get(response.json(), "links.commit")
+            self._create_request("POST", commit_url, **request_options or {})
+
+    def _define_and_upload_file(
+        self,
+        compendium: CompendiumDraft,
+        filename: str,
+        file_path: str,
+        commit_file: bool = False,
+        request_options: Dict = None,
+        compression: str = None,
+        memory_map: bool = False,
+    ):
+        """Define, upload and commit a single file."""
+        files_document = self._define_files(compendium, [filename], request_options)
+
+        file = ObjectFactory.resolve(
+            "CompendiumFileMetadata",
+            py_.find(files_document["entries"], {"key": filename}),
+            self._client,
+        )
+        self._upload_file(
+            file, file_path, commit_file, request_options, compression, memory_map
+        )
+
     def upload_files(
         self,
         compendium: CompendiumDraft,
         files: Dict,
         define_files: bool = False,
         commit_files: bool = False,
+        skip_unchanged: bool = False,
         request_options: Dict = None,
+        max_workers: int = 8,
+        pipeline: bool = False,
+        bundle_threshold: int = None,
+        compression: str = None,
+        memory_map: bool = False,
     ) -> CompendiumDraft:
         """Upload file content to the Storm WS.
 
         Args:
             compendium (CompendiumDraft): Compendium Draft object.
 
-            files (list): A list with the filename to delete.
+            files (dict): Dictionary with the filename as key and the local file path as value.
 
             define_files (bool): Flag indicating that the files must be defined in the Storm WS.
 
             commit_files (bool): Flag indicating that the files uploaded must be committed also.
 
+            skip_unchanged (bool): Flag indicating that only the files that differ
+                                   (``md5`` checksum) from the files already available in
+                                   the Compendium Draft (e.g., files from the previous
+                                   version) must be uploaded. The changed files are
+                                   (re)defined in the Storm WS before the upload.
+
             request_options (dict): Parameters to the ``httpx.Client.request`` method.
 
+            max_workers (int): Maximum number of files uploaded at the same time.
+
+            pipeline (bool): Flag indicating that each file is defined, uploaded and
+                             committed independently (requires ``define_files``),
+                             so the uploads start without waiting for all files
+                             to be defined. Useful for a few large files: each
+                             file is defined in its own request.
+
+            bundle_threshold (int): Files smaller than this size (in bytes) are packed
+                                    in a single bundle (see ``upload_bundle``). If not
+                                    defined, the files are uploaded individually.
+
+            compression (str): Compression applied (on-the-fly) to the uploaded
+                               contents (``gzip`` or ``zstd``). Already compressed
+                               files (e.g., ``.zip``) are sent without compression.
+                               The checksums of the committed files are validated
+                               against the local (uncompressed) files. The server must
+                               decode the compressed contents, so it requires a client
+                               created with ``request_compression=True``.
+
+            memory_map (bool): Flag indicating that the (uncompressed) contents are read
+                               from memory maps of the files (``mmap``), avoiding the
+                               copies of the chunks sent. Useful for very large files
+                               on fast disks.
+
         Returns:
             CompendiumDraft: Updated compendium draft.
+
+        Raises:
+            ValueError: When the compression isn't enabled in the client (or the
+                        encoding isn't supported).
         """
-        if define_files:
-            compendium = self.define_files(
-                compendium, list(files.keys()), request_options
-            )
+        compendium = self._bind(compendium)
 
-        compendium_files = compendium.links.files
-        for file in compendium_files.entries:
+        if compression:
+            if not self._client.request_compression:
+                raise ValueError(
+                    "Compressed uploads require a server that decodes the request "
+                    "contents. Enable them with ``request_compression=True``."
+                )
+            check_encoding(compression)
 
-            # selecting the file to upload
-            file_to_upload = files.get(file.filename)
+        if skip_unchanged:
+            files = self.select_changed_files(compendium, files)
 
-            # uploading
-            response = HTTPXClient.upload("PUT", file.links.content, file_to_upload)
+            if not files:
+                return compendium.links.self  # nothing to upload
 
-            if commit_files:
-                response_json = response.json()
+            # replacing the old versions of the changed files.
+            compendium = self.delete_defined_files(
+                compendium, list(files.keys()), request_options, max_workers
+            )
+            define_files = True
+
+        if bundle_threshold is not None:
+            small_files = {
+                filename: file_path
+                for filename, file_path in files.items()
+                if os.path.getsize(file_path) < bundle_threshold
+            }
+
+            if small_files:
+                compendium = self.upload_bundle(
+                    compendium,
+                    small_files,
+                    commit_files,
+                    request_options=request_options,
+                )
+                files = {f: p for f, p in files.items() if f not in small_files}
+
+                if not files:
+                    return compendium
+
+        if define_files and pipeline:
+            self._map_files(
+                lambda item: self._define_and_upload_file(
+                    compendium,
+                    *item,
+                    commit_files,
+                    request_options,
+                    compression,
+                    memory_map,
+                ),
+                files.items(),
+                max_workers,
+            )
+            return compendium.links.self  # reload from service
+
+        # the files listing returned by the definition is used to upload.
+        compendium_files = (
+            ObjectFactory.resolve(
+                "CompendiumFiles",
+                self._define_files(compendium, list(files.keys()), request_options),
+                self._client,
+            )
+            if define_files
+            else compendium.links.files
+        )
 
-                commit_url = py_.get(response_json, "links.commit")
-                self._create_request("POST", commit_url, **request_options or {})
+        self._map_files(
+            lambda file: self._upload_file(
+                file,
+                files[file.filename],
+                commit_files,
+                request_options,
+                compression,
+                memory_map,
+            ),
+            [f for f in compendium_files.entries if f.filename in files],
+            max_workers,
+        )
         return compendium.links.self  # reload from service
 
+    def upload_bundle(
+        self,
+        compendium: CompendiumDraft,
+        files: Dict,
+        commit_files: bool = True,
+        bundle_name: str = None,
+        request_options: Dict = None,
+    ) -> CompendiumDraft:
+        """Upload many (small) files as a single bundle (``tar`` archive).
+
+        The archive is generated while it is uploaded (it isn't staged on disk)
+        and an index manifest (``<bundle_name>.index.json``) with the position and
+        checksum of each file is uploaded with it. The files are read from the
+        bundle with ``read_bundle`` and ``extract_bundle``.
+
+        Args:
+            compendium (CompendiumDraft): Compendium Draft object.
+
+            files (dict): Dictionary with the filename (in the bundle) as key and the
+                          local file path as value.
+
+            commit_files (bool): Flag indicating that the bundle (and index) must be
+                                 committed.
+
+            bundle_name (str): Bundle filename in the Compendium Draft. If not defined,
+                               the first name not used in the Compendium Draft
+                               (``bundle.tar``, ``bundle-1.tar``, ...) is used.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+        Returns:
+            CompendiumDraft: Updated compendium draft.
+
+        Raises:
+            ValueError: When the bundle (or its index) already exists in the
+                        Compendium Draft.
+        """
+        compendium = self._bind(compendium)
+
+        filenames = [file.filename for file in compendium.links.files.entries]
+        if bundle_name is None:
+            bundle_name = unique_bundle_name(filenames)
+
+        elif bundle_name in filenames or index_name(bundle_name) in filenames:
+            raise ValueError(f"Bundle {bundle_name} already exists in the compendium.")
+
+        bundle = TarBundle(files)
+
+        files_document = self._define_files(
+            compendium, [bundle_name, index_name(bundle_name)], request_options
+        )
+        entries = {
+            entry["key"]: ObjectFactory.resolve(
+                "CompendiumFileMetadata", entry, self._client
+            )
+            for entry in files_document["entries"]
+        }
+
+        self._upload_content(
+            entries[bundle_name], bundle, commit_files, request_options
+        )
+
+        # the index (with the checksums) is available after the upload.
+        self._upload_content(
+            entries[index_name(bundle_name)],
+            json.dumps(bundle.index).encode(),
+            commit_files,
+            request_options,
+        )
+
+        return compendium.links.self
+
+    def _bundle_index(
+        self, entries: Dict, bundle_name: str, request_options: Dict = None
+    ):
+        """Get the content URL and the index of a bundle."""
+        if bundle_name not in entries or index_name(bundle_name) not in entries:
+            raise ValueError(
+                f"Bundle {bundle_name} is not available in the compendium."
+            )
+
+        index = self._create_request(
+            "GET",
+            entries[index_name(bundle_name)].links.content,
+            **request_options or {},
+        ).json()
+        return entries[bundle_name].links.content, index
+
+    def _read_bundle(
+        self,
+        compendium: CompendiumBase,
+        members: Union[List[str], None],
+        bundle_name: Union[str, None],
+        consume: Callable,
+        request_options: Dict = None,
+        max_workers: int = 8,
+    ):
+        """Read the members of the bundles (using range requests)."""
+        entries = {file.filename: file for file in compendium.links.files.entries}
+
+        names = [bundle_name] if bundle_name else bundle_names(entries)
+        if not names:
+            raise ValueError("No bundles available in the compendium.")
+
+        # the members of the later bundles replace the ones with the same name.
+        index_members = {}
+        for name in names:
+            content_url, index = self._bundle_index(entries, name, request_options)
+            reader = RangeReader(self._client, content_url, request_options)
+
+            for member in index["members"]:
+                index_members[member["key"]] = (reader, member)
+
+        if members is None:
+            members = list(index_members)
+
+        missing_members = [m for m in members if m not in index_members]
+        if missing_members:
+            raise ValueError(
+                f"Files not available in the bundles: {', '.join(missing_members)}"
+            )
+
+        reader_members = {}
+        for member in members:
+            reader, index_member = index_members[member]
+            reader_members.setdefault(reader, []).append(index_member)
+
+        def _read_span(item):
+            reader, (start, end, span_members) = item
+            data = reader.read(start, end)
+
+            for member in span_members:
+                offset = member["offset"] - start
+                content = data[offset : offset + member["size"]]
+
+                checksum = hashlib.new(CHECKSUM_ALGORITHM, content).hexdigest()
+                if f"{CHECKSUM_ALGORITHM}:{checksum}" != member["checksum"]:
+                    raise RuntimeError(f"Checksum for {member['key']} is not valid!")
+
+                consume(member["key"], content)
+
+        self._map_files(
+            _read_span,
+            [
+                (reader, span)
+                for reader, bundle_members in reader_members.items()
+                for span in coalesce(bundle_members)
+            ],
+            max_workers,
+        )
+
+    def read_bundle(
+        self,
+        compendium: CompendiumBase,
+        members: List[str] = None,
+        bundle_name: str = None,
+        request_options: Dict = None,
+        max_workers: int = 8,
+    ) -> Dict:
+        """Read (and validate) files from the bundles.
+
+        Only the byte ranges of the requested files are downloaded (close files
+        are read in the same request).
+
+        Args:
+            compendium (CompendiumBase): Compendium object.
+
+            members (List[str]): Filenames (in the bundle) to read. If not defined,
+                                 all files are read.
+
+            bundle_name (str): Bundle filename in the Compendium. If not defined,
+                               the files are read from all bundles (the files of
+                               the later bundles replace the ones with the same
+                               name).
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            max_workers (int): Maximum number of concurrent range requests.
+
+        Returns:
+            dict: Dictionary with the filename as key and the file content as value.
+        """
+        compendium = self._bind(compendium)
+
+        contents = {}
+
+        self._read_bundle(
+            compendium,
+            members,
+            bundle_name,
+            contents.__setitem__,
+            request_options,
+            max_workers,
+        )
+        return {member: contents[member] for member in members or contents}
+
+    def extract_bundle(
+        self,
+        compendium: CompendiumBase,
+        output_directory: Union[str, Path],
+        members: List[str] = None,
+        bundle_name: str = None,
+        request_options: Dict = None,
+        max_workers: int = 8,
+    ) -> Path:
+        """Extract (and validate) files from the bundles.
+
+        Args:
+            compendium (CompendiumBase): Compendium object.
+
+            output_directory (Union[str, Path]): Directory where the files are saved
+                                                 (with their paths in the bundle).
+
+            members (List[str]): Filenames (in the bundle) to extract. If not defined,
+                                 all files are extracted.
+
+            bundle_name (str): Bundle filename in the Compendium. If not defined,
+                               the files are read from all bundles (the files of
+                               the later bundles replace the ones with the same
+                               name).
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            max_workers (int): Maximum number of concurrent range requests.
+
+        Returns:
+            Path: Path to the output directory.
+        """
+        compendium = self._bind(compendium)
+
+        output_directory = Path(output_directory).resolve()
+
+        def _write(member, content):
+            file_path = (output_directory / member).resolve()
+
+            # members can't be written outside the output directory.
+            if output_directory not in file_path.parents:
+                raise ValueError(f"Invalid bundle member: {member}")
+
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_bytes(content)
+
+        self._read_bundle(
+            compendium, members, bundle_name, _write, request_options, max_workers
+        )
+        return output_directory
+
+    def sync_directory(
+        self,
+        compendium: CompendiumDraft,
+        path: Union[str, Path],
+        include: List[str] = None,
+        exclude: List[str] = None,
+        delete: bool = False,
+        commit_files: bool = True,
+        dry_run: bool = False,
+        request_options: Dict = None,
+        max_workers: int = 8,
+    ) -> DirectorySync:
+        """Synchronize a Compendium Draft with a local directory tree.
+
+        The local files are compared (``size`` and ``md5`` checksum) with the
+        Compendium Draft files, and only the new (or changed) files are defined,
+        uploaded and committed. The files are identified by their path relative
+        to the directory (e.g., ``outputs/data.csv``).
+
+        Args:
+            compendium (CompendiumDraft): Compendium Draft object.
+
+            path (Union[str, Path]): Directory path.
+
+            include (List[str]): Glob patterns (e.g., ``outputs/*.csv``) of the
+                                 synchronized files. If not defined, all files are used.
+
+            exclude (List[str]): Glob patterns of the ignored files and directories.
+
+            delete (bool): Flag indicating that the Compendium Draft files that are not
+                           available in the directory must be deleted. Only the files
+                           selected by the ``include`` and ``exclude`` patterns
+                           are deleted.
+
+            commit_files (bool): Flag indicating that the uploaded files must be
+                                 committed.
+
+            dry_run (bool): Flag indicating that the differences are only listed
+                            (the Compendium Draft is not changed).
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            max_workers (int): Maximum number of concurrent operations (e.g., uploads).
+
+        Returns:
+            DirectorySync: Uploaded, deleted and unchanged files, and the updated
+                           Compendium Draft (``compendium`` attribute).
+        """
+        compendium = self._bind(compendium)
+
+        local_files = scan_directory(path, include, exclude)
+
+        deleted = (
+            [
+                file.filename
+                for file in compendium.links.files.entries
+                if file.filename not in local_files
+                and match_path(file.filename, include, exclude)
+            ]
+            if delete
+            else []
+        )
+        return self._sync_files(
+            compendium,
+            local_files,
+            deleted,
+            commit_files,
+            dry_run,
+            request_options,
+            max_workers,
+        )
+
+    def sync_files(
+        self,
+        compendium: CompendiumDraft,
+        files: Dict,
+        commit_files: bool = True,
+        dry_run: bool = False,
+        request_options: Dict = None,
+        max_workers: int = 8,
+    ) -> DirectorySync:
+        """Synchronize local files with a Compendium Draft.
+
+        Similar to ``upload_files`` (with ``skip_unchanged``), but the result
+        lists the uploaded and the unchanged files (e.g., to resume an interrupted
+        upload). The Compendium Draft files that are not in ``files`` are kept.
+
+        Args:
+            compendium (CompendiumDraft): Compendium Draft object.
+
+            files (dict): Dictionary with the filename as key and the local file path as value.
+
+            commit_files (bool): Flag indicating that the uploaded files must be
+                                 committed.
+
+            dry_run (bool): Flag indicating that the differences are only listed
+                            (the Compendium Draft is not changed).
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            max_workers (int): Maximum number of concurrent operations (e.g., uploads).
+
+        Returns:
+            DirectorySync: Uploaded and unchanged files, and the updated Compendium
+                           Draft (``compendium`` attribute).
+        """
+        compendium = self._bind(compendium)
+
+        return self._sync_files(
+            compendium,
+            {
+                filename: (file_path, os.path.getsize(file_path))
+                for filename, file_path in files.items()
+            },
+            [],
+            commit_files,
+            dry_run,
+            request_options,
+            max_workers,
+        )
+
+    def _sync_files(
+        self,
+        compendium: CompendiumDraft,
+        local_files: Dict,
+        deleted: List[str],
+        commit_files: bool = True,
+        dry_run: bool = False,
+        request_options: Dict = None,
+        max_workers: int = 8,
+    ) -> DirectorySync:
+        """Upload the new (or changed) local files (filename and a tuple with the
+        local file path and size) and delete the ``deleted`` files."""
+        entries = {file.filename: file for file in compendium.links.files.entries}
+
+        uploaded = self._changed_files(entries.values(), local_files)
+        unchanged = [filename for filename in local_files if filename not in uploaded]
+
+        result = DirectorySync(uploaded, deleted, unchanged, compendium)
+        if dry_run or not result.changed:
+            return result
+
+        # removing the deleted files and the old versions of the changed files.
+        self._delete_files(
+            [entries[f] for f in [*deleted, *uploaded] if f in entries],
+            request_options,
+            max_workers,
+        )
+
+        result.compendium = (
+            self.upload_files(
+                compendium,
+                uploaded,
+                define_files=True,
+                commit_files=commit_files,
+                request_options=request_options,
+                max_workers=max_workers,
+            )
+            if uploaded
+            else compendium.links.self
+        )
+        return result
+
+    def select_missing_files(
+        self,
+        compendium: CompendiumBase,
+        output_directory: Union[str, Path],
+        files: List[str] = None,
+    ) -> List[str]:
+        """Select the Compendium files missing (or different) in a local directory.
+
+        The local files are compared (``size`` and ``md5`` checksum) with the
+        Compendium files, so only the files that must be downloaded are selected.
+
+        Args:
+            compendium (CompendiumBase): Compendium object.
+
+            output_directory (Union[str, Path]): Directory of the downloaded files.
+
+            files (list): Filenames checked. If not defined, all files are used.
+
+        Returns:
+            List[str]: Filenames of the files that must be downloaded.
+        """
+        compendium = self._bind(compendium)
+
+        output_directory = Path(output_directory)
+
+        entries = [
+            file
+            for file in compendium.links.files.entries
+            if not files or file.filename in files
+        ]
+
+        local_files = {}
+        for file in entries:
+            file_path = output_directory / file.filename
+
+            if file_path.is_file():
+                local_files[file.filename] = (str(file_path), file_path.stat().st_size)
+
+        changed_files = self._changed_files(entries, local_files)
+        return [
+            file.filename
+            for file in entries
+            if file.filename not in local_files or file.filename in changed_files
+        ]
+
     async def _async_download_files(
         self,
         compendium: CompendiumBase,
         output_directory: Union[str, Path],
         files: List[str] = None,
-        **kwargs
+        max_workers: int = None,
+        **kwargs,
     ) -> Path:
         """Download compendium files from the Storm WS.
 
@@ -160,6 +931,8 @@ class CompendiumFileService(BaseCompendiumService):
 
             files (list): A list with the filename to delete.
 
+            max_workers (int): Maximum number of files downloaded at the same time.
+
             kwargs (dict): Extra parameters to the ``storm_client.models.compendium.files.CompendiumFiles.download``.
 
         Returns:
@@ -168,13 +941,18 @@ class CompendiumFileService(BaseCompendiumService):
         output_directory = Path(output_directory)
         output_directory.mkdir(exist_ok=True)
 
-        downloads = []
-        for file in compendium.links.files.entries:
-            if files and file.filename not in files:
-                continue
+        entries = [
+            file
+            for file in compendium.links.files.entries
+            if not files or file.filename in files
+        ]
+        semaphore = asyncio.Semaphore(max_workers or max(len(entries), 1))
+
+        async def _download(file):
+            async with semaphore:
+                return await file.download(output_directory, **kwargs)
 
-            downloads.append(file.download(output_directory, **kwargs))
-        await asyncio.gather(*downloads)
+        await asyncio.gather(*[_download(file) for file in entries])
 
         return output_directory
 
@@ -183,7 +961,9 @@ class CompendiumFileService(BaseCompendiumService):
         compendium: CompendiumBase,
         output_directory: Union[str, Path],
         files: List[str] = None,
-        **kwargs
+        skip_unchanged: bool = False,
+        max_workers: int = None,
+        **kwargs,
     ) -> Path:
         """Download compendium files from the Storm WS.
 
@@ -194,11 +974,33 @@ class CompendiumFileService(BaseCompendiumService):
 
             files (list): A list with the filename to delete.
 
-            kwargs (dict): Extra parameters to the ``storm_client.models.compendium.files.CompendiumFiles.download``.
+            skip_unchanged (bool): Flag indicating that the files already available
+                                   (same ``size`` and ``md5`` checksum) in the output
+                                   directory are not downloaded again (see
+                                   ``select_missing_files``).
+
+            max_workers (int): Maximum number of files downloaded at the same time. If
+                               not defined, all files are downloaded at the same time
+                               (limited by the client ``max_in_flight``).
+
+            kwargs (dict): Extra parameters to the ``storm_client.models.compendium.files.CompendiumFiles.download``
+                           (e.g., use ``store=FileStore(path)`` to reuse the contents already downloaded
+                           from other compendia or versions, or ``compression="auto"`` to accept
+                           compressed transfers).
 
         Returns:
             Path: Path to the output directory.
         """
+        compendium = self._bind(compendium)
+
+        if skip_unchanged:
+            files = self.select_missing_files(compendium, output_directory, files)
+
+            if not files:
+                return Path(output_directory)  # nothing to download
+
         return asyncio.run(
-            self._async_download_files(compendium, output_directory, files, **kwargs)
+            self._async_download_files(
+                compendium, output_directory, files, max_workers, **kwargs
+            )
         )
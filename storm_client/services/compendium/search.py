@@ -6,12 +6,12 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 import posixpath
-from cachetools import LRUCache, cached
 
-from typing import Dict
+from typing import Dict, Iterator
 from typeguard import typechecked
 
 from .base import BaseCompendiumService
+from ...export import DEFAULT_COLUMNS, export, scan
 from ...object_factory import ObjectFactory
 from ...models.compendium import (
     CompendiumRecordList,
@@ -22,7 +22,14 @@ from ...models.compendium import (
 class CompendiumSearchService(BaseCompendiumService):
     """Execution Compendium Search service."""
 
-    @cached(cache=LRUCache(maxsize=128))
+    def _search_url(self, user_records: bool) -> str:
+        """Search URL."""
+        # special case: the user workspace is defined by a "user" path before the
+        # compendia url
+        if user_records:
+            return posixpath.join(self._service_url, self._base_path)
+        return self.url
+
     def search(
         self, user_records: bool = False, request_options: Dict = None, **kwargs
     ) -> CompendiumRecordList:
@@ -42,20 +49,90 @@ class CompendiumSearchService(BaseCompendiumService):
             In the ``user context`` only the compendia created by the user is
             available.
         """
-        # special case: the user workspace is defined by a "user" path before the
-        # compendia url
-        operation_url = (
-            posixpath.join(self._service_url, self._base_path)
-            if user_records
-            else self.url
-        )
-
         # search compendia
         operation_result = self._create_request(
-            "GET", operation_url, params=kwargs, **request_options or {}
+            "GET",
+            self._search_url(user_records),
+            params=kwargs,
+            **request_options or {}
         )
 
-        return ObjectFactory.resolve("CompendiumRecordList", operation_result.json())
+        return ObjectFactory.resolve(
+            "CompendiumRecordList", operation_result.json(), self._client
+        )
+
+    def scan(
+        self,
+        user_records: bool = False,
+        page_size: int = 500,
+        request_options: Dict = None,
+        **kwargs
+    ) -> Iterator[Dict]:
+        """Iterate over all Execution compendia of a search, one page at a time.
+
+        Unlike ``search``, the compendia are not loaded in memory (or converted
+        in model objects), so this method can be used with millions of records.
+
+        Args:
+            user_records (bool): Flag indicating if the ``user context`` mode must be used.
+
+            page_size (int): Number of compendia requested in each page.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            **kwargs (dict): Search parameters.
+
+        Yields:
+            dict: Compendium document.
+        """
+        return scan(
+            self._client,
+            self._search_url(user_records),
+            page_size,
+            request_options,
+            **kwargs
+        )
+
+    def export(
+        self,
+        output,
+        output_format: str = "ndjson",
+        columns: Dict = DEFAULT_COLUMNS,
+        user_records: bool = False,
+        page_size: int = 500,
+        request_options: Dict = None,
+        **kwargs
+    ) -> int:
+        """Export the Execution compendia of a search.
+
+        Args:
+            output (Union[str, Path, IO]): Output file (path or file object).
+
+            output_format (str): Export format (``ndjson`` or ``parquet``).
+
+            columns (dict): Flattened columns (name and dotted path, or function, of
+                            the value). See ``storm_client.export.DEFAULT_COLUMNS``.
+
+            user_records (bool): Flag indicating if the ``user context`` mode must be used.
+
+            page_size (int): Number of compendia requested in each page.
+
+            request_options (dict): Parameters to the ``httpx.Client.request`` method.
+
+            **kwargs (dict): Search parameters.
+
+        Returns:
+            int: Number of exported compendia.
+
+        Note:
+            The ``parquet`` format requires the ``pyarrow`` package.
+        """
+        return export(
+            self.scan(user_records, page_size, request_options, **kwargs),
+            output,
+            output_format,
+            columns,
+        )
 
     def __call__(
         self, user_records: bool = False, request_options: Dict = None, **kwargs
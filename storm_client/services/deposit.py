@@ -7,7 +7,6 @@
 
 from typing import Dict, Union
 
-from cachetools import LRUCache, cached
 from typeguard import typechecked
 
 from .base import RecordOperatorService
@@ -23,7 +22,6 @@ class DepositJobService(RecordOperatorService):
     base_path = "deposits"
     """Base service path in the Rest API."""
 
-    @cached(cache=LRUCache(maxsize=128))
     def search(self, request_options: Dict = None, **kwargs) -> DepositJobList:
         """Search for deposit jobs in the Storm WS.
 
@@ -123,9 +121,13 @@ class DepositJobService(RecordOperatorService):
             "GET", operation_url, **request_options or {}
         )
 
-        return ObjectFactory.resolve("DepositJobServiceList", operation_result.json())
+        return ObjectFactory.resolve(
+            "DepositJobServiceList", operation_result.json(), self._client
+        )
 
-    def start_deposit(self, deposit: Union[str, DepositJob], request_options: Dict = None):
+    def start_deposit(
+        self, deposit: Union[str, DepositJob], request_options: Dict = None
+    ):
         """Start an existing Deposit in the Storm WS.
 
         Args:
@@ -7,7 +7,6 @@
 
 from typing import Dict, Union
 
-from cachetools import LRUCache, cached
 from typeguard import typechecked
 
 from .base import RecordOperatorService
@@ -23,7 +22,6 @@ class ExecutionService(RecordOperatorService):
     base_path = "executions"
     """Base service path in the Rest API."""
 
-    @cached(cache=LRUCache(maxsize=128))
     def search(self, request_options: Dict = None, **kwargs) -> ExecutionJobList:
         """Search for jobs in the Storm WS.
 
@@ -54,7 +52,9 @@ class ExecutionService(RecordOperatorService):
         """
         return self._create_op_create(job, "ExecutionJob", request_options)
 
-    def get(self, job: Union[str, ExecutionJob], request_options: Dict = None) -> ExecutionJob:
+    def get(
+        self, job: Union[str, ExecutionJob], request_options: Dict = None
+    ) -> ExecutionJob:
         """Get an existing Execution Job from Storm WS.
 
         Args:
@@ -69,7 +69,9 @@ class ExecutionService(RecordOperatorService):
             For more details about ``httpx.Client.request`` options, please check
             the official documentation: https://www.python-httpx.org/api/#client
         """
-        return self._create_op_get(IDExtractor.extract(job), "ExecutionJob", request_options)
+        return self._create_op_get(
+            IDExtractor.extract(job), "ExecutionJob", request_options
+        )
 
     def save(self, job: ExecutionJob, request_options: Dict = None) -> ExecutionJob:
         """Update an existing Execution Job in the Storm WS.
@@ -119,7 +121,9 @@ class ExecutionService(RecordOperatorService):
             "GET", operation_url, **request_options or {}
         )
 
-        return ObjectFactory.resolve("ExecutionJobServiceList", operation_result.json())
+        return ObjectFactory.resolve(
+            "ExecutionJobServiceList", operation_result.json(), self._client
+        )
 
     def start_job(self, job: Union[str, ExecutionJob], request_options: Dict = None):
         """Start an existing Execution Job in the Storm WS.
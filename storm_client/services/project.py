@@ -5,12 +5,14 @@
 # storm-client is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+import threading
 from typing import Dict, Union
 
 from typeguard import typechecked
-from cachetools import LRUCache, cached
+from cachetools import LRUCache
 
 from .base import RecordOperatorService
+from ..network import HTTPXClient
 from ..models.extractor import IDExtractor
 from ..models.project import Project, ProjectList
 from ..accessors.project import ProjectContextAccessor
@@ -23,7 +25,17 @@ class ProjectService(RecordOperatorService):
     base_path = "projects"
     """Base service path in the Rest API."""
 
-    @cached(cache=LRUCache(maxsize=128))
+    max_contexts = 128
+    """Maximum number of Project contexts kept (the least recently used are dropped)."""
+
+    def __init__(self, url: str, client: HTTPXClient) -> None:
+        super(ProjectService, self).__init__(url, client)
+
+        # project contexts are reused between the calls, so
+        # their services (and their states) are reused too.
+        self._contexts = LRUCache(maxsize=self.max_contexts)
+        self._contexts_lock = threading.Lock()
+
     def search(self, request_options: Dict = None, **kwargs) -> ProjectList:
         """Search for Research projects.
 
@@ -115,4 +127,15 @@ class ProjectService(RecordOperatorService):
 
     def __call__(self, project: Union[str, Project]):
         """Call a project context."""
-        return ProjectContextAccessor(self._build_url(IDExtractor.extract(project)))
+        project_id = IDExtractor.extract(project)
+
+        # the LRU order is updated in the lookups, so all accesses are locked.
+        with self._contexts_lock:
+            context = self._contexts.get(project_id)
+
+            if context is None:
+                context = ProjectContextAccessor(
+                    self._build_url(project_id), self._client
+                )
+                self._contexts[project_id] = context
+        return context
@@ -7,7 +7,6 @@
 
 from typing import Dict, Union
 
-from cachetools import LRUCache, cached
 from typeguard import typechecked
 
 from .base import RecordOperatorService
@@ -22,7 +21,6 @@ class WorkflowService(RecordOperatorService):
     base_path = "workflows"
     """Base service path in the Rest API."""
 
-    @cached(cache=LRUCache(maxsize=128))
     def search(self, request_options: Dict = None, **kwargs) -> WorkflowList:
         """Search for Research Workflows.
 
@@ -131,6 +129,8 @@ class WorkflowService(RecordOperatorService):
             For more details about ``httpx.Client.request`` options, please check
             the official documentation: https://www.python-httpx.org/api/#client
         """
+        workflow = self._bind(workflow)
+
         diff_values = list(workflow.diff())
 
         added = ("POST", workflow.links.actions.add_compendium, diff_values[0][1])
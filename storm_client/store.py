@@ -7,18 +7,22 @@
 
 
 class TokenStore:
-    """Single source of truth for access token storage."""
+    """Single source of truth for the access token of a client."""
 
-    _access_token = None
+    def __init__(self, token=None):
+        """Initializer.
 
-    @classmethod
-    def save_token(cls, token):
+        Args:
+            token (str): Token to access the Storm WS.
+        """
+        self._access_token = token
+
+    def save_token(self, token):
         """Save a token."""
-        cls._access_token = token
+        self._access_token = token
 
-    @classmethod
-    def get_token(cls):
+    def get_token(self):
         """Get a token."""
-        if not cls._access_token:
+        if not self._access_token:
             raise RuntimeError("Access token is not defined yet. Please, define it.")
-        return cls._access_token
+        return self._access_token
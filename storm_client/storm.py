@@ -7,15 +7,33 @@
 
 """SpatioTemporal Open Research Manager services accessor."""
 
+from functools import cached_property
+from typing import Callable, Iterable, Iterator, List
+
 from .store import TokenStore
 from .network import HTTPXClient
-from .services.project import ProjectService
+from .instrumentation import Instrumentation
+from .throttling import Throttle
+from .concurrency import OperationResult, map_concurrently
+from .models.extractor import IDExtractor
 
 
 class Storm:
     """SpatioTemporal Open Research Manager Client."""
 
-    def __init__(self, url, access_token, **kwargs):
+    def __init__(
+        self,
+        url,
+        access_token,
+        sinks: List = None,
+        rate_limit: float = None,
+        max_in_flight: int = None,
+        max_retries: int = 3,
+        cache_dir: str = None,
+        cache_size: int = 256 * 1024**2,
+        request_compression: bool = False,
+        **kwargs,
+    ):
         """Initializer.
 
         Args:
@@ -23,7 +41,35 @@ class Storm:
 
             access_token (str): Token to access the Storm WS.
 
-            kwargs (dict): Optional parameters to the ``httpx.Client``.
+            sinks (list): Instrumentation sinks (e.g., ``LoggingSink``) that receive
+                          the measurements of each request.
+
+            rate_limit (float): Maximum number of requests per second sent to the Storm
+                                WS. The rate is reduced when the Storm WS throttles the
+                                client. If not defined, the rate is not limited.
+
+            max_in_flight (int): Maximum number of requests in flight at the same time
+                                 (considering all threads and asynchronous requests).
+
+            max_retries (int): Maximum number of retries of the requests throttled by
+                               the Storm WS (``429 Too Many Requests``).
+
+            cache_dir (str): Directory of the on-disk cache of the published Compendia
+                             (records and file listings). If not defined, the
+                             records are not cached.
+
+            cache_size (int): Maximum size (in bytes) of the record cache.
+
+            request_compression (bool): Flag indicating that the server decodes the
+                                        compressed request bodies (with the
+                                        ``Content-Encoding`` header), enabling the
+                                        compressed uploads. The Storm WS doesn't
+                                        decode them, so only enable it when a proxy
+                                        in front of the Storm WS does it.
+
+            kwargs (dict): Optional parameters to the ``httpx.Client`` (e.g., use
+                           ``http2=True`` to multiplex the concurrent requests in a
+                           single HTTP/2 connection).
 
         See:
             For more details about the ``httpx.Client``, please check the
@@ -31,25 +77,97 @@ class Storm:
         """
         self._url = url
 
-        # saving the token in the store.
-        # this is the only one entry point
-        # of the store.
-        TokenStore.save_token(access_token)
+        record_cache = None
+        if cache_dir:
+            from .cache import RecordCache, cache_scope
 
-        if kwargs:
-            HTTPXClient.set_client_config(kwargs)
+            # records are only shared with clients of the same deployment and user.
+            record_cache = RecordCache(
+                cache_dir, cache_size, cache_scope(url, access_token)
+            )
 
-    @property
+        # each instance has its own credentials, configuration
+        # and connection pool.
+        self._client = HTTPXClient(
+            TokenStore(access_token),
+            kwargs,
+            Instrumentation(sinks),
+            Throttle(rate_limit, max_in_flight=max_in_flight, max_retries=max_retries),
+            record_cache,
+            request_compression,
+        )
+
+    @cached_property
     def project(self):
         """Storm Project entrypoint."""
-        return ProjectService(self._url)
+        # the services (and the models) are imported on the first use.
+        from .services.project import ProjectService
+
+        return ProjectService(self._url, self._client)
+
+    @property
+    def instrumentation(self):
+        """Instrumentation of the requests sent to the Storm WS."""
+        return self._client.instrumentation
 
     @property
     def is_connected(self):
         """Check connection with the Storm WS."""
         is_ok = True
         try:
-            HTTPXClient.request("GET", self._url)
+            self._client.request("GET", self._url)
         except:  # noqa
             is_ok = False
         return is_ok
+
+    def close(self):
+        """Close the connections with the Storm WS."""
+        self._client.close()
+
+    def __enter__(self):
+        """Enter the client context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the client context, closing the connections."""
+        self.close()
+
+    def fan_out(
+        self,
+        query: Callable,
+        projects: Iterable = None,
+        max_workers: int = 8,
+        page_size: int = 500,
+    ) -> Iterator[OperationResult]:
+        """Run a query concurrently in multiple Research Projects.
+
+        Args:
+            query (Callable): Function that receives a Project context (e.g.,
+                              ``lambda ctx: ctx.execution.search(q="status:running")``)
+                              and returns the query result.
+
+            projects (Iterable): Project IDs or Project objects where the query will be
+                                 applied. If not defined, all projects available for the
+                                 user (all pages of ``ProjectService.scan``) are used.
+
+            max_workers (int): Maximum number of projects queried at the same time.
+
+            page_size (int): Number of projects requested in each search page (when
+                             ``projects`` is not defined).
+
+        Yields:
+            OperationResult: Result for each project, as soon as its query is completed. The
+                             project ID is available in ``item``, the query result in
+                             ``result``, and failures are reported (per project) in ``error``.
+        """
+        project_service = self.project
+
+        if projects is None:
+            # all pages, without the (cached) ``search`` results.
+            projects = (document["id"] for document in project_service.scan(page_size))
+
+        return map_concurrently(
+            lambda project_id: query(project_service(project_id)),
+            (IDExtractor.extract(project) for project in projects),
+            max_workers,
+        )
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager client testing utilities.
+
+The ``StormMockServer`` (an in-process stand-in for the Storm WS) is part
+of the public API, so the applications that use the client can be tested
+offline. See the ``Testing`` section of the documentation.
+"""
+
+from .server import StormMockServer
+
+__all__ = ("StormMockServer",)
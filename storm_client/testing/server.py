@@ -0,0 +1,1048 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""In-process stand-in for the Storm WS."""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+import uuid
+import zlib
+from datetime import datetime, timezone
+from urllib.parse import quote, unquote, urlsplit
+
+import httpx
+from pydash import py_
+
+from ..compression import decompressor
+from ..storm import Storm
+
+
+def _now():
+    """Current date (ISO format)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+class _StormMockTransport(httpx.MockTransport):
+    """Mock transport that knows if the request is synchronous or asynchronous.
+
+    The server latency must not block the event loop, so the asynchronous
+    requests are delayed with ``asyncio.sleep``.
+    """
+
+    def __init__(self, handler):
+        super(_StormMockTransport, self).__init__(handler)
+        self._local = threading.local()
+
+    @property
+    def is_sync(self):
+        """Flag indicating if the current request is synchronous."""
+        return getattr(self._local, "sync", False)
+
+    def handle_request(self, *args, **kwargs):
+        """Handle a synchronous request."""
+        self._local.sync = True
+        try:
+            return super(_StormMockTransport, self).handle_request(*args, **kwargs)
+        finally:
+            self._local.sync = False
+
+
+class StormMockServer:
+    """In-process stand-in for the Storm WS.
+
+    The server implements the Storm WS resources (Projects, Compendia
+    Drafts/Records/Files, Workflows, Execution Jobs and Deposit Jobs)
+    with the same ``links`` structure and ``hits.hits`` pagination of
+    the service. The data is kept in memory and the requests never
+    touch the network (``httpx.MockTransport``), so the client can be
+    tested and benchmarked offline.
+
+    Example:
+        >>> server = StormMockServer(latency=0.01)
+        >>> service = server.client()
+        >>> service.is_connected
+        True
+    """
+
+    default_page_size = 10
+    """Default number of hits per page in the search results."""
+
+    def __init__(
+        self,
+        url: str = "http://storm.mock/api",
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        job_duration: float = 0.0,
+        seed: int = None,
+        range_requests: bool = True,
+    ):
+        """Initializer.
+
+        Args:
+            url (str): Base URL of the (mocked) service.
+
+            latency (float): Time (in seconds) added to each request.
+
+            error_rate (float): Probability (from 0 to 1) of a request fail with
+                                a ``503 Service Unavailable`` error.
+
+            job_duration (float): Time (in seconds) that a started job (execution and
+                                  deposit) takes to finish.
+
+            seed (int): Seed used to sort the random errors.
+
+            range_requests (bool): Flag indicating that the byte range requests
+                                   are supported (otherwise, the complete content
+                                   is returned).
+        """
+        self.url = url.rstrip("/")
+        self.latency = latency
+        self.error_rate = error_rate
+        self.job_duration = job_duration
+        self.range_requests = range_requests
+
+        self._random = random.Random(seed)
+        self._base_path = urlsplit(self.url).path.rstrip("/")
+
+        self._lock = threading.RLock()
+        self._errors = []
+
+        self.requests = []
+        """Log of the received requests (``(method, path)``)."""
+
+        self.content_encodings = []
+        """Log of the uploaded contents encoding (``(key, encoding)``)."""
+
+        self.projects = {}
+        self.compendia = {}
+        self.workflows = {}
+        self.executions = {}
+        self.deposits = {}
+
+        self.services = {
+            "executions": [
+                {"id": "runner-reprozip-serial", "metadata": {"title": "ReproZip"}}
+            ],
+            "deposits": [
+                {"id": "deposit-gkhub", "metadata": {"title": "GEO Knowledge Hub"}}
+            ],
+        }
+        """Plugin services available for the Execution and Deposit jobs."""
+
+        self.transport = _StormMockTransport(self.handle)
+        """Transport to be used in the ``httpx`` clients."""
+
+        self._routes = self._create_routes()
+
+    #
+    # Client
+    #
+    def client(self, access_token: str = "mock-token", **kwargs) -> Storm:
+        """Create a Storm client connected to this server.
+
+        Args:
+            access_token (str): Token to access the service.
+
+            kwargs (dict): Optional parameters to the ``httpx.Client``.
+
+        Returns:
+            Storm: Storm client.
+        """
+        return Storm(self.url, access_token, transport=self.transport, **kwargs)
+
+    #
+    # Fault injection
+    #
+    def inject_error(
+        self,
+        status_code: int = 500,
+        method: str = None,
+        path: str = None,
+        times: int = 1,
+        headers: dict = None,
+    ):
+        """Make the next matching requests fail.
+
+        Args:
+            status_code (int): HTTP status code of the error.
+
+            method (str): HTTP method of the requests that will fail. If not defined,
+                          all methods are used.
+
+            path (str): Regular expression of the request path (relative to the service
+                        url) that will fail. If not defined, all paths are used.
+
+            times (int): Number of requests that will fail.
+
+            headers (dict): Headers returned in the error response (e.g., ``Retry-After``).
+        """
+        with self._lock:
+            self._errors.append(
+                {
+                    "status_code": status_code,
+                    "method": method.upper() if method else None,
+                    "path": re.compile(path) if path else None,
+                    "times": times,
+                    "headers": headers or {},
+                }
+            )
+
+    def _pop_error(self, method, path):
+        """Get the error (if any) defined for a request."""
+        for error in self._errors:
+            if error["method"] and error["method"] != method:
+                continue
+
+            if error["path"] and not error["path"].search(path):
+                continue
+
+            error["times"] -= 1
+            if error["times"] <= 0:
+                self._errors.remove(error)
+
+            return httpx.Response(
+                error["status_code"], headers=error["headers"], json={}
+            )
+
+        if self.error_rate and self._random.random() < self.error_rate:
+            return httpx.Response(503, json={"message": "Service unavailable."})
+
+    #
+    # Request handling
+    #
+    def handle(self, request: httpx.Request):
+        """Handle a request sent to the server."""
+        if self.latency:
+            if not self.transport.is_sync:
+                return self._async_handle(request)
+            time.sleep(self.latency)
+
+        return self._handle(request)
+
+    async def _async_handle(self, request):
+        """Handle an asynchronous request."""
+        await asyncio.sleep(self.latency)
+        return self._handle(request)
+
+    def _handle(self, request):
+        """Route the request to the resource handler."""
+        method = request.method
+        path = unquote(request.url.path)[len(self._base_path) :].rstrip("/")
+
+        with self._lock:
+            self.requests.append((method, path))
+
+            if not request.headers.get("x-api-key"):
+                return httpx.Response(401, json={"message": "Unauthorized."})
+
+            error = self._pop_error(method, path)
+            if error is not None:
+                return error
+
+            for route_method, route_path, handler in self._routes:
+                if route_method != method:
+                    continue
+
+                match = route_path.fullmatch(path)
+                if match:
+                    return handler(request, *match.groups())
+        return httpx.Response(404, json={"message": "Not found."})
+
+    def _create_routes(self):
+        """Define the server routes."""
+        project = r"/projects/([^/]+)"
+        compendium = project + r"/compendia/([^/]+)"
+        files = r"/files(?:/(.+?))?"
+
+        routes = [
+            # service
+            ("GET", r"", self._service_index),
+            # projects
+            ("GET", r"/projects", self._project_search),
+            ("POST", r"/projects", self._project_create),
+            ("GET", project, self._project_get),
+            ("PUT", project, self._project_save),
+            ("POST", project + r"/actions/finish", self._project_finish),
+            # compendia (search and drafts)
+            ("GET", project + r"/compendia", self._compendium_search),
+            ("POST", project + r"/compendia", self._draft_create),
+            ("GET", compendium + r"/draft", self._draft_get),
+            ("PUT", compendium + r"/draft", self._draft_save),
+            ("POST", compendium + r"/draft/actions/publish", self._draft_publish),
+            # compendia (records)
+            ("GET", compendium, self._record_get),
+            ("GET", compendium + r"/versions", self._record_versions),
+            ("POST", compendium + r"/versions", self._record_new_version),
+            ("GET", compendium + r"/versions/latest", self._record_latest),
+            # compendia (files)
+            ("GET", compendium + r"/(draft/)?files", self._files_list),
+            ("POST", compendium + r"/(draft/)?files", self._files_define),
+            ("GET", compendium + r"/(draft/)?files/(.+)/content", self._file_read),
+            ("PUT", compendium + r"/(draft/)?files/(.+)/content", self._file_write),
+            ("POST", compendium + r"/(draft/)?files/(.+)/commit", self._file_commit),
+            ("GET", compendium + r"/(draft/)?files/(.+)", self._file_get),
+            ("DELETE", compendium + r"/(draft/)?files/(.+)", self._file_delete),
+            # workflows
+            ("GET", project + r"/workflows", self._workflow_search),
+            ("POST", project + r"/workflows", self._workflow_create),
+            ("GET", project + r"/workflows/([^/]+)", self._workflow_get),
+            ("PUT", project + r"/workflows/([^/]+)", self._workflow_save),
+            ("DELETE", project + r"/workflows/([^/]+)", self._workflow_delete),
+            (
+                "POST",
+                project + r"/workflows/([^/]+)/actions/finish",
+                self._workflow_finish,
+            ),
+            (
+                "POST",
+                project + r"/workflows/([^/]+)/compendia/([^/]+)",
+                self._workflow_add,
+            ),
+            (
+                "DELETE",
+                project + r"/workflows/([^/]+)/compendia/([^/]+)",
+                self._workflow_rm,
+            ),
+        ]
+
+        # jobs (executions and deposits)
+        for kind in ["executions", "deposits"]:
+            job = project + rf"/({kind})/([^/]+)"
+
+            routes.extend(
+                [
+                    ("GET", project + rf"/({kind})/services", self._job_services),
+                    ("GET", project + rf"/({kind})", self._job_search),
+                    ("POST", project + rf"/({kind})", self._job_create),
+                    ("GET", job, self._job_get),
+                    ("PUT", job, self._job_save),
+                    ("DELETE", job, self._job_delete),
+                    ("POST", job + r"/actions/(start|cancel)", self._job_action),
+                ]
+            )
+
+        return [(method, re.compile(path), handler) for method, path, handler in routes]
+
+    #
+    # Helpers
+    #
+    def _link(self, *paths):
+        """Create a link to a resource of the server."""
+        return "/".join([self.url, *[quote(str(path)) for path in paths]])
+
+    @staticmethod
+    def _json(request):
+        """Load the request body."""
+        return json.loads(request.content or b"null")
+
+    @staticmethod
+    def _response(data, status_code=200):
+        """Create a JSON response."""
+        return httpx.Response(status_code, json=data)
+
+    @staticmethod
+    def _not_found():
+        """Create a ``404 Not Found`` response."""
+        return httpx.Response(404, json={"message": "Not found."})
+
+    def _search(self, request, documents, url):
+        """Create a (paginated) search result.
+
+        The query (``q`` parameter) supports ``field:value`` expressions
+        (e.g., ``id:my-project``, ``status:running``).
+        """
+        params = request.url.params
+
+        query = params.get("q")
+        if query and ":" in query:
+            field, value = query.split(":", 1)
+            documents = [d for d in documents if str(py_.get(d, field)) == value]
+
+        page = int(params.get("page", 1))
+        size = int(params.get("size", self.default_page_size))
+
+        hits = documents[(page - 1) * size : page * size]
+
+        links = {"self": f"{url}?page={page}&size={size}"}
+        if page * size < len(documents):
+            links["next"] = f"{url}?page={page + 1}&size={size}"
+
+        return self._response(
+            {"hits": {"hits": hits, "total": len(documents)}, "links": links}
+        )
+
+    @staticmethod
+    def _update_document(document, data, fields):
+        """Update the editable fields of a document."""
+        for field in fields:
+            if field in (data or {}):
+                document[field] = data[field]
+
+        document["updated"] = _now()
+        document["revision_id"] = document.get("revision_id", 0) + 1
+
+    def _service_index(self, request):
+        """Service index."""
+        return self._response({"links": {"projects": self._link("projects")}})
+
+    #
+    # Projects
+    #
+    def _project_document(self, project_id):
+        """Project document (with links)."""
+        document = self.projects[project_id]
+        return py_.assign(
+            py_.clone_deep(document),
+            {
+                "links": {
+                    "self": self._link("projects", project_id),
+                    "compendia": self._link("projects", project_id, "compendia"),
+                    "workflows": self._link("projects", project_id, "workflows"),
+                    "executions": self._link("projects", project_id, "executions"),
+                    "deposits": self._link("projects", project_id, "deposits"),
+                }
+            },
+        )
+
+    def _project_search(self, request):
+        """Search projects."""
+        documents = [self._project_document(pid) for pid in self.projects]
+        return self._search(request, documents, self._link("projects"))
+
+    def _project_create(self, request):
+        """Create a project."""
+        data = self._json(request) or {}
+        project_id = data.get("id") or uuid.uuid4().hex
+
+        if project_id in self.projects:
+            return self._response({"message": "Project already exists."}, 400)
+
+        self.projects[project_id] = {
+            "id": project_id,
+            "metadata": data.get("metadata", {}),
+            "is_finished": False,
+            "revision_id": 0,
+            "created": _now(),
+            "updated": _now(),
+        }
+        return self._response(self._project_document(project_id), 201)
+
+    def _project_get(self, request, project_id):
+        """Get a project."""
+        if project_id not in self.projects:
+            return self._not_found()
+        return self._response(self._project_document(project_id))
+
+    def _project_save(self, request, project_id):
+        """Update a project."""
+        if project_id not in self.projects:
+            return self._not_found()
+
+        self._update_document(
+            self.projects[project_id], self._json(request), ["metadata"]
+        )
+        return self._response(self._project_document(project_id))
+
+    def _project_finish(self, request, project_id):
+        """Finish a project."""
+        if project_id not in self.projects:
+            return self._not_found()
+
+        self.projects[project_id]["is_finished"] = True
+        return self._response(self._project_document(project_id), 202)
+
+    #
+    # Compendia
+    #
+    def _compendium_document(self, project_id, compendium_id):
+        """Compendium document (with links)."""
+        compendium = self.compendia[(project_id, compendium_id)]
+        base_link = ("projects", project_id, "compendia", compendium_id)
+
+        if compendium["is_published"]:
+            links = {
+                "self": self._link(*base_link),
+                "files": self._link(*base_link, "files"),
+                "latest": self._link(*base_link, "versions", "latest"),
+                "versions": self._link(*base_link, "versions"),
+            }
+        else:
+            links = {
+                "self": self._link(*base_link, "draft"),
+                "files": self._link(*base_link, "draft", "files"),
+                "publish": self._link(*base_link, "draft", "actions", "publish"),
+            }
+
+        document = py_.omit(compendium, "files")
+        return py_.assign(
+            py_.clone_deep(document),
+            {
+                "links": links,
+                "files": {
+                    "enabled": True,
+                    "count": len(compendium["files"]),
+                    "total_bytes": sum(
+                        (f.get("size") or 0) for f in compendium["files"].values()
+                    ),
+                },
+            },
+        )
+
+    def _get_compendium(self, project_id, compendium_id, published):
+        """Get a compendium (draft or record)."""
+        compendium = self.compendia.get((project_id, compendium_id))
+
+        if compendium is None or compendium["is_published"] != published:
+            return None
+        return compendium
+
+    def _compendium_search(self, request, project_id):
+        """Search the compendia (records) of a project."""
+        documents = [
+            self._compendium_document(pid, cid)
+            for (pid, cid), compendium in self.compendia.items()
+            if pid == project_id and compendium["is_published"]
+        ]
+        return self._search(
+            request, documents, self._link("projects", project_id, "compendia")
+        )
+
+    def _draft_create(self, request, project_id, parent=None, files=None):
+        """Create a compendium draft."""
+        if project_id not in self.projects:
+            return self._not_found()
+
+        data = self._json(request) or {}
+        compendium_id = uuid.uuid4().hex[:10]
+
+        self.compendia[(project_id, compendium_id)] = {
+            "id": compendium_id,
+            "parent": {"id": parent or uuid.uuid4().hex[:10]},
+            "metadata": data.get("metadata", {}),
+            "is_published": False,
+            "revision_id": 0,
+            "versions": {"index": 1, "is_latest": False},
+            "created": _now(),
+            "updated": _now(),
+            "files": files or {},
+        }
+        return self._response(self._compendium_document(project_id, compendium_id), 201)
+
+    def _draft_get(self, request, project_id, compendium_id):
+        """Get a compendium draft."""
+        if not self._get_compendium(project_id, compendium_id, False):
+            return self._not_found()
+        return self._response(self._compendium_document(project_id, compendium_id))
+
+    def _draft_save(self, request, project_id, compendium_id):
+        """Update a compendium draft."""
+        compendium = self._get_compendium(project_id, compendium_id, False)
+
+        if not compendium:
+            return self._not_found()
+
+        self._update_document(compendium, self._json(request), ["metadata"])
+        return self._response(self._compendium_document(project_id, compendium_id))
+
+    def _draft_publish(self, request, project_id, compendium_id):
+        """Publish a compendium draft."""
+        compendium = self._get_compendium(project_id, compendium_id, False)
+
+        if not compendium:
+            return self._not_found()
+
+        if any(f["status"] != "completed" for f in compendium["files"].values()):
+            return self._response({"message": "Files must be committed."}, 400)
+
+        versions = self._versions(project_id, compendium["parent"]["id"])
+        for version in versions:
+            version["versions"]["is_latest"] = False
+
+        compendium["is_published"] = True
+        compendium["versions"] = {"index": len(versions) + 1, "is_latest": True}
+        compendium["updated"] = _now()
+
+        return self._response(self._compendium_document(project_id, compendium_id), 202)
+
+    def _versions(self, project_id, parent_id):
+        """Get the published versions of a compendium."""
+        return sorted(
+            [
+                compendium
+                for (pid, _), compendium in self.compendia.items()
+                if pid == project_id
+                and compendium["is_published"]
+                and compendium["parent"]["id"] == parent_id
+            ],
+            key=lambda compendium: compendium["versions"]["index"],
+        )
+
+    def _record_get(self, request, project_id, compendium_id):
+        """Get a compendium record."""
+        if not self._get_compendium(project_id, compendium_id, True):
+            return self._not_found()
+        return self._response(self._compendium_document(project_id, compendium_id))
+
+    def _record_versions(self, request, project_id, compendium_id):
+        """Search the versions of a compendium record."""
+        compendium = self._get_compendium(project_id, compendium_id, True)
+
+        if not compendium:
+            return self._not_found()
+
+        documents = [
+            self._compendium_document(project_id, version["id"])
+            for version in self._versions(project_id, compendium["parent"]["id"])
+        ]
+        return self._search(
+            request,
+            documents,
+            self._link("projects", project_id, "compendia", compendium_id, "versions"),
+        )
+
+    def _record_latest(self, request, project_id, compendium_id):
+        """Get the latest version of a compendium record."""
+        compendium = self._get_compendium(project_id, compendium_id, True)
+
+        if not compendium:
+            return self._not_found()
+
+        latest = self._versions(project_id, compendium["parent"]["id"])[-1]
+        return self._response(self._compendium_document(project_id, latest["id"]))
+
+    def _record_new_version(self, request, project_id, compendium_id):
+        """Create a new version (draft) of a compendium record.
+
+        The new draft carries the files of the record.
+        """
+        compendium = self._get_compendium(project_id, compendium_id, True)
+
+        if not compendium:
+            return self._not_found()
+
+        files = py_.clone_deep(compendium["files"])
+        return self._draft_create(
+            request, project_id, compendium["parent"]["id"], files
+        )
+
+    #
+    # Compendia files
+    #
+    def _file_document(self, project_id, compendium_id, is_draft, file):
+        """File document (with links)."""
+        base_link = ["projects", project_id, "compendia", compendium_id]
+        if is_draft:
+            base_link.append("draft")
+
+        links = {
+            "self": self._link(*base_link, "files", file["key"]),
+            "content": self._link(*base_link, "files", file["key"], "content"),
+        }
+        if is_draft:
+            links["commit"] = self._link(*base_link, "files", file["key"], "commit")
+
+        return py_.assign(py_.omit(file, "content"), {"links": links})
+
+    def _files_document(self, project_id, compendium_id, is_draft):
+        """Files listing document."""
+        compendium = self.compendia[(project_id, compendium_id)]
+        return {
+            "enabled": True,
+            "entries": [
+                self._file_document(project_id, compendium_id, is_draft, file)
+                for file in compendium["files"].values()
+            ],
+            "links": {
+                "self": self._link(
+                    "projects",
+                    project_id,
+                    "compendia",
+                    compendium_id,
+                    *(["draft"] if is_draft else []),
+                    "files",
+                )
+            },
+        }
+
+    def _get_file(self, project_id, compendium_id, draft, key):
+        """Get a file from a compendium."""
+        compendium = self._get_compendium(project_id, compendium_id, not draft)
+
+        if compendium is None:
+            return None, None
+        return compendium, compendium["files"].get(key)
+
+    def _files_list(self, request, project_id, compendium_id, draft):
+        """List the files of a compendium."""
+        if not self._get_compendium(project_id, compendium_id, not draft):
+            return self._not_found()
+        return self._response(
+            self._files_document(project_id, compendium_id, bool(draft))
+        )
+
+    def _files_define(self, request, project_id, compendium_id, draft):
+        """Define the files of a compendium draft."""
+        compendium = self._get_compendium(project_id, compendium_id, False)
+
+        if not draft or not compendium:
+            return self._not_found()
+
+        for entry in self._json(request) or []:
+            compendium["files"][entry["key"]] = {
+                "key": entry["key"],
+                "file_id": None,
+                "version_id": None,
+                "bucket_id": compendium_id,
+                "size": None,
+                "mimetype": None,
+                "checksum": None,
+                "status": "pending",
+                "content": None,
+            }
+        return self._response(
+            self._files_document(project_id, compendium_id, True), 201
+        )
+
+    def _file_get(self, request, project_id, compendium_id, draft, key):
+        """Get a file metadata."""
+        _, file = self._get_file(project_id, compendium_id, draft, key)
+
+        if file is None:
+            return self._not_found()
+        return self._response(
+            self._file_document(project_id, compendium_id, bool(draft), file)
+        )
+
+    def _file_delete(self, request, project_id, compendium_id, draft, key):
+        """Delete a file from a compendium draft."""
+        compendium, file = self._get_file(project_id, compendium_id, draft, key)
+
+        if not draft or file is None:
+            return self._not_found()
+
+        del compendium["files"][key]
+        return httpx.Response(204)
+
+    def _file_write(self, request, project_id, compendium_id, draft, key):
+        """Write the content of a file."""
+        _, file = self._get_file(project_id, compendium_id, draft, key)
+
+        if not draft or file is None:
+            return self._not_found()
+
+        if file["status"] == "completed":
+            return self._response({"message": "File already committed."}, 400)
+
+        encoding = request.headers.get("content-encoding", "identity")
+        try:
+            decoder = decompressor(encoding)
+            file["content"] = decoder.decompress(request.content) + decoder.flush()
+        except (ImportError, ValueError, zlib.error):
+            return self._response({"message": "Unsupported content encoding."}, 415)
+
+        self.content_encodings.append((key, encoding))
+        return self._response(
+            self._file_document(project_id, compendium_id, True, file)
+        )
+
+    def _file_commit(self, request, project_id, compendium_id, draft, key):
+        """Commit a file (calculating its checksum)."""
+        _, file = self._get_file(project_id, compendium_id, draft, key)
+
+        if not draft or file is None or file["content"] is None:
+            return self._not_found()
+
+        content = file["content"]
+        file.update(
+            {
+                "file_id": uuid.uuid4().hex,
+                "version_id": uuid.uuid4().hex,
+                "size": len(content),
+                "mimetype": "application/octet-stream",
+                "checksum": f"md5:{hashlib.md5(content).hexdigest()}",
+                "status": "completed",
+            }
+        )
+        return self._response(
+            self._file_document(project_id, compendium_id, True, file)
+        )
+
+    def _file_read(self, request, project_id, compendium_id, draft, key):
+        """Read the content of a file."""
+        _, file = self._get_file(project_id, compendium_id, draft, key)
+
+        if file is None or file["content"] is None:
+            return self._not_found()
+
+        content = file["content"]
+        headers = {"content-type": "application/octet-stream", "accept-ranges": "bytes"}
+
+        # single byte range requests (``Range: bytes=<start>-<end>``).
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", request.headers.get("range", ""))
+        if match and self.range_requests:
+            start = int(match.group(1))
+            end = min(int(match.group(2) or len(content) - 1), len(content) - 1)
+
+            if start >= len(content):
+                return httpx.Response(
+                    416, headers={"content-range": f"bytes */{len(content)}"}
+                )
+
+            headers["content-range"] = f"bytes {start}-{end}/{len(content)}"
+            return httpx.Response(
+                206, content=content[start : end + 1], headers=headers
+            )
+
+        # compressed transfers (``gzip`` only).
+        if "gzip" in request.headers.get("accept-encoding", ""):
+            headers["content-encoding"] = "gzip"
+            content = gzip.compress(content)
+
+        return httpx.Response(200, content=content, headers=headers)
+
+    #
+    # Workflows
+    #
+    def _workflow_document(self, project_id, workflow_id):
+        """Workflow document (with links)."""
+        workflow = self.workflows[(project_id, workflow_id)]
+        base_link = ("projects", project_id, "workflows", workflow_id)
+
+        document = py_.clone_deep(workflow)
+        document["metadata"]["graph"] = py_.clone_deep(workflow["graph"])
+        document["links"] = {
+            "self": self._link(*base_link),
+            "actions": {
+                "add-compendium": self._link(*base_link, "compendia"),
+                "delete-compendium": self._link(*base_link, "compendia"),
+                "finish": self._link(*base_link, "actions", "finish"),
+            },
+        }
+        return document
+
+    def _get_workflow(self, project_id, workflow_id):
+        """Get a workflow."""
+        return self.workflows.get((project_id, workflow_id))
+
+    def _workflow_search(self, request, project_id):
+        """Search the workflows of a project."""
+        documents = [
+            self._workflow_document(pid, wid)
+            for pid, wid in self.workflows
+            if pid == project_id
+        ]
+        return self._search(
+            request, documents, self._link("projects", project_id, "workflows")
+        )
+
+    def _workflow_create(self, request, project_id):
+        """Create a workflow."""
+        if project_id not in self.projects:
+            return self._not_found()
+
+        data = self._json(request) or {}
+        workflow_id = data.get("id") or uuid.uuid4().hex[:10]
+
+        if (project_id, workflow_id) in self.workflows:
+            return self._response({"message": "Workflow already exists."}, 400)
+
+        metadata = py_.omit(data.get("metadata", {}), "graph")
+        self.workflows[(project_id, workflow_id)] = {
+            "id": workflow_id,
+            "metadata": metadata,
+            "graph": {"nodes": {}, "edges": []},
+            "is_finished": False,
+            "revision_id": 0,
+            "created": _now(),
+            "updated": _now(),
+        }
+        return self._response(self._workflow_document(project_id, workflow_id), 201)
+
+    def _workflow_get(self, request, project_id, workflow_id):
+        """Get a workflow."""
+        if not self._get_workflow(project_id, workflow_id):
+            return self._not_found()
+        return self._response(self._workflow_document(project_id, workflow_id))
+
+    def _workflow_save(self, request, project_id, workflow_id):
+        """Update a workflow."""
+        workflow = self._get_workflow(project_id, workflow_id)
+
+        if not workflow:
+            return self._not_found()
+
+        if workflow["is_finished"]:
+            return self._response({"message": "Workflow is finished."}, 400)
+
+        data = self._json(request) or {}
+        if "metadata" in data:
+            data["metadata"] = py_.omit(data["metadata"], "graph")
+
+        self._update_document(workflow, data, ["metadata"])
+        return self._response(self._workflow_document(project_id, workflow_id))
+
+    def _workflow_delete(self, request, project_id, workflow_id):
+        """Delete a workflow."""
+        workflow = self._get_workflow(project_id, workflow_id)
+
+        if not workflow:
+            return self._not_found()
+
+        if workflow["is_finished"]:
+            return self._response({"message": "Workflow is finished."}, 400)
+
+        del self.workflows[(project_id, workflow_id)]
+        return httpx.Response(204)
+
+    def _workflow_finish(self, request, project_id, workflow_id):
+        """Finish a workflow."""
+        workflow = self._get_workflow(project_id, workflow_id)
+
+        if not workflow:
+            return self._not_found()
+
+        workflow["is_finished"] = True
+        return self._response(self._workflow_document(project_id, workflow_id), 202)
+
+    def _workflow_add(self, request, project_id, workflow_id, compendium_id):
+        """Add a compendium to the workflow graph."""
+        workflow = self._get_workflow(project_id, workflow_id)
+
+        if not workflow or not self._get_compendium(project_id, compendium_id, True):
+            return self._not_found()
+
+        workflow["graph"]["nodes"][compendium_id] = {"id": compendium_id}
+        workflow["revision_id"] += 1
+        return self._response(self._workflow_document(project_id, workflow_id))
+
+    def _workflow_rm(self, request, project_id, workflow_id, compendium_id):
+        """Remove a compendium from the workflow graph."""
+        workflow = self._get_workflow(project_id, workflow_id)
+
+        if not workflow or compendium_id not in workflow["graph"]["nodes"]:
+            return self._not_found()
+
+        del workflow["graph"]["nodes"][compendium_id]
+        workflow["revision_id"] += 1
+        return self._response(self._workflow_document(project_id, workflow_id))
+
+    #
+    # Jobs (Executions and Deposits)
+    #
+    def _job_document(self, project_id, kind, job_id):
+        """Job document (with links)."""
+        job = getattr(self, kind)[(project_id, job_id)]
+
+        # started jobs are finished after ``job_duration`` seconds.
+        if (
+            job["status"] == "running"
+            and time.monotonic() - job["_started"] >= self.job_duration
+        ):
+            job["status"] = "finished"
+
+        base_link = ("projects", project_id, kind, job_id)
+        return py_.assign(
+            py_.omit(py_.clone_deep(job), "_started"),
+            {
+                "links": {
+                    "self": self._link(*base_link),
+                    "actions": {
+                        "start": self._link(*base_link, "actions", "start"),
+                        "cancel": self._link(*base_link, "actions", "cancel"),
+                    },
+                }
+            },
+        )
+
+    def _job_services(self, request, project_id, kind):
+        """List the job plugin services."""
+        return self._search(
+            request,
+            self.services[kind],
+            self._link("projects", project_id, kind, "services"),
+        )
+
+    def _job_search(self, request, project_id, kind):
+        """Search the jobs of a project."""
+        documents = [
+            self._job_document(pid, kind, jid)
+            for pid, jid in getattr(self, kind)
+            if pid == project_id
+        ]
+        return self._search(
+            request, documents, self._link("projects", project_id, kind)
+        )
+
+    def _job_create(self, request, project_id, kind):
+        """Create a job."""
+        if project_id not in self.projects:
+            return self._not_found()
+
+        data = self._json(request) or {}
+        job_id = uuid.uuid4().hex[:10]
+
+        job = py_.omit(data, "links", "id", "status")
+        job.update(
+            {
+                "id": job_id,
+                "project_id": project_id,
+                "status": "created",
+                "revision_id": 0,
+                "created": _now(),
+                "updated": _now(),
+            }
+        )
+        getattr(self, kind)[(project_id, job_id)] = job
+
+        return self._response(self._job_document(project_id, kind, job_id), 201)
+
+    def _job_get(self, request, project_id, kind, job_id):
+        """Get a job."""
+        if (project_id, job_id) not in getattr(self, kind):
+            return self._not_found()
+        return self._response(self._job_document(project_id, kind, job_id))
+
+    def _job_save(self, request, project_id, kind, job_id):
+        """Update a job."""
+        job = getattr(self, kind).get((project_id, job_id))
+
+        if not job:
+            return self._not_found()
+
+        fields = ["service", "workflow_id", "workflows", "customizations"]
+        self._update_document(job, self._json(request), fields)
+
+        return self._response(self._job_document(project_id, kind, job_id))
+
+    def _job_delete(self, request, project_id, kind, job_id):
+        """Delete a job."""
+        if (project_id, job_id) not in getattr(self, kind):
+            return self._not_found()
+
+        del getattr(self, kind)[(project_id, job_id)]
+        return httpx.Response(204)
+
+    def _job_action(self, request, project_id, kind, job_id, action):
+        """Start or cancel a job."""
+        job = getattr(self, kind).get((project_id, job_id))
+
+        if not job:
+            return self._not_found()
+
+        if action == "start":
+            job["status"] = "running"
+            job["_started"] = time.monotonic()
+        else:
+            job["status"] = "canceled"
+
+        return self._response({"id": job_id, "status": job["status"]}, 202)
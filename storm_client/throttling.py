@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager client throttling.
+
+The ``Throttle`` controls how the requests are sent to the Storm WS:
+
+  - Rate limit: a token bucket defines how many requests per second are
+    sent. The rate adapts to the server feedback (it is halved when the
+    server answers ``429 Too Many Requests`` and slowly recovered after
+    successful requests);
+
+  - Concurrency: a global limit of requests in flight, shared by all
+    threads and by the asynchronous requests;
+
+  - Retries: requests answered with ``429`` are retried after the delay
+    requested by the server (``Retry-After`` header).
+"""
+
+import threading
+import time
+from typing import Optional
+
+from . import lazy
+
+TOO_MANY_REQUESTS = 429
+"""HTTP status used by the Storm WS to throttle the clients."""
+
+
+def retry_after(response) -> Optional[float]:
+    """Get the delay (in seconds) requested by the ``Retry-After`` header.
+
+    Args:
+        response (httpx.Response): Response with the header.
+
+    Returns:
+        float: Delay in seconds. If the header is not available (or is invalid),
+               ``None`` is returned.
+    """
+    value = response.headers.get("retry-after")
+
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_time = lazy.email_utils.parsedate_to_datetime(value).timestamp()
+        return max(0.0, retry_time - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Adaptive token bucket rate limiter.
+
+    The rate is reduced by half (multiplicative decrease) when the server
+    throttles the client and increased by a fraction of the configured
+    rate (additive increase) after each successful request, never
+    exceeding the configured rate.
+    """
+
+    def __init__(self, rate: float, burst: int = None, min_rate: float = None):
+        """Initializer.
+
+        Args:
+            rate (float): Maximum number of requests per second.
+
+            burst (int): Maximum number of requests sent at once. If not defined,
+                         ``rate`` (at least one) is used.
+
+            min_rate (float): Minimum rate used when the server throttles the
+                              client. If not defined, ``rate / 16`` is used.
+        """
+        if rate <= 0:
+            raise ValueError("The rate limit must be positive.")
+
+        self.max_rate = float(rate)
+        self.min_rate = float(min_rate or rate / 16)
+        self.burst = float(burst or max(1.0, rate))
+
+        self.rate = self.max_rate
+
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._decreased = 0.0
+
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        """Add the tokens generated since the last update."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Reserve a token.
+
+        Returns:
+            float: Time (in seconds) to wait before using the reserved token.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def decrease(self):
+        """Halve the rate (the server is throttling the client)."""
+        with self._lock:
+            now = time.monotonic()
+
+            # concurrent throttled requests reduce the rate only once.
+            if now - self._decreased < 1 / self.rate:
+                return
+
+            self._refill(now)
+            self._decreased = now
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def increase(self):
+        """Increase the rate (the request was accepted by the server)."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 20)
+
+
+class Throttle:
+    """Rate limit, concurrency limit and retry policy of the requests."""
+
+    def __init__(
+        self,
+        rate_limit: float = None,
+        burst: int = None,
+        max_in_flight: int = None,
+        max_retries: int = 3,
+        max_retry_delay: float = 60.0,
+    ):
+        """Initializer.
+
+        Args:
+            rate_limit (float): Maximum number of requests per second. If not defined,
+                                the rate is not limited.
+
+            burst (int): Maximum number of requests sent at once by the rate limiter.
+
+            max_in_flight (int): Maximum number of requests in flight at the same time.
+                                 If not defined, the concurrency is not limited.
+
+            max_retries (int): Maximum number of retries of a throttled (``429``)
+                               request.
+
+            max_retry_delay (float): Maximum delay (in seconds) before a retry.
+        """
+        self.limiter = RateLimiter(rate_limit, burst) if rate_limit else None
+
+        self.max_in_flight = max_in_flight
+        self._in_flight = (
+            threading.BoundedSemaphore(max_in_flight) if max_in_flight else None
+        )
+
+        self.max_retries = max_retries
+        self.max_retry_delay = max_retry_delay
+
+        self._blocked_until = 0.0
+
+    def _delay(self) -> float:
+        """Time (in seconds) to wait before sending a request."""
+        delay = self._blocked_until - time.monotonic()
+
+        if self.limiter is not None:
+            delay = max(delay, self.limiter.reserve())
+        return delay
+
+    def acquire(self):
+        """Wait until a request can be sent."""
+        if self._in_flight is not None:
+            self._in_flight.acquire()
+
+        try:
+            delay = self._delay()
+            if delay > 0:
+                time.sleep(delay)
+        except BaseException:
+            self.release()
+            raise
+
+    async def acquire_async(self, max_poll_interval: float = 0.05):
+        """Wait (without blocking the event loop) until a request can be sent.
+
+        The in-flight slots are shared with the threads, so they are polled
+        (non-blocking ``acquire``) with an increasing interval. The waiting
+        requests don't hold executor threads, which are used by the transfers
+        (e.g., file writes) that must finish to release the slots.
+
+        Args:
+            max_poll_interval (float): Maximum interval (in seconds) between the
+                                       attempts to acquire an in-flight slot.
+        """
+        if self._in_flight is not None:
+            poll_interval = 0.001
+
+            while not self._in_flight.acquire(False):
+                await lazy.asyncio.sleep(poll_interval)
+                poll_interval = min(max_poll_interval, poll_interval * 2)
+
+        try:
+            delay = self._delay()
+            if delay > 0:
+                await lazy.asyncio.sleep(delay)
+        except lazy.asyncio.CancelledError:
+            self.release()
+            raise
+
+    def release(self):
+        """Register the end of a request."""
+        if self._in_flight is not None:
+            self._in_flight.release()
+
+    def should_retry(self, response, retries: int) -> bool:
+        """Register the server feedback and check if the request must be retried.
+
+        Args:
+            response (httpx.Response): Response of the request.
+
+            retries (int): Number of retries already done.
+
+        Returns:
+            bool: ``True`` if the request was throttled and must be retried.
+        """
+        if response.status_code != TOO_MANY_REQUESTS:
+            if self.limiter is not None:
+                self.limiter.increase()
+            return False
+
+        if self.limiter is not None:
+            self.limiter.decrease()
+
+        delay = retry_after(response)
+        if delay is None:
+            delay = 0.5 * 2**retries
+
+        # all requests wait for the delay requested by the server.
+        self._blocked_until = max(
+            self._blocked_until,
+            time.monotonic() + min(delay, self.max_retry_delay),
+        )
+        return retries < self.max_retries
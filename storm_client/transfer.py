@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager file transfer utilities.
+
+Helpers for transfers of large files:
+
+  - Uploads: the content can be read from a memory map of the file, so
+    the chunks sent are views of the mapped pages (no intermediate
+    ``bytes`` copies are created);
+
+  - Downloads: the output file is preallocated (``posix_fallocate``)
+    with the content size, reducing the fragmentation of the file. Large
+    files can be downloaded in segments (byte ranges requested in
+    parallel), each one written in its position with ``os.pwrite``.
+"""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+
+MIN_SEGMENT_SIZE = 8 * 1024**2
+"""Minimum size (in bytes) of the segments of a download."""
+
+
+def preallocate(file_path: Union[str, Path], size: int):
+    """Create (or truncate) a file with ``size`` bytes reserved on disk.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        size (int): File size (in bytes).
+
+    Note:
+        Where ``posix_fallocate`` isn't available (or supported by the file
+        system), the file is only extended to ``size`` bytes.
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+
+    try:
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except OSError:
+                pass  # e.g., ``EOPNOTSUPP`` in some network file systems.
+
+        os.ftruncate(fd, size)
+    finally:
+        os.close(fd)
+
+
+def pwrite_all(fd: int, data: bytes, offset: int) -> int:
+    """Write all the data in a position of a file (``os.pwrite``).
+
+    Returns:
+        int: Number of written bytes.
+    """
+    written = 0
+
+    with memoryview(data) as view:
+        while written < len(view):
+            written += os.pwrite(fd, view[written:], offset + written)
+    return written
+
+
+def segment_ranges(
+    size: int, segments: int, min_segment_size: int = None
+) -> List[Tuple[int, int]]:
+    """Split a file in byte ranges downloaded in parallel.
+
+    Args:
+        size (int): File size (in bytes).
+
+        segments (int): Maximum number of segments.
+
+        min_segment_size (int): Minimum size (in bytes) of a segment, so small
+                                files are not split. If not defined, the
+                                ``MIN_SEGMENT_SIZE`` is used.
+
+    Returns:
+        List[Tuple[int, int]]: Ranges (start and end, exclusive).
+    """
+    if size <= 0:
+        return [(0, 0)]
+
+    min_segment_size = min_segment_size or MIN_SEGMENT_SIZE
+
+    segments = max(1, min(segments, size // min_segment_size))
+    segment_size = -(-size // segments)
+
+    return [
+        (start, min(start + segment_size, size))
+        for start in range(0, size, segment_size)
+    ]
+
+
+class MappedFile:
+    """Content of a file, read from a memory map.
+
+    The chunks are ``memoryview`` slices of the mapped file, so the content
+    is sent without being copied to ``bytes`` objects. The size is known in
+    advance (``Content-Length``) and each iteration reads the content again,
+    so a throttled upload can be retried.
+    """
+
+    def __init__(self, file_path: Union[str, Path], chunk_size: int = 1024**2):
+        """Initializer.
+
+        Args:
+            file_path (Union[str, Path]): File path.
+
+            chunk_size (int): Size (in bytes) of the chunks.
+        """
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self.size = os.path.getsize(file_path)
+
+    def __len__(self):
+        """File size (in bytes)."""
+        return self.size
+
+    def __iter__(self) -> Iterator[memoryview]:
+        """Generate the content chunks."""
+        if not self.size:
+            return  # empty files can't be mapped.
+
+        with open(self.file_path, "rb") as content_file:
+            mapped = mmap.mmap(content_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if hasattr(mapped, "madvise"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+
+        view = memoryview(mapped)
+        try:
+            for offset in range(0, self.size, self.chunk_size):
+                yield view[offset : offset + self.chunk_size]
+        finally:
+            view.release()
+
+            # the map is closed when the last chunk (still used by the
+            # transport) is released.
+            try:
+                mapped.close()
+            except BufferError:
+                pass
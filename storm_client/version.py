@@ -7,4 +7,4 @@
 
 """Version information for SpatioTemporal Open Research Manager Python Client."""
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SpatioTemporal Open Research Manager local workspace utilities.
+
+A workspace is a local directory synchronized with a Compendium Draft
+(``CompendiumFileService.sync_directory``). The files are identified
+by their path relative to the workspace (e.g., ``outputs/data.csv``).
+"""
+
+import os
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+
+def match_path(
+    filename: str, include: Iterable[str] = None, exclude: Iterable[str] = None
+) -> bool:
+    """Check if a relative path is selected by include/exclude glob patterns.
+
+    Args:
+        filename (str): Relative path (``/`` separated).
+
+        include (Iterable[str]): Patterns of the selected paths. If not defined, all
+                                 paths are selected.
+
+        exclude (Iterable[str]): Patterns of the ignored paths.
+
+    Returns:
+        bool: ``True`` if the path is selected.
+
+    Note:
+        The patterns are matched (``fnmatch``) against the complete relative
+        path and against its name, so ``*.csv`` selects the files in all
+        subdirectories.
+    """
+    name = filename.rsplit("/", 1)[-1]
+
+    def _match(patterns):
+        return any(
+            fnmatchcase(filename, pattern) or fnmatchcase(name, pattern)
+            for pattern in patterns
+        )
+
+    if exclude and _match(exclude):
+        return False
+    return not include or _match(include)
+
+
+def scan_directory(
+    path: Union[str, Path],
+    include: Iterable[str] = None,
+    exclude: Iterable[str] = None,
+) -> Dict[str, Tuple[str, int]]:
+    """List the files of a directory tree (with ``os.scandir``).
+
+    The directories matched by the ``exclude`` patterns are not walked.
+    Symbolic links to directories are not followed.
+
+    Args:
+        path (Union[str, Path]): Directory path.
+
+        include (Iterable[str]): Patterns of the selected files. If not defined, all
+                                 files are selected.
+
+        exclude (Iterable[str]): Patterns of the ignored files and directories.
+
+    Returns:
+        dict: Relative path (``/`` separated) as key and a tuple with the file
+              path and size as value.
+    """
+    include, exclude = list(include or []), list(exclude or [])
+
+    files = {}
+    directories = [(str(path), "")]
+
+    while directories:
+        directory, prefix = directories.pop()
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                filename = prefix + entry.name
+
+                if entry.is_dir(follow_symlinks=False):
+                    if not match_path(filename, exclude=exclude):
+                        continue
+                    directories.append((entry.path, filename + "/"))
+
+                elif entry.is_file() and match_path(filename, include, exclude):
+                    files[filename] = (entry.path, entry.stat().st_size)
+
+    return dict(sorted(files.items()))
+
+
+class DirectorySync:
+    """Result of the synchronization of a directory with a Compendium Draft."""
+
+    def __init__(
+        self,
+        uploaded: Dict[str, str],
+        deleted: List[str],
+        unchanged: List[str],
+        compendium=None,
+    ):
+        """Initializer.
+
+        Args:
+            uploaded (dict): Files (filename and local path) uploaded (new or changed).
+
+            deleted (list): Files removed from the Compendium Draft.
+
+            unchanged (list): Files already synchronized.
+
+            compendium (CompendiumDraft): Updated Compendium Draft.
+        """
+        self.uploaded = uploaded
+        self.deleted = deleted
+        self.unchanged = unchanged
+        self.compendium = compendium
+
+    @property
+    def changed(self):
+        """Flag indicating if the Compendium Draft was changed."""
+        return bool(self.uploaded or self.deleted)
+
+    def __repr__(self):
+        """Object representation."""
+        return (
+            f"DirectorySync(uploaded={len(self.uploaded)}, "
+            f"deleted={len(self.deleted)}, unchanged={len(self.unchanged)})"
+        )
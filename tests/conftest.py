@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pytest fixtures for the SpatioTemporal Open Research Manager client."""
+
+import pytest
+
+from storm_client.models.project import Project
+from storm_client.testing import StormMockServer
+
+
+@pytest.fixture()
+def server():
+    """Storm WS stand-in server."""
+    return StormMockServer()
+
+
+@pytest.fixture()
+def service(server):
+    """Storm client connected to the stand-in server."""
+    with server.client() as service:
+        yield service
+
+
+@pytest.fixture()
+def project(service):
+    """Research Project created in the stand-in server."""
+    return service.project.create(
+        Project(id="example-project", metadata={"title": "Example project"})
+    )
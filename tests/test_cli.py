@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-client is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Unit-test for the SpatioTemporal Open Research Manager command-line interface."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from storm_client import cli as storm_cli
+from storm_client.models.compendium import CompendiumDraft
+from storm_client.models.execution import ExecutionJob
+
+
+@pytest.fixture()
+def run(server, monkeypatch):
+    """Run the ``storm`` command connected to the stand-in server."""
+    monkeypatch.setattr(
+        storm_cli, "Storm", lambda url, token, **kwargs: server.client(token, **kwargs)
+    )
+    runner = CliRunner(env={"STORM_URL": server.url, "STORM_ACCESS_TOKEN": "token"})
+
+    def _run(*args):
+        result = runner.invoke(storm_cli.cli, [str(arg) for arg in args])
+        if result.exception and not isinstance(result.exception, SystemExit):
+            raise result.exception
+        return result
+
+    return _run
+
+
+def test_push_pull(run, service, server, project, tmp_path):
+    compendium_context = service.project(project).compendium
+    draft = compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+
+    data = tmp_path / "data"
+    (data / "inputs").mkdir(parents=True)
+    (data / "inputs" / "input.txt").write_text("input data")
+    (data / "output.txt").write_text("output data")
+
+    result = run("push", project.id, draft.id, data, "--jobs", 2)
+    assert "2 file(s) uploaded, 0 unchanged" in result.output
+
+    # resuming: only the changed files are uploaded.
+    (data / "output.txt").write_text("new output data")
+    result = run("push", project.id, draft.id, data)
+    assert "1 file(s) uploaded, 1 unchanged" in result.output
+
+    record = compendium_context.draft.publish(compendium_context.draft.get(draft.id))
+
+    output = tmp_path / "output"
+    result = run(
+        "pull",
+        project.id,
+        record.id,
+        output,
+        "--store",
+        tmp_path / "store",
+        "--jobs",
+        2,
+    )
+    assert "2 file(s) downloaded" in result.output
+    assert (output / "inputs" / "input.txt").read_text() == "input data"
+
+    result = run("pull", project.id, record.id, output)
+    assert "0 file(s) downloaded, 2 already available" in result.output
+
+    # changed local files are downloaded again.
+    (output / "output.txt").write_text("changed output")
+    result = run("pull", project.id, record.id, output)
+    assert "1 file(s) downloaded, 1 already available" in result.output
+    assert (output / "output.txt").read_text() == "new output data"
+
+
+def test_push_options(run, service, project, tmp_path):
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    # the Storm WS URL and the token are only required to run the commands.
+    runner = CliRunner(env={"STORM_URL": None, "STORM_ACCESS_TOKEN": None})
+    assert runner.invoke(storm_cli.cli, ["push", "--help"]).exit_code == 0
+
+    result = runner.invoke(storm_cli.cli, ["push", project.id, draft.id, str(tmp_path)])
+    assert result.exit_code == 2
+    assert "Missing option '--url'" in result.output
+
+    # files with the same name (from different directories) are rejected.
+    for directory in ["a", "b"]:
+        (tmp_path / directory).mkdir()
+        (tmp_path / directory / "data.txt").write_text(directory)
+
+    result = run(
+        "push", project.id, draft.id, tmp_path / "a" / "data.txt", tmp_path / "b"
+    )
+    assert result.exit_code == 2
+    assert "have the same name (data.txt)" in result.output
+
+
+def test_sync(run, service, project, tmp_path):
+    compendium_context = service.project(project).compendium
+    draft = compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "a.txt").write_text("a")
+    (data / "b.txt").write_text("b")
+
+    (data / "logs").mkdir()
+    (data / "logs" / "run.log").write_text("log")
+
+    result = run("sync", project.id, draft.id, data, "--exclude", "logs", "--dry-run")
+    assert "upload: a.txt" in result.output
+    assert "2 file(s) to upload, 0 to remove, 0 unchanged" in result.output
+
+    run("sync", project.id, draft.id, data, "--exclude", "logs")
+    (data / "b.txt").unlink()
+
+    result = run("sync", project.id, draft.id, data, "--delete", "--exclude", "logs")
+    assert "0 file(s) uploaded, 1 removed, 1 unchanged" in result.output
+
+    draft = compendium_context.draft.get(draft.id)
+    assert [f.filename for f in draft.links.files.entries] == ["a.txt"]
+
+
+def test_jobs_wait(run, service, project):
+    execution_service = service.project(project).execution
+
+    job = execution_service.create(ExecutionJob(workflow_id="workflow"))
+    execution_service.start_job(job)
+
+    result = run("jobs", "wait", project.id, job.id, "--interval", 0)
+    assert result.exit_code == 0
+    assert f"{job.id}: finished" in result.output
+
+    job = execution_service.create(ExecutionJob(workflow_id="workflow"))
+    result = run("jobs", "wait", project.id, job.id, "--interval", 0, "--timeout", 0)
+    assert result.exit_code != 0
+
+
+def test_search_export(run, service, project, tmp_path):
+    execution_service = service.project(project).execution
+    for _ in range(3):
+        execution_service.create(ExecutionJob(workflow_id="workflow"))
+
+    result = run("search", project.id, "executions", "-q", "status:created")
+    assert len([json.loads(line) for line in result.output.splitlines()]) == 3
+
+    output = tmp_path / "jobs.ndjson"
+    result = run("search", project.id, "executions", "--export", output)
+
+    assert "3 record(s) exported" in result.output
+    assert len(output.read_text().splitlines()) == 3
@@ -6,3 +6,1192 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 """Unit-test for SpatioTemporal Open Research Manager."""
+
+import asyncio
+import copy
+import gzip
+import json
+import os
+import pickle
+import subprocess
+import sys
+import time
+import zlib
+from pathlib import Path
+
+import httpx
+import pytest
+
+from storm_client.export import DEFAULT_COLUMNS
+from storm_client.filestore import FileStore
+from storm_client.instrumentation import CounterSink
+from storm_client.models.compendium import CompendiumDraft, CompendiumRecord
+from storm_client.models.execution import ExecutionJob
+from storm_client.models.project import Project
+from storm_client.models.workflow import Workflow
+from storm_client.network import HTTPXClient
+
+
+def test_connection(service):
+    assert service.is_connected
+
+
+def test_project_operations(service, project):
+    assert project.id == "example-project"
+    assert project.title == "Example project"
+
+    project.data["metadata"]["title"] = "Updated project"
+    project = service.project.save(project)
+
+    assert service.project.get(project.id).title == "Updated project"
+    assert [p.id for p in service.project.search()] == ["example-project"]
+
+    assert service.project.finalize(project).is_finished
+
+
+def test_project_contexts_are_reused(service):
+    context = service.project("project-a")
+
+    assert service.project("project-a") is context
+    assert service.project("project-a").compendium is context.compendium
+    assert service.project("project-b") is not context
+
+    # only the most recently used contexts are kept.
+    for idx in range(service.project.max_contexts):
+        service.project(f"project-{idx}")
+
+    assert service.project("project-a") is not context
+    assert len(service.project._contexts) == service.project.max_contexts
+
+
+def test_search_after_create(service):
+    assert len(service.project.search()) == 0
+
+    project = service.project.create(Project(id="project-a"))
+    assert [p.id for p in service.project.search()] == [project.id]
+
+    compendium_context = service.project(project).compendium
+    assert len(compendium_context.search()) == 0
+
+    draft = compendium_context.draft.create(CompendiumDraft())
+    record = compendium_context.draft.publish(draft)
+    assert [c.id for c in compendium_context.search()] == [record.id]
+
+
+def test_bulk_create_reports_failures_per_item(service, server):
+    server.inject_error(400, method="POST", path=r"^/projects$", times=1)
+
+    results = list(
+        service.project.create_many(
+            [Project(id=f"project-{i}") for i in range(10)], max_workers=4
+        )
+    )
+
+    assert len(results) == 10
+    assert len([r for r in results if not r.ok]) == 1
+    assert len(server.projects) == 9
+
+
+def test_bulk_save_reports_failures_per_item(service, server):
+    projects = [
+        result.result
+        for result in service.project.create_many(
+            [Project(id=f"project-{i}") for i in range(5)]
+        )
+    ]
+    for project in projects:
+        project.metadata = {"title": "Updated"}
+
+    # a missing project fails without stopping the other updates.
+    projects.append(Project(id="missing-project", metadata={"title": "Updated"}))
+    results = sorted(service.project.save_many(projects), key=lambda r: r.index)
+
+    assert [r.ok for r in results] == [True] * 5 + [False]
+    assert isinstance(results[-1].error, httpx.HTTPStatusError)
+    assert results[-1].item.id == "missing-project"
+    assert {r.result.metadata["title"] for r in results[:5]} == {"Updated"}
+
+
+def test_bulk_operations_use_the_pooled_client(server, monkeypatch):
+    clients = []
+
+    class _Client(httpx.Client):
+        def __init__(self, **kwargs):
+            clients.append(kwargs)
+            super(_Client, self).__init__(**kwargs)
+
+    monkeypatch.setattr(httpx, "Client", _Client)
+
+    limits = httpx.Limits(max_connections=4, max_keepalive_connections=4)
+    with server.client(limits=limits) as service:
+        results = list(
+            service.project.create_many(
+                [Project(id=f"project-{i}") for i in range(20)], max_workers=8
+            )
+        )
+
+    assert all(r.ok for r in results)
+
+    # all concurrent requests share one connection pool (with the user limits).
+    assert len(clients) == 1
+    assert clients[0]["limits"] is limits
+
+
+def test_fan_out_isolates_project_errors(service, server):
+    for project_id in ["a", "b", "c"]:
+        service.project.create(Project(id=project_id))
+
+    server.inject_error(500, path=r"^/projects/b/executions$")
+
+    results = {
+        r.item: r
+        for r in service.fan_out(lambda ctx: ctx.execution.search(), ["a", "b", "c"])
+    }
+
+    assert results["a"].ok and results["c"].ok
+    assert isinstance(results["b"].error, httpx.HTTPStatusError)
+
+
+def test_fan_out_queries_all_projects(service, server):
+    for idx in range(25):
+        service.project.create(Project(id=f"project-{idx:02d}"))
+
+    def _query_all():
+        return sorted(
+            r.item
+            for r in service.fan_out(lambda ctx: ctx.execution.search(), page_size=10)
+        )
+
+    assert _query_all() == [f"project-{idx:02d}" for idx in range(25)]
+
+    # the projects created later are queried too.
+    service.project.create(Project(id="project-25"))
+    assert _query_all()[-1] == "project-25"
+
+
+def test_models_without_client(service, project, tmp_path):
+    compendium_context = service.project(project).compendium
+    draft = compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+    assert draft.links.files.entries == []
+
+    # the bound client isn't part of the serialized state.
+    copied = pickle.loads(pickle.dumps(draft))
+    assert copied.data == draft.data and copied._client is None
+
+    # objects without client (e.g., created by the user) are bound by the services.
+    other = compendium_context.draft.create(CompendiumDraft())
+    other = compendium_context.files.define_files(
+        CompendiumDraft(other.data), ["a.txt"]
+    )
+    assert [file.filename for file in other.links.files.entries] == ["a.txt"]
+
+    draft.title = "B"
+    saved = compendium_context.draft.save(pickle.loads(pickle.dumps(draft)))
+    assert saved.title == "B"
+
+    record = compendium_context.draft.publish(CompendiumDraft(saved.data))
+    new_version = compendium_context.record.new_version(CompendiumRecord(record.data))
+    assert new_version.is_draft
+
+
+def test_storm_instances_are_isolated():
+    from storm_client import Storm
+    from storm_client.testing import StormMockServer
+
+    tokens = []
+
+    def _transport(server):
+        def _handle(request):
+            tokens.append((request.url.host, request.headers.get("x-api-key")))
+            return server.handle(request)
+
+        return httpx.MockTransport(_handle)
+
+    server_a = StormMockServer("http://storm-a.mock/api")
+    server_b = StormMockServer("http://storm-b.mock/api")
+
+    with Storm(server_a.url, "token-a", transport=_transport(server_a)) as service_a:
+        with Storm(
+            server_b.url, "token-b", transport=_transport(server_b)
+        ) as service_b:
+            project_a = service_a.project.create(Project(id="project-a"))
+            service_b.project.create(Project(id="project-b"))
+
+            # the models are bound to the client of their instance.
+            assert project_a._client is service_a._client
+            assert [p.id for p in service_a.project.search()] == ["project-a"]
+            assert [p.id for p in service_b.project.search()] == ["project-b"]
+
+            service_a.close()
+            assert service_b.is_connected
+
+    assert set(tokens) == {("storm-a.mock", "token-a"), ("storm-b.mock", "token-b")}
+
+
+def test_compendium_workflow(service, server, project, tmp_path):
+    compendium_context = service.project(project).compendium
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("input data")
+
+    output_file = tmp_path / "output.txt"
+    output_file.write_text("output data")
+
+    files = {"input.txt": str(input_file), "output.txt": str(output_file)}
+
+    draft = compendium_context.draft.create(
+        CompendiumDraft(metadata={"title": "Compendium"})
+    )
+    draft = compendium_context.files.upload_files(
+        draft, files, define_files=True, commit_files=True
+    )
+    assert {f.status for f in draft.links.files.entries} == {"completed"}
+
+    record = compendium_context.draft.publish(draft)
+    assert isinstance(record, CompendiumRecord)
+    assert [r.id for r in compendium_context.search()] == [record.id]
+
+    # downloading (and validating) the files.
+    output_directory = compendium_context.files.download_files(
+        record, tmp_path / "download", validate_checksum=True
+    )
+    assert (output_directory / "output.txt").read_text() == "output data"
+
+    # only the changed files are sent in the new version.
+    output_file.write_text("new output data")
+
+    new_version = compendium_context.record.new_version(record)
+    new_version = compendium_context.files.upload_files(
+        new_version, files, commit_files=True, skip_unchanged=True
+    )
+
+    content_uploads = [r for r in server.requests if r[0] == "PUT"]
+    assert content_uploads[-1][1].endswith("/output.txt/content")
+    assert len(content_uploads) == 3
+
+
+def test_select_changed_files(service, project, tmp_path, monkeypatch):
+    from storm_client import hashing
+    from storm_client.services.compendium import files as files_module
+
+    files_service = service.project(project).compendium.files
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    files = {}
+    for filename, content in [
+        ("same.txt", "a"),
+        ("edited.txt", "b"),
+        ("grown.txt", "c"),
+    ]:
+        (tmp_path / filename).write_text(content)
+        files[filename] = str(tmp_path / filename)
+
+    draft = files_service.upload_files(
+        draft, files, define_files=True, commit_files=True
+    )
+
+    (tmp_path / "edited.txt").write_text("B")  # same size, different content.
+    (tmp_path / "grown.txt").write_text("cc")
+    (tmp_path / "new.txt").write_text("d")
+    files["new.txt"] = str(tmp_path / "new.txt")
+
+    hashed_files = []
+
+    def _files_checksum(file_paths):
+        file_paths = list(file_paths)
+        hashed_files.extend(file_paths)
+        return hashing.files_checksum(file_paths)
+
+    monkeypatch.setattr(files_module, "files_checksum", _files_checksum)
+
+    assert files_service.select_changed_files(draft, files) == {
+        "edited.txt": files["edited.txt"],
+        "grown.txt": files["grown.txt"],
+        "new.txt": files["new.txt"],
+    }
+
+    # only the files with the same size are hashed.
+    assert sorted(hashed_files) == [files["edited.txt"], files["same.txt"]]
+
+
+def test_parallel_hashing(tmp_path, monkeypatch):
+    import asyncio
+    import hashlib
+    import threading
+
+    from storm_client import hashing
+
+    file_paths = []
+    for idx in range(16):
+        file_path = tmp_path / f"{idx}.bin"
+        file_path.write_bytes(os.urandom(1024 * (idx + 1)))
+        file_paths.append(file_path)
+
+    expected = {
+        file_path: f"md5:{hashlib.md5(file_path.read_bytes()).hexdigest()}"
+        for file_path in file_paths
+    }
+    assert {p: hashing.file_checksum(p) for p in file_paths} == expected
+
+    # the files are hashed in the shared executor (outside the caller thread).
+    threads = set()
+    file_checksum = hashing.file_checksum
+
+    def _file_checksum(file_path):
+        threads.add(threading.current_thread().name)
+        return file_checksum(file_path)
+
+    monkeypatch.setattr(hashing, "file_checksum", _file_checksum)
+
+    assert hashing.files_checksum(file_paths) == expected
+    assert (
+        asyncio.run(hashing.async_file_checksum(file_paths[0]))
+        == expected[file_paths[0]]
+    )
+    assert all(name.startswith("storm-hashing") for name in threads)
+
+
+def test_concurrent_file_operations(service, server, project, tmp_path):
+    files_service = service.project(project).compendium.files
+
+    files = {}
+    for idx in range(6):
+        file_path = tmp_path / f"file-{idx}.txt"
+        file_path.write_text(f"file {idx}")
+
+        files[file_path.name] = str(file_path)
+
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    # each file is defined, uploaded and committed independently.
+    draft = files_service.upload_files(
+        draft, files, define_files=True, commit_files=True, pipeline=True
+    )
+    assert {f.filename: f.status for f in draft.links.files.entries} == {
+        filename: "completed" for filename in files
+    }
+    assert len([r for r in server.requests if r[1].endswith("/draft/files")]) >= 6
+
+    draft = files_service.delete_defined_files(draft, ["file-0.txt", "file-1.txt"])
+    assert len(draft.links.files.entries) == 4
+
+    # the failures are raised after the other files are processed.
+    server.inject_error(500, method="DELETE", path="file-2.txt")
+
+    with pytest.raises(httpx.HTTPStatusError):
+        files_service.delete_defined_files(draft, ["file-2.txt", "file-3.txt"])
+
+    assert sorted(f.filename for f in draft.links.files.entries) == [
+        "file-2.txt",
+        "file-4.txt",
+        "file-5.txt",
+    ]
+
+    # uploaded files are committed concurrently.
+    draft = files_service.upload_files(
+        draft, {"file-0.txt": files["file-0.txt"]}, define_files=True
+    )
+    draft = files_service.commit_defined_files(draft, ["file-0.txt"], max_workers=2)
+
+    assert {f.status for f in draft.links.files.entries} == {"completed"}
+
+
+def test_sync_directory(service, server, project, tmp_path):
+    compendium_context = service.project(project).compendium
+    draft = compendium_context.draft.create(CompendiumDraft())
+
+    workspace = tmp_path / "workspace"
+    for filename in ["inputs/a.csv", "outputs/b.csv", "outputs/c.txt", "tmp/d.csv"]:
+        (workspace / filename).parent.mkdir(parents=True, exist_ok=True)
+        (workspace / filename).write_text(filename)
+
+    result = compendium_context.files.sync_directory(
+        draft, workspace, include=["*.csv"], exclude=["tmp"]
+    )
+    assert sorted(result.uploaded) == ["inputs/a.csv", "outputs/b.csv"]
+
+    draft = result.compendium
+    assert {f.filename: f.status for f in draft.links.files.entries} == {
+        "inputs/a.csv": "completed",
+        "outputs/b.csv": "completed",
+    }
+
+    # only the changed (and the removed) files are sent.
+    (workspace / "outputs" / "b.csv").write_text("new content")
+    (workspace / "inputs" / "a.csv").unlink()
+
+    requests = len(server.requests)
+    result = compendium_context.files.sync_directory(
+        draft, workspace, include=["*.csv"], exclude=["tmp"], delete=True
+    )
+    assert (result.uploaded, result.deleted) == (
+        {"outputs/b.csv": str(workspace / "outputs" / "b.csv")},
+        ["inputs/a.csv"],
+    )
+    uploads = [r[1] for r in server.requests[requests:] if r[0] == "PUT"]
+    assert len(uploads) == 1 and uploads[0].endswith("/outputs/b.csv/content")
+
+    result = compendium_context.files.sync_directory(
+        result.compendium, workspace, include=["*.csv"], exclude=["tmp"], delete=True
+    )
+    assert not result.changed
+    assert result.unchanged == ["outputs/b.csv"]
+
+
+def test_bundle_upload(service, server, project, tmp_path):
+    import io
+    import tarfile
+
+    files_service = service.project(project).compendium.files
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    files = {}
+    for idx in range(200):
+        file_path = tmp_path / "outputs" / f"{idx:03d}.txt"
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_text(f"output {idx}" * idx)
+
+        files[f"outputs/{idx:03d}.txt"] = str(file_path)
+
+    large_file = tmp_path / "large.bin"
+    large_file.write_bytes(b"x" * 4096)
+    files["large.bin"] = str(large_file)
+
+    requests = len(server.requests)
+    draft = files_service.upload_files(
+        draft, files, define_files=True, commit_files=True, bundle_threshold=2048
+    )
+
+    assert sorted(f.filename for f in draft.links.files.entries) == [
+        "bundle.tar",
+        "bundle.tar.index.json",
+        "large.bin",
+    ]
+    assert len([r for r in server.requests[requests:] if r[0] == "PUT"]) == 3
+
+    # the bundle is a regular tar archive.
+    bundle_file = next(
+        f for f in draft.links.files.entries if f.filename == "bundle.tar"
+    )
+    content = service._client.request("GET", bundle_file.links.content).content
+
+    with tarfile.open(fileobj=io.BytesIO(content)) as archive:
+        assert len(archive.getnames()) == 200
+        assert archive.extractfile("outputs/010.txt").read() == b"output 10" * 10
+
+    # members are read using range requests.
+    requests = len(server.requests)
+    contents = files_service.read_bundle(draft, ["outputs/005.txt", "outputs/150.txt"])
+
+    assert contents == {
+        "outputs/005.txt": b"output 5" * 5,
+        "outputs/150.txt": b"output 150" * 150,
+    }
+    # files listing, index and one range per member (the members aren't close).
+    assert len(server.requests) - requests == 4
+
+    output_directory = files_service.extract_bundle(draft, tmp_path / "extracted")
+    assert (output_directory / "outputs" / "199.txt").read_text() == "output 199" * 199
+
+    with pytest.raises(ValueError, match="large.bin"):
+        files_service.read_bundle(draft, ["large.bin"])
+
+    # without range support, the complete bundle is downloaded only once.
+    server.range_requests = False
+    requests = len(server.requests)
+
+    members = ["outputs/005.txt", "outputs/100.txt", "outputs/150.txt"]
+    contents = files_service.read_bundle(draft, members)
+
+    assert contents["outputs/100.txt"] == b"output 100" * 100
+    assert [
+        path for _, path in server.requests[requests:] if "bundle.tar/" in path
+    ] == [bundle_file.links.content.replace(server.url, "")]
+
+
+def test_many_bundles(service, project, tmp_path):
+    files_service = service.project(project).compendium.files
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    def _files(names, content):
+        files = {}
+        for name in names:
+            (tmp_path / name).write_text(f"{content} {name}")
+            files[name] = str(tmp_path / name)
+        return files
+
+    draft = files_service.upload_files(
+        draft, _files(["a.txt", "b.txt"], "first"), True, True, bundle_threshold=1024
+    )
+    draft = files_service.upload_files(
+        draft, _files(["b.txt", "c.txt"], "second"), True, True, bundle_threshold=1024
+    )
+
+    # each upload has its own bundle (the previous isn't replaced).
+    assert sorted(f.filename for f in draft.links.files.entries) == [
+        "bundle-1.tar",
+        "bundle-1.tar.index.json",
+        "bundle.tar",
+        "bundle.tar.index.json",
+    ]
+    assert files_service.read_bundle(draft) == {
+        "a.txt": b"first a.txt",
+        "b.txt": b"second b.txt",
+        "c.txt": b"second c.txt",
+    }
+    assert files_service.read_bundle(draft, ["b.txt"], bundle_name="bundle.tar") == {
+        "b.txt": b"first b.txt"
+    }
+
+    with pytest.raises(ValueError, match="already exists"):
+        files_service.upload_bundle(
+            draft, {"d.txt": str(tmp_path / "a.txt")}, bundle_name="bundle.tar"
+        )
+
+
+def test_compressed_transfers(service, server, project, tmp_path):
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    data_file = tmp_path / "data.csv"
+    data_file.write_text("id,value\n" + "".join(f"{i},{i % 7}\n" for i in range(5000)))
+
+    archive_file = tmp_path / "data.zip"
+    archive_file.write_bytes(b"PK" + bytes(range(256)) * 4)
+
+    # the compressed uploads must be enabled explicitly.
+    requests = len(server.requests)
+    with pytest.raises(ValueError, match="request_compression"):
+        service.project(project).compendium.files.upload_files(
+            draft, {"data.csv": str(data_file)}, compression="gzip"
+        )
+    assert len(server.requests) == requests
+
+    with server.client(request_compression=True) as compressed_service:
+        files_service = compressed_service.project(project).compendium.files
+
+        draft = files_service.upload_files(
+            draft,
+            {"data.csv": str(data_file), "data.zip": str(archive_file)},
+            define_files=True,
+            commit_files=True,
+            compression="gzip",
+        )
+
+        # already compressed files are sent without compression.
+        assert sorted(server.content_encodings) == [
+            ("data.csv", "gzip"),
+            ("data.zip", "identity"),
+        ]
+
+        # the downloaded content is decompressed (and validated).
+        output_directory = files_service.download_files(
+            draft, tmp_path / "output", validate_checksum=True, compression="auto"
+        )
+        assert (output_directory / "data.csv").read_bytes() == data_file.read_bytes()
+        assert (output_directory / "data.zip").read_bytes() == archive_file.read_bytes()
+
+        # the upload encoding isn't selected automatically.
+        for compression in ["auto", "brotli"]:
+            with pytest.raises(ValueError, match="Invalid encoding"):
+                files_service.upload_files(
+                    draft, {"data.csv": str(data_file)}, compression=compression
+                )
+
+
+def test_other_content_encodings(tmp_path):
+    content = b"id,value\n" * 1000
+
+    # the encodings without a streaming decompressor are decoded by httpx.
+    response = httpx.Response(
+        200,
+        headers={"content-encoding": "deflate, gzip"},
+        content=gzip.compress(zlib.compress(content)),
+    )
+    asyncio.run(HTTPXClient._write_content(response, tmp_path / "data.csv"))
+
+    assert (tmp_path / "data.csv").read_bytes() == content
+
+
+def test_sync_files(service, server, project, tmp_path):
+    compendium_context = service.project(project).compendium
+    files_service = compendium_context.files
+    draft = compendium_context.draft.create(CompendiumDraft())
+
+    files = {}
+    for name in ["a.txt", "b.txt"]:
+        (tmp_path / name).write_text(f"{name} content")
+        files[name] = str(tmp_path / name)
+
+    result = files_service.sync_files(draft, files)
+    assert sorted(result.uploaded) == ["a.txt", "b.txt"]
+
+    (tmp_path / "b.txt").write_text("new content")
+    result = files_service.sync_files(result.compendium, files)
+    assert list(result.uploaded) == ["b.txt"] and result.unchanged == ["a.txt"]
+
+    # only the missing (or changed) files are downloaded again.
+    output = files_service.download_files(result.compendium, tmp_path / "output")
+    (output / "a.txt").write_text("changed")
+
+    server.requests.clear()
+    assert files_service.select_missing_files(result.compendium, output) == ["a.txt"]
+
+    files_service.download_files(result.compendium, output, skip_unchanged=True)
+    assert (output / "a.txt").read_text() == "a.txt content"
+    assert len([path for _, path in server.requests if "content" in path]) == 1
+
+
+def test_memory_mapped_upload(service, server, project, tmp_path):
+    files_service = service.project(project).compendium.files
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    large_file = tmp_path / "large.bin"
+    large_file.write_bytes(bytes(range(256)) * 12_000)
+
+    empty_file = tmp_path / "empty.bin"
+    empty_file.touch()
+
+    files = {"large.bin": str(large_file), "empty.bin": str(empty_file)}
+    draft = files_service.upload_files(
+        draft, files, define_files=True, commit_files=True, memory_map=True
+    )
+
+    # the downloaded files are preallocated with the content size.
+    output_directory = files_service.download_files(
+        draft, tmp_path / "output", validate_checksum=True
+    )
+    for filename, file_path in files.items():
+        assert (output_directory / filename).read_bytes() == Path(
+            file_path
+        ).read_bytes()
+
+
+def test_segmented_download(service, server, project, tmp_path, monkeypatch):
+    from storm_client import transfer
+
+    monkeypatch.setattr(transfer, "MIN_SEGMENT_SIZE", 64 * 1024)
+
+    files_service = service.project(project).compendium.files
+    draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+    large_file = tmp_path / "large.bin"
+    large_file.write_bytes(os.urandom(1024 * 1024 + 17))
+
+    draft = files_service.upload_files(
+        draft, {"large.bin": str(large_file)}, define_files=True, commit_files=True
+    )
+
+    requests = len(server.requests)
+    output_directory = files_service.download_files(
+        draft, tmp_path / "output", segments=4
+    )
+
+    assert (output_directory / "large.bin").read_bytes() == large_file.read_bytes()
+    assert [
+        method
+        for method, path in server.requests[requests:]
+        if path.endswith("/content")
+    ] == ["GET"] * 4
+
+    # files without checksum (not committed) are downloaded without validation.
+    draft = files_service.upload_files(
+        draft, {"pending.bin": str(large_file)}, define_files=True
+    )
+    entry = next(f for f in draft.links.files.entries if f.filename == "pending.bin")
+    assert entry.checksum is None
+
+    entry.size = large_file.stat().st_size
+    output_file = asyncio.run(entry.download(tmp_path / "pending", segments=4))
+
+    assert output_file.read_bytes() == large_file.read_bytes()
+
+
+def test_workflow_and_jobs(service, server, project):
+    project_context = service.project(project)
+    compendium_context = project_context.compendium
+
+    draft = compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+    record = compendium_context.draft.publish(draft)
+
+    workflow = project_context.workflow.create(
+        Workflow(id="example-workflow", metadata={"title": "Workflow"})
+    )
+    workflow.compendia.append(record)
+
+    workflow = project_context.workflow.sync_compendia(workflow)
+    assert workflow.compendia == [record.id]
+
+    job = project_context.execution.create(
+        ExecutionJob(workflow_id=workflow, service="runner-reprozip-serial")
+    )
+    assert project_context.execution.start_job(job).status == "finished"
+
+
+def test_server_latency_and_errors(server, service, project):
+    server.latency = 0.01
+    server.inject_error(503, method="GET", path=r"^/projects/", times=1)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        service.project.get(project.id)
+
+    assert service.project.get(project.id).id == project.id
+
+    with pytest.raises(httpx.HTTPStatusError):
+        service.project.get("unknown-project")
+
+
+def test_request_instrumentation(service, server, project):
+    sink = CounterSink()
+    service.instrumentation.add_sink(sink)
+
+    server.inject_error(503, method="GET", path=r"^/projects/", times=1)
+    with pytest.raises(httpx.HTTPStatusError):
+        service.project.get(project.id)
+    service.project.get(project.id)
+
+    labels = (("method", "GET"), ("url_template", "/api/projects/{id}"))
+    assert sink.counters[("storm_client_requests_total", labels + (("status", "503"),))]
+    assert sink.counters[("storm_client_requests_total", labels + (("status", "200"),))]
+    assert 'url_template="/api/projects/{id}"' in sink.render()
+
+
+def test_throttled_requests_are_retried(server, project):
+    sink = CounterSink()
+
+    with server.client(sinks=[sink], rate_limit=100, max_in_flight=2) as service:
+        server.inject_error(429, method="GET", times=2, headers={"Retry-After": "0"})
+        assert service.project.get(project.id).id == project.id
+
+        # the rate is reduced after the throttled requests.
+        assert service._client.throttle.limiter.rate < 100
+
+    labels = (
+        ("method", "GET"),
+        ("url_template", "/api/projects/{id}"),
+        ("status", "200"),
+    )
+    assert sink.counters[("storm_client_request_retries_total", labels)] == 2
+
+
+def test_rate_limit(server, project):
+    with server.client(rate_limit=50, max_in_flight=4) as service:
+        # the first 50 requests are sent at once (burst).
+        start = time.perf_counter()
+        results = service.project.create_many(
+            [Project(id=f"project-{i}") for i in range(60)], max_workers=4
+        )
+        assert all(r.ok for r in results)
+
+        assert time.perf_counter() - start >= 0.18
+
+
+def test_async_requests_with_in_flight_limit(server, project, tmp_path):
+    import threading
+
+    with server.client(max_in_flight=2) as service:
+        files_service = service.project(project).compendium.files
+        draft = service.project(project).compendium.draft.create(CompendiumDraft())
+
+        files = {}
+        for idx in range(80):
+            file_path = tmp_path / "inputs" / f"{idx:02d}.txt"
+            file_path.parent.mkdir(exist_ok=True)
+            file_path.write_text(f"input {idx}")
+
+            files[file_path.name] = str(file_path)
+
+        draft = files_service.upload_files(
+            draft, files, define_files=True, commit_files=True
+        )
+
+        # the waiting downloads must not hold the threads used by the file writes.
+        download = threading.Thread(
+            target=files_service.download_files,
+            args=(draft, tmp_path / "output"),
+            kwargs={"validate_checksum": True},
+            daemon=True,
+        )
+        download.start()
+        download.join(timeout=30)
+
+        assert not download.is_alive()
+        assert len(list((tmp_path / "output").iterdir())) == 80
+
+
+def test_http2_requires_h2(server, monkeypatch):
+    monkeypatch.setitem(sys.modules, "h2", None)
+
+    with pytest.raises(ImportError, match="h2"):
+        server.client(http2=True)
+
+
+def test_import_time():
+    # ``-X importtime`` lists (in stderr) all modules imported by the client
+    # (and the command-line interface).
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import storm_client.cli; "
+            "from storm_client import Storm; Storm('http://localhost', 'token')",
+        ],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imported_modules = {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+    # the models, services and heavy dependencies are imported on the first use.
+    assert "storm_client.storm" in imported_modules
+    assert not imported_modules & {
+        "httpx",
+        "aiofiles",
+        "asyncio",
+        "pydash",
+        "typeguard",
+        "storm_client.models.compendium",
+        "storm_client.services.project",
+        "storm_client.filestore",
+    }
+
+
+def test_lazy_model_registration():
+    from storm_client.object_factory import ObjectFactory
+
+    workflow = ObjectFactory.resolve("Workflow", {"id": "wf"})
+
+    assert isinstance(workflow, Workflow)
+    assert ObjectFactory.exists("WorkflowLink")
+    assert not ObjectFactory.exists("UnknownModel")
+
+
+def test_model_subclasses(service, project):
+    from storm_client.models.extractor import IDExtractor
+    from storm_client.object_factory import ObjectFactory
+
+    class TrackedJob(ExecutionJob):
+        @property
+        def is_running(self):
+            return self.status == "running"
+
+    execution_service = service.project(project).execution
+
+    ObjectFactory.register("ExecutionJob", TrackedJob)
+    try:
+        job = execution_service.create(
+            TrackedJob(workflow_id="example-workflow", service="runner")
+        )
+        assert isinstance(job, TrackedJob)
+        assert not job.is_running
+
+        # subclasses use the rules (and the links) of the registered models.
+        assert IDExtractor.extract(job) == job.id
+        assert isinstance(job.links.self, TrackedJob)
+        assert execution_service.get(job).id == job.id
+    finally:
+        ObjectFactory.register("ExecutionJob", ExecutionJob)
+
+    assert type(execution_service.get(job)) is ExecutionJob
+
+
+def test_object_fields_are_cached():
+    from storm_client.models.compendium import CompendiumFiles
+
+    files = CompendiumFiles(
+        {"entries": [{"key": f"file-{idx}.csv", "links": {}} for idx in range(3)]}
+    )
+
+    entries = files.entries
+    assert all(a is b for a, b in zip(entries, files.entries))
+
+    # the returned list can be changed without changing the cache.
+    entries.clear()
+    assert len(files.entries) == 3
+
+    # new (or replaced) documents are resolved again.
+    files.data["entries"].append({"key": "file-3.csv"})
+    assert [entry.filename for entry in files.entries] == [
+        f"file-{idx}.csv" for idx in range(4)
+    ]
+
+    entry = files.entries[0]
+    links = entry.links
+    assert entry.links is links
+
+    entry.links = {"self": "http://localhost/files/file-0.csv"}
+    assert entry.links is not links
+
+    # changes made in place in the documents are also detected.
+    entry.data["links"]["self"] = "http://localhost/files/renamed.csv"
+    assert entry.links.self == "http://localhost/files/renamed.csv"
+
+    files.data["entries"][1]["key"] = "renamed.csv"
+    assert files.entries[1].filename == "renamed.csv"
+
+    # the changes made in the objects are written to the owner data.
+    files.entries[2].links.content = "http://localhost/files/file-2.csv/content"
+    assert files.data["entries"][2]["links"]["content"].endswith("/content")
+
+    files.entries[2].links = {"self": "http://localhost/files/file-2.csv"}
+    assert files.data["entries"][2]["links"] == {
+        "self": "http://localhost/files/file-2.csv"
+    }
+    assert files.entries[2].links.self == "http://localhost/files/file-2.csv"
+
+    # copies don't share the cached objects.
+    copied = copy.copy(files)
+    assert "_field_cache" not in copied.__dict__
+
+    copied.data["entries"] = [{"key": "copied.csv"}]
+
+    assert [entry.filename for entry in copied.entries] == ["copied.csv"]
+    assert len(files.entries) == 4
+
+    files.data = {"entries": [{"key": "other.csv"}]}
+    assert [entry.filename for entry in files.entries] == ["other.csv"]
+
+
+def test_record_cache(server, project, tmp_path):
+    with server.client(cache_dir=tmp_path / "cache") as service:
+        compendium_context = service.project(project).compendium
+
+        draft = compendium_context.draft.create(
+            CompendiumDraft(metadata={"title": "Cached"})
+        )
+        record = compendium_context.draft.publish(draft)
+        assert record.links.files.entries == []
+
+    # the records are available across clients (and processes).
+    with server.client(cache_dir=tmp_path / "cache", cache_size=1024**2) as service:
+        compendium_context = service.project(project).compendium
+
+        requests = len(server.requests)
+
+        cached_record = compendium_context.record.get(record.id)
+        assert cached_record.data == record.data
+        assert cached_record.links.files.entries == []
+        assert cached_record.links.self.id == record.id
+
+        assert len(server.requests) == requests
+
+        # the latest version is always requested.
+        assert cached_record.links.latest.id == record.id
+        assert len(server.requests) == requests + 1
+
+        # documents without the publication flag are not cached.
+        cache = service._client.record_cache
+        assert not cache.put_record({"id": "unknown", "revision_id": 1})
+
+        # the total size is kept with the records.
+        cache.put_files(record.data["links"]["files"], {"entries": [{"key": "a"}]})
+        assert (
+            cache.size
+            == cache._connect().execute("SELECT SUM(size) FROM records").fetchone()[0]
+        )
+
+        # size-based eviction.
+        cache.max_size = 0
+        cache.put_record(record.data)
+
+        assert cache.size == 0
+
+
+def test_record_cache_scopes(server, project, tmp_path):
+    from storm_client.testing import StormMockServer
+
+    with server.client(cache_dir=tmp_path / "cache") as service:
+        compendium_context = service.project(project).compendium
+
+        draft = compendium_context.draft.create(
+            CompendiumDraft(metadata={"title": "Cached"})
+        )
+        record = compendium_context.draft.publish(draft)
+
+    # other users (tokens) don't read the cached records.
+    with server.client("other-token", cache_dir=tmp_path / "cache") as service:
+        requests = len(server.requests)
+        service.project(project).compendium.record.get(record.id)
+
+        assert len(server.requests) == requests + 1
+
+    # neither the clients of other deployments.
+    other_server = StormMockServer("http://other-storm.mock/api")
+    with other_server.client(cache_dir=tmp_path / "cache") as service:
+        with pytest.raises(httpx.HTTPStatusError):
+            service.project(project).compendium.record.get(record.id)
+
+
+def test_download_with_file_store(service, server, project, tmp_path):
+    compendium_context = service.project(project).compendium
+
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("input data")
+
+    draft = compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+    draft = compendium_context.files.upload_files(
+        draft, {"input.txt": str(input_file)}, define_files=True, commit_files=True
+    )
+    record = compendium_context.draft.publish(draft)
+    new_record = compendium_context.draft.publish(
+        compendium_context.record.new_version(record)
+    )
+
+    store = FileStore(tmp_path / "store")
+    for idx, compendium in enumerate([record, new_record]):
+        output_directory = compendium_context.files.download_files(
+            compendium, tmp_path / f"v{idx}", store=store
+        )
+        assert (output_directory / "input.txt").read_text() == "input data"
+
+    # the content is downloaded only once.
+    content_downloads = [
+        r for r in server.requests if r[0] == "GET" and r[1].endswith("/content")
+    ]
+    assert len(content_downloads) == 1
+    assert store.has(record.links.files.entries[0].checksum)
+
+
+def test_file_store_duplicated_contents(service, server, project, tmp_path):
+    import stat
+
+    compendium_context = service.project(project).compendium
+
+    files = {}
+    for filename in ["a.txt", "b.txt", "c/a.txt"]:
+        file_path = tmp_path / "inputs" / filename.replace("/", "-")
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_text("duplicated data")
+        files[filename] = str(file_path)
+
+    draft = compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+    draft = compendium_context.files.upload_files(
+        draft, files, define_files=True, commit_files=True
+    )
+
+    # the concurrent downloads of the same content are deduplicated.
+    requests = len(server.requests)
+    output_directory = compendium_context.files.download_files(
+        draft, tmp_path / "output", store=FileStore(tmp_path / "store")
+    )
+
+    content_downloads = [
+        r
+        for r in server.requests[requests:]
+        if r[0] == "GET" and r[1].endswith("/content")
+    ]
+    assert len(content_downloads) == 1
+
+    for filename in files:
+        assert (output_directory / filename).read_text() == "duplicated data"
+
+    # writable stores don't materialize the files as (read-only) hardlinks.
+    output_directory = compendium_context.files.download_files(
+        draft,
+        tmp_path / "writable",
+        store=FileStore(tmp_path / "store", writable=True),
+    )
+    for filename in files:
+        file_mode = (output_directory / filename).stat().st_mode
+        assert file_mode & stat.S_IWUSR
+
+
+def test_search_export(service, server, project, tmp_path):
+    project_context = service.project(project)
+
+    for idx in range(25):
+        project_context.execution.create(
+            ExecutionJob(workflow_id=f"workflow-{idx}", service="runner")
+        )
+
+    # the results are requested page by page.
+    assert len(list(project_context.execution.scan(page_size=10))) == 25
+    search_request = ("GET", f"/projects/{project.id}/executions")
+    assert server.requests.count(search_request) == 3
+
+    output = tmp_path / "executions.ndjson"
+    assert project_context.execution.export(output, page_size=10) == 25
+
+    rows = [json.loads(line) for line in output.read_text().splitlines()]
+    assert rows[0]["status"] == "created"
+    assert set(rows[0]) == set(DEFAULT_COLUMNS)
+
+    compendium_context = project_context.compendium
+    compendium_context.draft.publish(
+        compendium_context.draft.create(CompendiumDraft(metadata={"title": "A"}))
+    )
+
+    output = tmp_path / "compendia.ndjson"
+    assert compendium_context.search.export(output) == 1
+
+    row = json.loads(output.read_text())
+    assert (row["title"], row["status"], row["files_count"]) == ("A", "published", 0)
+
+
+def test_search_export_parquet(service, project, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    project_context = service.project(project)
+    for idx in range(5):
+        project_context.execution.create(ExecutionJob(workflow_id=f"w-{idx}"))
+
+    output = tmp_path / "executions.parquet"
+    project_context.execution.export(output, "parquet", page_size=2)
+
+    assert pq.read_table(output).num_rows == 5
+
+
+def test_parquet_export_schema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    from storm_client.export import to_parquet
+
+    # the first batch doesn't have values for ``size`` (and ``tags``).
+    documents = [{"id": f"r-{idx}", "size": None} for idx in range(4)] + [
+        {"id": f"r-{idx}", "size": idx, "tags": {"a": idx}} for idx in range(4, 8)
+    ]
+    columns = {"id": "id", "size": "size", "tags": "tags"}
+
+    output = tmp_path / "records.parquet"
+    assert to_parquet(documents, output, columns, batch_size=2) == 8
+
+    table = pq.read_table(output)
+    assert table.schema.field("size").type == pa.int64()
+    assert table.column("size").to_pylist() == [None] * 4 + [4, 5, 6, 7]
+    assert table.column("tags").to_pylist()[-1] == {"a": 7}
+
+    # values that don't match the schema fail without a partial output.
+    documents.append({"id": "r-8", "size": "large"})
+    with pytest.raises(ValueError, match="schema"):
+        to_parquet(documents, tmp_path / "failed.parquet", columns, batch_size=2)
+
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_list_columns(service, project):
+    project_context = service.project(project)
+
+    for status in ["created", "created", "running"]:
+        job = project_context.execution.create(ExecutionJob(workflow_id="workflow"))
+        if status == "running":
+            project_context.execution.start_job(job)
+
+    jobs = project_context.execution.search()
+    columns = jobs.to_columns({"id": "id", "status": "status", "missing": "a.b"})
+
+    assert sorted(columns["status"]) == ["created", "created", "finished"]
+    assert columns["missing"] == [None] * 3
+    assert jobs.to_columns(["links.self"])["links.self"][0].startswith("http")
+
+    pd = pytest.importorskip("pandas")
+    frame = jobs.to_frame(["status"])
+
+    assert isinstance(frame, pd.DataFrame)
+    assert frame.groupby("status").size().to_dict() == {"created": 2, "finished": 1}